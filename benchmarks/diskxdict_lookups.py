@@ -0,0 +1,43 @@
+# DISKXDICT LOOKUPS BENCHMARK ##############
+#
+# Build a DiskXdict from an Xiter of pairs, then measure random lookups with a cold and a warm LRU cache.
+# Run from the root of the repo : `python -m benchmarks.diskxdict_lookups [size] [cache_size]`
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from xfp import DiskXdict, Xiter
+
+size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+cache_size = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+
+path = os.path.join(tempfile.mkdtemp(), "catalogue.db")
+start = time.perf_counter()
+catalogue = DiskXdict.build(
+    path,
+    Xiter(range(size)).map(lambda ean: (ean, f"product {ean}")),
+    cache_size=cache_size,
+)
+print(f"build {size} keys          {time.perf_counter() - start:>8.3f}s")
+
+random.seed(0)
+hot_keys = [random.randrange(size) for _ in range(cache_size)]
+cold_keys = [random.randrange(size) for _ in range(100_000)]
+
+start = time.perf_counter()
+for key in cold_keys:
+    catalogue.get(key)
+print(f"100000 cold lookups        {time.perf_counter() - start:>8.3f}s")
+
+for key in hot_keys:
+    catalogue.get(key)
+start = time.perf_counter()
+for i in range(100_000):
+    catalogue.get(hot_keys[i % cache_size])
+print(f"100000 cached lookups      {time.perf_counter() - start:>8.3f}s")
+
+catalogue.close()
+os.remove(path)
@@ -0,0 +1,44 @@
+# XDICT LOOKUPS BENCHMARK ##############
+#
+# Track the lookup throughput of Xdict against the size of the dict, compared with a plain dict.
+# Lookups are expected to stay constant-time : the throughput should not drop as the size grows.
+# Run from the root of the repo : `python -m benchmarks.xdict_lookups [max_size]`
+
+import random
+import sys
+import time
+from typing import Any, Callable
+
+from xfp import Xdict
+
+
+def throughput(f: Callable[[Any], Any], keys: list[Any]) -> float:
+    start = time.perf_counter()
+    for key in keys:
+        f(key)
+    return len(keys) / (time.perf_counter() - start)
+
+
+max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+nb_lookups = 100_000
+sizes = [10**i for i in range(1, len(str(max_size)))]
+
+print(f"{'size':>10} {'operation':<12} {'dict (M/s)':>12} {'Xdict (M/s)':>12}")
+for size in sizes:
+    data = {f"key{i}": i for i in range(size)}
+    xdict = Xdict(data)
+    # half of the looked up keys are missing
+    keys = [f"key{random.randrange(2 * size)}" for _ in range(nb_lookups)]
+    present = [key for key in keys if key in data]
+    operations: list[
+        tuple[str, Callable[[Any], Any], Callable[[Any], Any], list[Any]]
+    ] = [
+        ("in", data.__contains__, xdict.__contains__, keys),
+        ("[]", data.__getitem__, xdict.__getitem__, present),
+        ("get", data.__getitem__, xdict.get, present),
+        ("get default", lambda k: data.get(k, 0), lambda k: xdict.get(k, 0), keys),
+    ]
+    for name, on_dict, on_xdict, looked_up in operations:
+        print(
+            f"{size:>10} {name:<12} {throughput(on_dict, looked_up) / 1e6:>12.2f} {throughput(on_xdict, looked_up) / 1e6:>12.2f}"
+        )
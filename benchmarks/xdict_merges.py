@@ -0,0 +1,41 @@
+# XDICT MERGES BENCHMARK ##############
+#
+# Merge per-shard word counts, as produced by a map-reduce job, compared with a plain dict loop.
+# Run from the root of the repo : `python -m benchmarks.xdict_merges [nb_shards] [shard_size] [workers]`
+
+import operator
+import random
+import sys
+import time
+
+from xfp import Xdict
+
+nb_shards = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+shard_size = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+workers = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+random.seed(0)
+vocabulary = [f"word{i}" for i in range(shard_size * 10)]
+shards = [
+    Xdict(
+        {word: random.randint(1, 100) for word in random.sample(vocabulary, shard_size)}
+    )
+    for _ in range(nb_shards)
+]
+
+start = time.perf_counter()
+counts: dict[str, int] = {}
+for shard in shards:
+    for word, count in shard:
+        counts[word] = counts.get(word, 0) + count
+print(f"dict loop                  {time.perf_counter() - start:>8.3f}s")
+
+start = time.perf_counter()
+merged = Xdict.merge_all(shards, operator.add)
+print(f"merge_all                  {time.perf_counter() - start:>8.3f}s")
+
+start = time.perf_counter()
+Xdict.merge_all(shards, operator.add, workers=workers)
+print(f"merge_all ({workers} workers)      {time.perf_counter() - start:>8.3f}s")
+
+assert merged == Xdict(counts)
@@ -0,0 +1,36 @@
+# XDICT TRANSFORMATIONS BENCHMARK ##############
+#
+# Measure a map/filter chain over a big Xdict, compared with the equivalent dict comprehension.
+# Each transformation is a single dict comprehension over the Xdict : it should stay close to the plain one.
+# The chain fused through the lazy Xiter of items() makes a single pass, without the intermediate Xdict.
+# Run from the root of the repo : `python -m benchmarks.xdict_transformations [size]`
+
+import sys
+import time
+
+from xfp import Xdict
+
+size = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+
+raw = {i: i for i in range(size)}
+xdict = Xdict(raw)
+
+start = time.perf_counter()
+{key: value * 2 for key, value in raw.items() if value * 2 % 3 != 0}
+print(f"dict comprehension        {time.perf_counter() - start:>8.3f}s")
+
+start = time.perf_counter()
+xdict.map_values(lambda x: x * 2)
+print(f"Xdict map_values          {time.perf_counter() - start:>8.3f}s")
+
+start = time.perf_counter()
+xdict.map_values(lambda x: x * 2).filter_values(lambda x: x % 3 != 0)
+print(f"Xdict map + filter chain  {time.perf_counter() - start:>8.3f}s")
+
+start = time.perf_counter()
+Xdict.from_list(
+    xdict.items()
+    .map(lambda item: (item[0], item[1] * 2))
+    .filter(lambda item: item[1] % 3 != 0)
+)
+print(f"fused through items()     {time.perf_counter() - start:>8.3f}s")
@@ -0,0 +1,60 @@
+# XDICT UPDATES BENCHMARK ##############
+#
+# Measure successive Xdict updates, each version being kept alive (config snapshots, state machines).
+# Updated Xdicts share their structure : the memory per kept version should stay small as the size grows.
+# Bulk changes (updated_all, removed_all) are compared to successive updates.
+# Run from the root of the repo : `python -m benchmarks.xdict_updates [size] [nb_versions]`
+
+import sys
+import time
+import tracemalloc
+
+from xfp import Xdict
+
+size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+nb_versions = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+
+base = Xdict({f"key{i}": i for i in range(size)})
+
+start = time.perf_counter()
+first = base.updated("key0", -1)
+print(f"first update (dict to trie)   {time.perf_counter() - start:>8.3f}s")
+
+tracemalloc.start()
+start = time.perf_counter()
+versions = [first]
+for i in range(nb_versions):
+    versions.append(
+        versions[-1].updated(f"key{i % size}", -i).removed(f"key{(i * 7) % size}")
+    )
+elapsed = time.perf_counter() - start
+_, peak = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+
+print(
+    f"{nb_versions} updated + removed   {elapsed:>8.3f}s ({elapsed / nb_versions * 1e6:.1f}us per version)"
+)
+print(
+    f"memory of the kept versions   {peak / 1e6:>8.1f}MB ({peak / nb_versions / 1e3:.1f}kB per version)"
+)
+
+start = time.perf_counter()
+for i in range(100_000):
+    versions[-1].get(f"key{i % size}", None)
+print(f"100000 lookups on a version   {time.perf_counter() - start:>8.3f}s")
+
+changes = {f"key{i}": -i for i in range(0, size, 10)}
+start = time.perf_counter()
+successive = first
+for key, value in changes.items():
+    successive = successive.updated(key, value)
+successive_elapsed = time.perf_counter() - start
+start = time.perf_counter()
+bulk = first.updated_all(changes)
+bulk_elapsed = time.perf_counter() - start
+print(f"{len(changes)} successive updated   {successive_elapsed:>8.3f}s")
+print(f"{len(changes)} updated_all at once  {bulk_elapsed:>8.3f}s")
+
+start = time.perf_counter()
+first.removed_all(changes.keys())
+print(f"{len(changes)} removed_all at once  {time.perf_counter() - start:>8.3f}s")
@@ -0,0 +1,57 @@
+# XITER FILE SOURCES BENCHMARK ##############
+#
+# Compare the Xiter file constructors against a plain `open()` iteration.
+# Run from the root of the repo : `python -m benchmarks.xiter_file_sources [nb_lines]`
+
+import sys
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from xfp import Xiter
+
+
+def consume(iterable: Iterable[Any]) -> None:
+    deque(iterable, maxlen=0)
+
+
+def bench(name: str, f: Callable[[], Iterable[Any]]) -> None:
+    start = time.perf_counter()
+    consume(f())
+    print(f"{name:<40} {time.perf_counter() - start:>8.3f}s")
+
+
+def plain_open(path: Path) -> Iterable[str]:
+    with open(path) as f:
+        for line in f:
+            yield line
+
+
+nb_lines = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = Path(tmp) / "data.txt"
+    with open(path, "w") as f:
+        for i in range(nb_lines):
+            f.write(f"{i},2024-04-{i % 30 + 1:02},{i * 0.5}\n")
+
+    print(f"{nb_lines} lines, {path.stat().st_size / 1e6:.1f} MB")
+    bench("plain open()", lambda: plain_open(path))
+    bench("Xiter(open())", lambda: Xiter(open(path)))
+    bench("Xiter.from_lines", lambda: Xiter.from_lines(path))
+    bench(
+        "Xiter.from_lines 1MB buffer", lambda: Xiter.from_lines(path, buffer_size=2**20)
+    )
+    bench("Xiter.from_lines raw", lambda: Xiter.from_lines(path, raw=True))
+    bench("Xiter.from_records", lambda: Xiter.from_records(path, buffer_size=2**20))
+    bench(
+        "Xiter.from_records raw",
+        lambda: Xiter.from_records(path, buffer_size=2**20, raw=True),
+    )
+    bench("Xiter.from_records mmap", lambda: Xiter.from_records(path, mmap=True))
+    bench(
+        "Xiter.from_records mmap raw",
+        lambda: Xiter.from_records(path, mmap=True, raw=True),
+    )
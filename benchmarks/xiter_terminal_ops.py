@@ -0,0 +1,60 @@
+# XITER TERMINAL OPERATIONS BENCHMARK ##############
+#
+# Compare the single pass terminal operations of Xiter against their former tee-based implementations.
+# Run from the root of the repo : `python -m benchmarks.xiter_terminal_ops [nb_elements]`
+# The default 100M elements stream takes a few minutes, and the former `reduce` buffers the whole stream.
+
+import operator
+import sys
+import time
+from typing import Any, Callable
+
+from xfp import Xiter
+
+
+def former_reduce(xiter: Xiter[int], f: Callable[[int, int], int]) -> int:
+    h = xiter.head()
+    acc = h
+    for e in xiter.tail():
+        acc = f(acc, e)
+    return acc
+
+
+def former_fold(xiter: Xiter[int], zero: int, f: Callable[[int, int], int]) -> int:
+    acc = zero
+    for e in xiter:
+        acc = f(acc, e)
+    return acc
+
+
+def former_foreach(xiter: Xiter[int], statement: Callable[[int], Any]) -> None:
+    [statement(e) for e in xiter.copy()]
+
+
+def bench(name: str, f: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    f()
+    print(f"{name:<40} {time.perf_counter() - start:>8.3f}s")
+
+
+def noop(_: int) -> None:
+    return None
+
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000_000
+print(f"{n} elements")
+
+bench(
+    "former reduce (head + tail)", lambda: former_reduce(Xiter(range(n)), operator.add)
+)
+bench("reduce", lambda: Xiter(range(n)).reduce(operator.add))
+bench(
+    "former fold (python loop)", lambda: former_fold(Xiter(range(n)), 0, operator.add)
+)
+bench("fold", lambda: Xiter(range(n)).fold(0, operator.add))
+bench("former min (key=id)", lambda: min(Xiter(range(n)), key=id))
+bench("min", lambda: Xiter(range(n)).min())
+bench("former max (key=id)", lambda: max(Xiter(range(n)), key=id))
+bench("max", lambda: Xiter(range(n)).max())
+bench("former foreach (list of results)", lambda: former_foreach(Xiter(range(n)), noop))
+bench("foreach", lambda: Xiter(range(n)).foreach(noop))
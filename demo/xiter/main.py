@@ -54,7 +54,7 @@ new_sales = (
 )
 
 print("FIRST CONSUMPTION")
-new_sales.foreach(print)
+new_sales.copy().foreach(print)
 
 print("SECOND CONSUMPTION")
 new_sales.foreach(print)
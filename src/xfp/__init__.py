@@ -8,16 +8,23 @@ from xfp.xresult import (
     Xopt,
     Xtry,
 )
-from xfp.xlist import Xlist
+from xfp.xagg import Xagg
+from xfp.xlist import Xlist, XlistTransient
+from xfp.xdict import Xdict, XdictTransient, XdictView
 from xfp.xiter import Xiter
-from xfp.xdict import Xdict
+from xfp.sortedxdict import SortedXdict
+from xfp.diskxdict import DiskXdict
+from xfp.xaiter import Xaiter
+from xfp.xcheckpoint import Xcheckpoint
 
 __all__ = [
     "curry",
     "curry_method",
     "tupled",
     "Xiter",
+    "Xaiter",
     "Xlist",
+    "XlistTransient",
     "Xresult",
     "XRBranch",
     "XresultError",
@@ -25,4 +32,10 @@ __all__ = [
     "Xopt",
     "Xtry",
     "Xdict",
+    "XdictTransient",
+    "XdictView",
+    "SortedXdict",
+    "DiskXdict",
+    "Xagg",
+    "Xcheckpoint",
 ]
@@ -0,0 +1,314 @@
+"""Persistent hash array mapped trie, backing the Xdicts built through successive updates.
+
+Each node indexes its entries with a 32 bits bitmap, consuming 5 bits of the key hash per level.
+Entries are either leaves `(hash, key, value)`, sub-nodes, or collision nodes for keys sharing a full hash.
+Updates copy the path from the root to the modified entry, sharing every other node with the previous version.
+
+Nodes are mutated in place only when they belong to the `owner` token given to the update,
+which lets bulk builds (and transients) avoid the path copies.
+"""
+
+from typing import Any, Iterable, Iterator
+
+_MISSING: Any = object()
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & 0xFFFF_FFFF_FFFF_FFFF
+
+
+class _Node:
+    __slots__ = ("bitmap", "entries", "owner")
+
+    def __init__(self, bitmap: int, entries: list[Any], owner: object | None) -> None:
+        self.bitmap = bitmap
+        self.entries = entries
+        self.owner = owner
+
+
+class _Collision:
+    __slots__ = ("hash", "entries", "owner")
+
+    def __init__(self, hash: int, entries: list[Any], owner: object | None) -> None:
+        self.hash = hash
+        self.entries = entries
+        self.owner = owner
+
+
+def _find(node: Any, h: int, key: Any) -> Any:
+    shift = 0
+    while True:
+        if type(node) is _Collision:
+            if node.hash == h:
+                for leaf in node.entries:
+                    if leaf[1] is key or leaf[1] == key:
+                        return leaf[2]
+            return _MISSING
+        bit = 1 << ((h >> shift) & 31)
+        bitmap = node.bitmap
+        if not bitmap & bit:
+            return _MISSING
+        entry = node.entries[(bitmap & (bit - 1)).bit_count()]
+        if type(entry) is tuple:
+            if entry[0] == h and (entry[1] is key or entry[1] == key):
+                return entry[2]
+            return _MISSING
+        node = entry
+        shift += 5
+
+
+def _merge(leaf1: tuple, leaf2: tuple, shift: int, owner: object | None) -> Any:
+    if leaf1[0] == leaf2[0]:
+        return _Collision(leaf1[0], [leaf1, leaf2], owner)
+    index1 = (leaf1[0] >> shift) & 31
+    index2 = (leaf2[0] >> shift) & 31
+    if index1 == index2:
+        return _Node(1 << index1, [_merge(leaf1, leaf2, shift + 5, owner)], owner)
+    entries = [leaf1, leaf2] if index1 < index2 else [leaf2, leaf1]
+    return _Node((1 << index1) | (1 << index2), entries, owner)
+
+
+def _set(node: Any, shift: int, leaf: tuple, owner: object | None) -> tuple[Any, bool]:
+    "Return the node with the leaf upserted, and whether a new key was added."
+    h, key, value = leaf
+    editable = owner is not None and node.owner is owner
+    if type(node) is _Collision:
+        if node.hash != h:
+            # the leaf only shares the first bits of the hash, nest the collision one level deeper
+            nested = _Node(1 << ((node.hash >> shift) & 31), [node], owner)
+            return _set(nested, shift, leaf, owner)
+        entries = node.entries if editable else node.entries.copy()
+        added = True
+        for i, old in enumerate(entries):
+            if old[1] is key or old[1] == key:
+                if old[2] is value:
+                    return node, False
+                entries[i], added = (h, old[1], value), False
+                break
+        else:
+            entries.append(leaf)
+        return (node if editable else _Collision(h, entries, owner)), added
+    bit = 1 << ((h >> shift) & 31)
+    index = (node.bitmap & (bit - 1)).bit_count()
+    if not node.bitmap & bit:
+        if editable:
+            node.entries.insert(index, leaf)
+            node.bitmap |= bit
+            return node, True
+        entries = node.entries.copy()
+        entries.insert(index, leaf)
+        return _Node(node.bitmap | bit, entries, owner), True
+    entry = node.entries[index]
+    if type(entry) is tuple:
+        if entry[0] == h and (entry[1] is key or entry[1] == key):
+            if entry[2] is value:
+                return node, False
+            new_entry, added = (h, entry[1], value), False
+        else:
+            new_entry, added = _merge(entry, leaf, shift + 5, owner), True
+    else:
+        new_entry, added = _set(entry, shift + 5, leaf, owner)
+        if new_entry is entry:
+            return node, added
+    if editable:
+        node.entries[index] = new_entry
+        return node, added
+    entries = node.entries.copy()
+    entries[index] = new_entry
+    return _Node(node.bitmap, entries, owner), added
+
+
+def _delete(
+    node: Any, shift: int, h: int, key: Any, owner: object | None
+) -> tuple[Any, bool]:
+    """Return the node without the key, and whether the key was found.
+
+    The node returned is the same one if the key is absent, a single leaf if only one remains,
+    or None if the node becomes empty.
+    """
+    editable = owner is not None and node.owner is owner
+    if type(node) is _Collision:
+        if node.hash != h:
+            return node, False
+        for i, leaf in enumerate(node.entries):
+            if leaf[1] is key or leaf[1] == key:
+                if len(node.entries) == 2:
+                    return node.entries[1 - i], True
+                entries = node.entries if editable else node.entries.copy()
+                del entries[i]
+                return (node if editable else _Collision(h, entries, owner)), True
+        return node, False
+    bit = 1 << ((h >> shift) & 31)
+    if not node.bitmap & bit:
+        return node, False
+    index = (node.bitmap & (bit - 1)).bit_count()
+    entry = node.entries[index]
+    if type(entry) is tuple:
+        if not (entry[0] == h and (entry[1] is key or entry[1] == key)):
+            return node, False
+        new_entry = None
+    else:
+        new_entry, removed = _delete(entry, shift + 5, h, key, owner)
+        if not removed:
+            return node, False
+        if (
+            type(new_entry) is _Node
+            and len(new_entry.entries) == 1
+            and type(new_entry.entries[0]) is tuple
+        ):
+            # a sub-node holding a single leaf is replaced by the leaf itself
+            new_entry = new_entry.entries[0]
+    if new_entry is None:
+        if node.bitmap == bit and shift > 0:
+            return None, True
+        entries = node.entries if editable else node.entries.copy()
+        del entries[index]
+        if editable:
+            node.bitmap ^= bit
+            return node, True
+        return _Node(node.bitmap ^ bit, entries, owner), True
+    if editable:
+        node.entries[index] = new_entry
+        return node, True
+    entries = node.entries.copy()
+    entries[index] = new_entry
+    return _Node(node.bitmap, entries, owner), True
+
+
+def _leaves(root: _Node) -> Iterator[tuple]:
+    stack = [iter(root.entries)]
+    while stack:
+        for entry in stack[-1]:
+            if type(entry) is tuple:
+                yield entry
+            else:
+                stack.append(iter(entry.entries))
+                break
+        else:
+            stack.pop()
+
+
+class _Hamt:
+    """Immutable mapping, updated in O(log32 n) with structural sharing between versions.
+
+    Provides the read API of a dict used by Xdict (`[]`, `get`, `in`, `len`, `keys`, `values`, `items`).
+    Iteration follows the hashes of the keys, not their insertion order.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, root: _Node | None = None, size: int = 0) -> None:
+        self._root = _Node(0, [], None) if root is None else root
+        self._size = size
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[Any, Any]]) -> "_Hamt":
+        "Return a new _Hamt built from couples (key, value), the nodes being mutated in place while building."
+        return cls().updated_all(items)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, key: Any) -> Any:
+        value = _find(self._root, _hash(key), key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = _find(self._root, _hash(key), key)
+        return default if value is _MISSING else value
+
+    def __contains__(self, key: Any) -> bool:
+        return _find(self._root, _hash(key), key) is not _MISSING
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.keys()
+
+    def keys(self) -> Iterator[Any]:
+        return (leaf[1] for leaf in _leaves(self._root))
+
+    def values(self) -> Iterator[Any]:
+        return (leaf[2] for leaf in _leaves(self._root))
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        return ((leaf[1], leaf[2]) for leaf in _leaves(self._root))
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def updated(self, key: Any, value: Any) -> "_Hamt":
+        root, added = _set(self._root, 0, (_hash(key), key, value), None)
+        return self if root is self._root else _Hamt(root, self._size + added)
+
+    def removed(self, key: Any) -> "_Hamt":
+        root, removed = _delete(self._root, 0, _hash(key), key, None)
+        return _Hamt(root, self._size - 1) if removed else self
+
+    def updated_all(self, items: Iterable[tuple[Any, Any]]) -> "_Hamt":
+        "Return a new _Hamt with all the couples (key, value) upserted, copying each node at most once."
+        owner = object()
+        root, size = self._root, self._size
+        for key, value in items:
+            root, added = _set(root, 0, (_hash(key), key, value), owner)
+            size += added
+        return self if root is self._root else _Hamt(root, size)
+
+    def removed_all(self, keys: Iterable[Any]) -> "_Hamt":
+        "Return a new _Hamt without the given keys, copying each node at most once. Unhashable keys are ignored."
+        owner = object()
+        root, size = self._root, self._size
+        for key in keys:
+            try:
+                h = _hash(key)
+            except TypeError:
+                continue
+            root, removed = _delete(root, 0, h, key, owner)
+            size -= removed
+        return self if root is self._root else _Hamt(root, size)
+
+
+class _TransientHamt:
+    """Mutable version of a _Hamt, mutating in place the nodes it already copied.
+
+    The nodes of the original _Hamt are copied on their first modification only,
+    `persistent` then returns the result in O(1).
+    """
+
+    __slots__ = ("_root", "_size", "_owner")
+
+    def __init__(self, hamt: _Hamt) -> None:
+        self._root = hamt._root
+        self._size = hamt._size
+        self._owner = object()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, key: Any) -> Any:
+        value = _find(self._root, _hash(key), key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = _find(self._root, _hash(key), key)
+        return default if value is _MISSING else value
+
+    def __contains__(self, key: Any) -> bool:
+        return _find(self._root, _hash(key), key) is not _MISSING
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._root, added = _set(self._root, 0, (_hash(key), key, value), self._owner)
+        self._size += added
+
+    def __delitem__(self, key: Any) -> None:
+        self._root, removed = _delete(self._root, 0, _hash(key), key, self._owner)
+        if not removed:
+            raise KeyError(key)
+        self._size -= 1
+
+    def persistent(self) -> _Hamt:
+        "Return the current content as a _Hamt, further modifications copying the nodes again."
+        self._owner = object()
+        return _Hamt(self._root, self._size)
@@ -0,0 +1,314 @@
+from collections import OrderedDict
+from os import PathLike
+import os
+import pickle
+import sqlite3
+import struct
+from threading import Lock
+from typing import Any, Iterator, cast
+from collections.abc import Iterable as ABCIterable
+
+from xfp import Xdict, Xiter, Xresult, Xtry
+from xfp._hamt import _MISSING
+from xfp.functions import F1
+from xfp.xdict import ABCDict, XdictView
+
+_LENGTH = struct.Struct(">I")
+
+
+def _encode(obj: Any) -> bytes:
+    return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _encode_key(key: Any) -> bytes:
+    """Return the canonical encoding of a key, equal keys (eg. 1, 1.0 and True) sharing the same encoding.
+
+    ### Raises
+
+    - TypeError : if the key is not None, a bool, an int, a float, a str, bytes or a tuple of them
+    """
+    match key:
+        case None:
+            return b"n"
+        case int():
+            return b"i" + str(int(key)).encode()
+        case float() if key.is_integer():
+            return b"i" + str(int(key)).encode()
+        case float():
+            return b"f" + repr(key).encode()
+        case str():
+            return b"s" + key.encode("utf-8", "surrogatepass")
+        case bytes():
+            return b"b" + key
+        case tuple():
+            # each element is prefixed by its length, so that nested tuples can not be confused
+            return b"t" + b"".join(
+                _LENGTH.pack(len(encoded)) + encoded
+                for encoded in map(_encode_key, key)
+            )
+        case _:
+            raise TypeError(f"<DiskXdict> unsupported key type : {type(key).__name__}")
+
+
+class DiskXdict[Y, X]:
+    """Immutable dict stored in a local sqlite file, for mappings larger than the memory.
+
+    Provides the read API of Xdict : lookups (`[]`, `get`, `get_fr`, `in`) are done through
+    the primary key index of the file, the most recently read values being kept in a bounded LRU cache.
+    Iteration streams the couples (key, value) from the file, in the order of the encoded keys.
+
+    Keys are matched through a canonical encoding, as in a dict (1, 1.0 and True are the same key) :
+    they must be None, bool, int, float, str, bytes or tuples of them. Values are pickled.
+
+    ### Usage
+
+    ```python
+        from xfp import DiskXdict, Xiter
+
+        catalogue = DiskXdict.build(
+            "/tmp/catalogue.db",
+            Xiter.from_csv("catalogue.csv").map(lambda row: (int(row["ean"]), row["label"])),
+        )
+        with catalogue:
+            print(catalogue.get(3017620422003, "unknown product"))
+    ```
+    """
+
+    @classmethod
+    def build(
+        cls,
+        path: str | PathLike,
+        pairs: ABCIterable[tuple[Y, X]],
+        batch_size: int = 10_000,
+        cache_size: int = 10_000,
+    ) -> "DiskXdict[Y, X]":
+        """Return a new DiskXdict, writing the couples (key, value) of pairs to a new file at path.
+
+        The couples are written by batches, in a single transaction.
+        In case of key duplication, the last associated value is kept.
+
+        ### Keyword Arguments
+
+        - path               -- local file to create, replaced if it already exists
+        - pairs              -- couples (key, value), usually an Xiter streaming them
+        - batch_size (=10000) -- number of couples written at once
+        - cache_size (=10000) -- number of values kept in memory by the returned DiskXdict
+
+        ### Raises
+
+        - ValueError : if batch_size is lower than 1
+        - TypeError  : if a key is not None, a bool, an int, a float, a str, bytes or a tuple of them
+        """
+        if batch_size < 1:
+            raise ValueError(f"<build> batch_size must be at least 1, got {batch_size}")
+        if os.path.exists(path):
+            os.remove(path)
+        connection = sqlite3.connect(path)
+        try:
+            with connection:
+                connection.execute(
+                    # the canonical key is indexed, the original one is kept for iteration
+                    "CREATE TABLE xdict (key BLOB PRIMARY KEY, original BLOB, value BLOB) WITHOUT ROWID"
+                )
+                batch = []
+                for key, value in pairs:
+                    batch.append((_encode_key(key), _encode(key), _encode(value)))
+                    if len(batch) >= batch_size:
+                        connection.executemany(
+                            "INSERT OR REPLACE INTO xdict VALUES (?, ?, ?)", batch
+                        )
+                        batch = []
+                connection.executemany(
+                    "INSERT OR REPLACE INTO xdict VALUES (?, ?, ?)", batch
+                )
+        finally:
+            connection.close()
+        return cls(path, cache_size)
+
+    def __init__(self, path: str | PathLike, cache_size: int = 10_000) -> None:
+        """Open the DiskXdict stored at path, read-only.
+
+        ### Keyword Arguments
+
+        - path               -- local file written by `DiskXdict.build`
+        - cache_size (=10000) -- number of values kept in memory, the least recently read being evicted first
+
+        ### Raises
+
+        - FileNotFoundError : if the file doesn't exist
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"<DiskXdict> no such file : {path}")
+        self.__connection = sqlite3.connect(
+            f"file:{os.fspath(path)}?mode=ro", uri=True, check_same_thread=False
+        )
+        self.__cache: OrderedDict[bytes, Any] = OrderedDict()
+        self.__cache_size = cache_size
+        self.__lock = Lock()
+        self.__length: int | None = None
+
+    def __enter__(self) -> "DiskXdict[Y, X]":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying file, the DiskXdict can not be read anymore."""
+        self.__connection.close()
+        self.__cache.clear()
+
+    def __lookup(self, key: Any) -> Any:
+        """Return the value associated with the key, or _MISSING, going through the LRU cache."""
+        try:
+            encoded = _encode_key(key)
+        except TypeError:  # unsupported keys are never present
+            return _MISSING
+        with self.__lock:
+            cache = self.__cache
+            value = cache.get(encoded, _MISSING)
+            if value is not _MISSING or encoded in cache:
+                cache.move_to_end(encoded)
+                return value
+            row = self.__connection.execute(
+                "SELECT value FROM xdict WHERE key = ?", (encoded,)
+            ).fetchone()
+            value = _MISSING if row is None else pickle.loads(row[0])
+            if self.__cache_size > 0:
+                cache[encoded] = value
+                if len(cache) > self.__cache_size:
+                    cache.popitem(last=False)
+            return value
+
+    def __rows(self, columns: str) -> Iterator[Any]:
+        # a dedicated cursor per iteration, streaming the rows instead of fetching them all
+        yield from self.__connection.execute(f"SELECT {columns} FROM xdict")
+
+    def __iter__(self) -> Iterator[tuple[Y, X]]:
+        """Return an iterator over the couples (key, value), streamed from the file."""
+        return (
+            (pickle.loads(key), pickle.loads(value))
+            for key, value in self.__rows("original, value")
+        )
+
+    def __len__(self) -> int:
+        """Return the number of keys, counted once then cached."""
+        if self.__length is None:
+            self.__length = self.__connection.execute(
+                "SELECT COUNT(*) FROM xdict"
+            ).fetchone()[0]
+        return self.__length
+
+    def __eq__(self, other: object) -> bool:
+        """Return the equality by comparison of inner values (unordered)."""
+        match other:
+            case ABCDict():
+                if len(self) != len(other):
+                    return False
+                for key, value in self:
+                    found = other.get(key, _MISSING)
+                    if not (found is value or found == value):
+                        return False
+                return True
+            case _:
+                return False
+
+    def __repr__(self) -> str:
+        """Return the representation of the DiskXdict, without reading its content."""
+        return f"DiskXdict(<{len(self)} keys>)"
+
+    def __contains__(self, key: Any) -> bool:
+        """Return True if the key is in the DiskXdict."""
+        return self.__lookup(key) is not _MISSING
+
+    def __getitem__(self, key: Y) -> X:
+        """Alias for get(key).
+
+        Exists to enable [] syntax
+
+        ### Raises
+
+        - IndexError : if the key is not found in the DiskXdict
+        """
+        value = self.__lookup(key)
+        if value is _MISSING:
+            raise IndexError(f"Key not found in DiskXdict : {key}")
+        return value
+
+    def get(self, key: Y, default: Any = None) -> Any:
+        """Return the value associated with a given key, or default if not found."""
+        value = self.__lookup(key)
+        return default if value is _MISSING else value
+
+    def get_fr(self, key: Y) -> Xresult[IndexError, X]:
+        """Return the value associated with a given key, wrapped in an Xtry (see Xdict.get_fr)."""
+        return cast(Xresult[IndexError, X], Xtry.from_unsafe(lambda: self[key]))
+
+    def keys(self) -> XdictView[Y]:
+        """Return a view of the keys, streamed from the file."""
+        return XdictView(
+            lambda: (pickle.loads(key) for (key,) in self.__rows("original")),
+            self.__len__,
+            self.__contains__,
+        )
+
+    def values(self) -> XdictView[X]:
+        """Return a view of the values, streamed from the file.
+
+        Unlike keys, membership in values is tested by reading the whole file.
+        """
+        return XdictView(
+            lambda: (pickle.loads(value) for (value,) in self.__rows("value")),
+            self.__len__,
+            lambda x: any(value is x or value == x for _, value in self),
+        )
+
+    def items(self) -> XdictView[tuple[Y, X]]:
+        """Return a view of the couples (key, value), streamed from the file."""
+        return XdictView(self.__iter__, self.__len__, self.__contains_item)
+
+    def __contains_item(self, item: Any) -> bool:
+        match item:
+            case (key, value) if key in self:
+                found = self[key]
+                return found is value or found == value
+            case _:
+                return False
+
+    def map[T, U](self, f: F1[[Y, X], tuple[U, T]]) -> Xiter[tuple[U, T]]:
+        """Return a lazy Xiter of the couples (key, value) transformed through `f`.
+
+        Unlike Xdict, the result is not materialized, since it may not fit in memory :
+        build it with `Xdict.from_list` or `DiskXdict.build` if needed.
+        """
+        return Xiter(self).map(lambda item: f(item[0], item[1]))
+
+    def filter(self, predicate: F1[[Y, X], bool]) -> Xiter[tuple[Y, X]]:
+        """Return a lazy Xiter of the couples (key, value) matching `predicate` (see `map`)."""
+        return Xiter(self).filter(lambda item: predicate(item[0], item[1]))
+
+    def foreach(self, statement: F1[[Y, X], Any]) -> None:
+        """Do the 'statement' procedure once for each couple (key, value), streamed from the file."""
+        for key, value in self:
+            statement(key, value)
+
+    def fold[T](self, zero: T, f: F1[[T, Y, X], T]) -> T:
+        """Return the accumulation of the couples (key, value), streamed from the file, starting from zero.
+
+        ### Usage
+
+        ```python
+            from xfp import DiskXdict
+
+            with DiskXdict.build("/tmp/stock.db", [("apple", 3), ("pear", 4)]) as stock:
+                assert stock.fold(0, lambda acc, _, quantity: acc + quantity) == 7
+        ```
+        """
+        acc = zero
+        for key, value in self:
+            acc = f(acc, key, value)
+        return acc
+
+    def to_Xdict(self) -> Xdict[Y, X]:
+        """Return an Xdict loading every couple (key, value) in memory."""
+        return Xdict(dict(self))
@@ -0,0 +1,398 @@
+from bisect import bisect_left
+from typing import Any, Iterator, cast
+
+from xfp import Xdict, Xiter, Xopt, Xresult, Xtry
+from xfp._hamt import _MISSING
+from xfp.functions import F1
+from xfp.xdict import ABCDict, XdictView
+from collections.abc import Iterable as ABCIterable
+
+_CHUNK_SIZE = 512
+
+
+class SortedXdict[Y, X]:
+    """Immutable dict whose couples (key, value) are ordered by key, enabling range queries.
+
+    Keys must be totally ordered. They are stored in sorted chunks of at most 1024 keys :
+    lookups, `floor`, `ceiling`, `first` and `last` are done in O(log n) by bisection,
+    and iteration follows the order of the keys without any sort.
+    `updated` and `removed` copy the modified chunk and the lists of chunks only,
+    every other chunk being shared with the original SortedXdict : they run in
+    O(log n + n / 512), the lists of chunks being copied pointer by pointer.
+
+    SortedXdict is not an Xdict : it provides `map`, `map_values`, `filter`, `foreach` and `union`,
+    but not the rest of the Xdict API (`to_Xdict` converts it when needed).
+
+    ### Usage
+
+    ```python
+        from xfp import SortedXdict, Xlist, Xopt
+
+        events = SortedXdict({10: "start", 20: "pause", 30: "stop"})
+        assert events.floor(25) == Xopt.Some((20, "pause"))
+        assert events.range(10, 30).to_Xlist() == Xlist([(10, "start"), (20, "pause")])
+        assert events.updated(15, "resume").keys().to_Xlist() == Xlist([10, 15, 20, 30])
+    ```
+    """
+
+    @classmethod
+    def from_list(cls, iterable: ABCIterable[tuple[Y, X]]) -> "SortedXdict[Y, X]":
+        """Return a new SortedXdict built from an iterable of couples (key, value).
+
+        In case of key duplication, the last associated value is kept.
+        """
+        return cls({k: v for k, v in iterable})
+
+    @classmethod
+    def __wrap(
+        cls,
+        keys: list[list[Any]],
+        values: list[list[Any]],
+        maxes: list[Any],
+        size: int,
+    ) -> "SortedXdict[Y, X]":
+        sorted_xdict = cls.__new__(cls)
+        sorted_xdict.__keys = keys
+        sorted_xdict.__values = values
+        sorted_xdict.__maxes = maxes
+        sorted_xdict.__size = size
+        return sorted_xdict
+
+    @classmethod
+    def __from_sorted(cls, items: list[tuple[Any, Any]]) -> "SortedXdict[Y, X]":
+        keys = [
+            [key for key, _ in items[i : i + _CHUNK_SIZE]]
+            for i in range(0, len(items), _CHUNK_SIZE)
+        ]
+        values = [
+            [value for _, value in items[i : i + _CHUNK_SIZE]]
+            for i in range(0, len(items), _CHUNK_SIZE)
+        ]
+        return cls.__wrap(keys, values, [chunk[-1] for chunk in keys], len(items))
+
+    def __init__(self, dic: ABCDict[Y, X]) -> None:
+        """Construct a SortedXdict from a dict-like, sorting its keys.
+
+        ### Raises
+
+        - TypeError : if the keys can not be compared with each other
+        """
+        items = sorted(dic.items(), key=lambda item: cast(Any, item[0]))
+        built: SortedXdict[Y, X] = SortedXdict.__from_sorted(items)
+        self.__keys: list[list[Any]] = built.__keys
+        self.__values: list[list[Any]] = built.__values
+        self.__maxes: list[Any] = built.__maxes
+        self.__size = len(items)
+
+    def __locate(self, key: Any) -> tuple[int, int, bool]:
+        """Return the chunk and the position in the chunk where the key is, or should be inserted.
+
+        The boolean tells if the key was found.
+        """
+        chunk = bisect_left(self.__maxes, key)
+        if chunk == len(self.__maxes):
+            return chunk, 0, False
+        keys = self.__keys[chunk]
+        i = bisect_left(keys, key)
+        return chunk, i, keys[i] == key
+
+    def __iter__(self) -> Iterator[tuple[Y, X]]:
+        """Return an iterator over the couples (key, value), ordered by key."""
+        for keys, values in zip(self.__keys, self.__values):
+            yield from zip(keys, values)
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return self.__size
+
+    def __eq__(self, other: object) -> bool:
+        """Return the equality by comparison of inner values (unordered)."""
+        match other:
+            case ABCDict():
+                if len(self) != len(other):
+                    return False
+                for key, value in self:
+                    found = other.get(key, _MISSING)
+                    if not (found is value or found == value):
+                        return False
+                return True
+            case _:
+                return False
+
+    def __repr__(self) -> str:
+        """Return the representation of the underlying data."""
+        return f"SortedXdict({repr(dict(self))})"
+
+    def __contains__(self, key: Any) -> bool:
+        """Return True if the key is in the SortedXdict, in O(log n)."""
+        try:
+            return self.__locate(key)[2]
+        except TypeError:  # keys not comparable with the stored ones are never present
+            return False
+
+    def __getitem__(self, key: Y) -> X:
+        """Alias for get(key).
+
+        Exists to enable [] syntax
+
+        ### Raises
+
+        - IndexError : if the key is not found in the SortedXdict
+        """
+        try:
+            chunk, i, found = self.__locate(key)
+        except TypeError:
+            found = False
+        if not found:
+            raise IndexError(f"Key not found in SortedXdict : {key}")
+        return self.__values[chunk][i]
+
+    def get(self, key: Y, default: Any = None) -> Any:
+        """Return the value associated with a given key, or default if not found."""
+        try:
+            return self[key]
+        except IndexError:
+            return default
+
+    def get_fr(self, key: Y) -> Xresult[IndexError, X]:
+        """Return the value associated with a given key, wrapped in an Xtry (see Xdict.get_fr)."""
+        return cast(Xresult[IndexError, X], Xtry.from_unsafe(lambda: self[key]))
+
+    def keys(self) -> XdictView[Y]:
+        """Return a view of the keys, ordered, without copying them."""
+        return XdictView(
+            lambda: (key for keys in self.__keys for key in keys),
+            self.__len__,
+            self.__contains__,
+        )
+
+    def values(self) -> XdictView[X]:
+        """Return a view of the values, ordered by key, without copying them.
+
+        Unlike keys, membership in values is tested in O(n).
+        """
+        return XdictView(
+            lambda: (value for values in self.__values for value in values),
+            self.__len__,
+            lambda x: any(value is x or value == x for _, value in self),
+        )
+
+    def items(self) -> XdictView[tuple[Y, X]]:
+        """Return a view of the couples (key, value), ordered by key, without copying them."""
+        return XdictView(self.__iter__, self.__len__, self.__contains_item)
+
+    def __contains_item(self, item: Any) -> bool:
+        match item:
+            case (key, value) if key in self:
+                found = self[key]
+                return found is value or found == value
+            case _:
+                return False
+
+    def first(self) -> Xresult[None, tuple[Y, X]]:
+        """Return the couple (key, value) with the smallest key, wrapped in an Xopt (Xopt.Empty if empty)."""
+        if self.__size == 0:
+            return Xopt.Empty
+        return Xopt.Some((self.__keys[0][0], self.__values[0][0]))
+
+    def last(self) -> Xresult[None, tuple[Y, X]]:
+        """Return the couple (key, value) with the biggest key, wrapped in an Xopt (Xopt.Empty if empty)."""
+        if self.__size == 0:
+            return Xopt.Empty
+        return Xopt.Some((self.__keys[-1][-1], self.__values[-1][-1]))
+
+    def floor(self, key: Y) -> Xresult[None, tuple[Y, X]]:
+        """Return the couple (key, value) with the biggest key lower or equal to the given one, wrapped in an Xopt.
+
+        ### Usage
+
+        ```python
+            from xfp import SortedXdict, Xopt
+
+            assert SortedXdict({1: "a", 3: "c"}).floor(2) == Xopt.Some((1, "a"))
+            assert SortedXdict({1: "a", 3: "c"}).floor(0) == Xopt.Empty
+        ```
+        """
+        chunk, i, found = self.__locate(key)
+        if not found:
+            if i > 0:
+                i -= 1
+            elif chunk > 0:
+                chunk -= 1
+                i = len(self.__keys[chunk]) - 1
+            else:
+                return Xopt.Empty
+        return Xopt.Some((self.__keys[chunk][i], self.__values[chunk][i]))
+
+    def ceiling(self, key: Y) -> Xresult[None, tuple[Y, X]]:
+        """Return the couple (key, value) with the smallest key greater or equal to the given one, wrapped in an Xopt.
+
+        ### Usage
+
+        ```python
+            from xfp import SortedXdict, Xopt
+
+            assert SortedXdict({1: "a", 3: "c"}).ceiling(2) == Xopt.Some((3, "c"))
+            assert SortedXdict({1: "a", 3: "c"}).ceiling(4) == Xopt.Empty
+        ```
+        """
+        chunk, i, _ = self.__locate(key)
+        if chunk == len(self.__keys):
+            return Xopt.Empty
+        return Xopt.Some((self.__keys[chunk][i], self.__values[chunk][i]))
+
+    def range(self, lo: Y | None = None, hi: Y | None = None) -> Xiter[tuple[Y, X]]:
+        """Return a lazy Xiter over the couples (key, value) whose key is in [lo, hi), ordered by key.
+
+        The first couple is found in O(log n), the following ones are read in order.
+        A bound set to None leaves the range open on its side.
+
+        ### Usage
+
+        ```python
+            from xfp import SortedXdict, Xlist
+
+            events = SortedXdict({10: "start", 20: "pause", 30: "stop"})
+            assert events.range(15, 30).to_Xlist() == Xlist([(20, "pause")])
+            assert events.range(lo=20).to_Xlist() == Xlist([(20, "pause"), (30, "stop")])
+        ```
+        """
+        chunk, i = (0, 0) if lo is None else self.__locate(lo)[:2]
+        return Xiter(self.__range(chunk, i, hi))
+
+    def __range(self, chunk: int, i: int, hi: Any) -> Iterator[tuple[Y, X]]:
+        keys, values = self.__keys, self.__values
+        while chunk < len(keys):
+            chunk_keys = keys[chunk]
+            end = len(chunk_keys) if hi is None else bisect_left(chunk_keys, hi)
+            yield from zip(chunk_keys[i:end], values[chunk][i:end])
+            if end < len(chunk_keys):
+                return
+            chunk, i = chunk + 1, 0
+
+    def updated[T](self, key: Y, value: T) -> "SortedXdict[Y, X | T]":
+        """Return a new SortedXdict, with an updated couple (key: Y, value: E).
+
+        Copy the chunk of the key and the lists of chunks, sharing the other chunks with self,
+        in O(log n + n / 512). Replacing the value of an existing key shares the keys as well.
+
+        ### Raises
+
+        - TypeError : if the key can not be compared with the stored ones
+        """
+        chunk, i, found = self.__locate(key)
+        values = list(self.__values)
+        if found:
+            chunk_values = list(values[chunk])
+            chunk_values[i] = value
+            values[chunk] = chunk_values
+            return SortedXdict.__wrap(self.__keys, values, self.__maxes, self.__size)
+        keys, maxes = list(self.__keys), list(self.__maxes)
+        if chunk == len(keys):
+            if chunk == 0:
+                return SortedXdict.__wrap([[key]], [[value]], [key], 1)
+            # the key is bigger than every stored one, it goes at the end of the last chunk
+            chunk -= 1
+            i = len(keys[chunk])
+        chunk_keys, chunk_values = list(keys[chunk]), list(values[chunk])
+        chunk_keys.insert(i, key)
+        chunk_values.insert(i, value)
+        if len(chunk_keys) > 2 * _CHUNK_SIZE:
+            keys[chunk : chunk + 1] = [
+                chunk_keys[:_CHUNK_SIZE],
+                chunk_keys[_CHUNK_SIZE:],
+            ]
+            values[chunk : chunk + 1] = [
+                chunk_values[:_CHUNK_SIZE],
+                chunk_values[_CHUNK_SIZE:],
+            ]
+            maxes[chunk : chunk + 1] = [chunk_keys[_CHUNK_SIZE - 1], chunk_keys[-1]]
+        else:
+            keys[chunk], values[chunk] = chunk_keys, chunk_values
+            maxes[chunk] = chunk_keys[-1]
+        return SortedXdict.__wrap(keys, values, maxes, self.__size + 1)
+
+    def removed(self, key: Y) -> "SortedXdict[Y, X]":
+        """Return a new SortedXdict, with the given key deleted.
+
+        Copy the chunk of the key and the lists of chunks, sharing the other chunks with self,
+        in O(log n + n / 512).
+        No error is raised if the key doesn't exist.
+        """
+        try:
+            chunk, i, found = self.__locate(key)
+        except TypeError:  # keys not comparable with the stored ones are never present
+            return self
+        if not found:
+            return self
+        keys, values = list(self.__keys), list(self.__values)
+        maxes = list(self.__maxes)
+        if len(keys[chunk]) == 1:
+            del keys[chunk], values[chunk], maxes[chunk]
+        else:
+            keys[chunk] = keys[chunk][:i] + keys[chunk][i + 1 :]
+            values[chunk] = values[chunk][:i] + values[chunk][i + 1 :]
+            maxes[chunk] = keys[chunk][-1]
+        return SortedXdict.__wrap(keys, values, maxes, self.__size - 1)
+
+    def union[T](self, other: ABCDict[Y, T]) -> "SortedXdict[Y, X | T]":
+        """Return a new SortedXdict, being the merge of self and a given dict-like.
+
+        If a key is present in both, the `other` one has priority (see Xdict.union).
+        The couples are sorted again, in O((n + m) log(n + m)).
+
+        ### Raises
+
+        - TypeError : if the keys can not be compared with each other
+        """
+        return SortedXdict({**dict(self), **other})
+
+    def map[T, U](self, f: F1[[Y, X], tuple[U, T]]) -> "SortedXdict[U, T]":
+        """Return a new SortedXdict, after transformation of the couples (key, value) through `f`.
+
+        The transformed keys are sorted again (see Xdict.map for key conflicts).
+
+        ### Raises
+
+        - TypeError : if the transformed keys can not be compared with each other
+        """
+        return SortedXdict.from_list(f(key, value) for key, value in self)
+
+    def map_values[T](self, f: F1[[X], T]) -> "SortedXdict[Y, T]":
+        """Return a new SortedXdict, after transformation of the values through `f`.
+
+        The keys are shared with self, without any sort.
+        """
+        return SortedXdict.__wrap(
+            self.__keys,
+            [[f(value) for value in values] for values in self.__values],
+            self.__maxes,
+            self.__size,
+        )
+
+    def filter(self, predicate: F1[[Y, X], bool]) -> "SortedXdict[Y, X]":
+        """Return a new SortedXdict, with the couples not matching the predicate deleted.
+
+        The remaining couples are already ordered, they are not sorted again.
+
+        ### Usage
+
+        ```python
+            from xfp import SortedXdict, Xlist
+
+            events = SortedXdict({10: "start", 20: "pause", 30: "stop"})
+            assert events.filter(lambda y, _: y > 15).keys().to_Xlist() == Xlist([20, 30])
+        ```
+        """
+        return SortedXdict.__from_sorted(
+            [(key, value) for key, value in self if predicate(key, value)]
+        )
+
+    def foreach(self, statement: F1[[Y, X], Any]) -> None:
+        """Do the 'statement' procedure once for each couple (key, value), ordered by key."""
+        for key, value in self:
+            statement(key, value)
+
+    def to_Xdict(self) -> Xdict[Y, X]:
+        """Return an Xdict of the couples (key, value), for hashed lookups."""
+        return Xdict(dict(self))
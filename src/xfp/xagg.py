@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+import operator
+from typing import Any, Iterable
+
+from xfp import Xresult, Xopt
+from xfp.functions import F1
+
+
+def _identity(acc: Any) -> Any:
+    return acc
+
+
+_EMPTY: Any = object()
+
+
+def _min(acc: Any, el: Any) -> Any:
+    return el if acc is _EMPTY or el < acc else acc
+
+
+def _max(acc: Any, el: Any) -> Any:
+    return el if acc is _EMPTY or el > acc else acc
+
+
+def _optional(acc: Any) -> Xresult[None, Any]:
+    return Xopt.Empty if acc is _EMPTY else Xopt.Some(acc)
+
+
+def _mean_step(acc: tuple[int, Any], el: Any) -> tuple[int, Any]:
+    return (acc[0] + 1, acc[1] + el)
+
+
+def _mean(acc: tuple[int, Any]) -> Xresult[None, float]:
+    count, total = acc
+    return Xopt.Empty if count == 0 else Xopt.Some(total / count)
+
+
+def _variance_step(acc: tuple[int, float, float], el: Any) -> tuple[int, float, float]:
+    # Welford's online algorithm, numerically stable in a single pass
+    count, mean, m2 = acc
+    count += 1
+    delta = el - mean
+    mean += delta / count
+    return (count, mean, m2 + delta * (el - mean))
+
+
+@dataclass(frozen=True)
+class Xagg[A, X, R]:
+    """Describe an aggregation, computable in a single pass over a collection.
+
+    An aggregation is a fold (zero, f), followed by a `finish` transformation of the final accumulator.
+    Several aggregations can be computed together in one pass using the `aggregate` method of collections.
+
+    ### Provides
+
+    - built-in aggregations : count, sum, min, max, mean, variance
+    - a constructor for user-defined aggregations
+
+    ### Usage
+
+    ```python
+        from xfp import Xagg, Xiter, Xdict, Xopt
+
+        longest = Xagg("", lambda acc, el: el if len(el) > len(acc) else acc)
+        actual = Xiter(["a", "ccc", "bb"]).aggregate(
+            count=Xagg.count(),
+            longest=longest,
+            min=Xagg.min(),
+        )
+        assert actual == Xdict({"count": 3, "longest": "ccc", "min": Xopt.Some("a")})
+    ```
+    """
+
+    zero: A
+    f: F1[[A, X], A]
+    finish: F1[[A], R] = _identity
+
+    @classmethod
+    def count(cls) -> "Xagg[int, Any, int]":
+        """Return an aggregation counting the elements."""
+        return Xagg(0, lambda acc, _: acc + 1)
+
+    @classmethod
+    def sum(cls) -> "Xagg[Any, Any, Any]":
+        """Return an aggregation summing the elements (0 if there is none)."""
+        return Xagg(0, operator.add)
+
+    @classmethod
+    def min(cls) -> "Xagg[Any, Any, Xresult[None, Any]]":
+        """Return an aggregation of the smallest element, wrapped in an Xopt (Xopt.Empty if there is none)."""
+        return Xagg(_EMPTY, _min, _optional)
+
+    @classmethod
+    def max(cls) -> "Xagg[Any, Any, Xresult[None, Any]]":
+        """Return an aggregation of the biggest element, wrapped in an Xopt (Xopt.Empty if there is none)."""
+        return Xagg(_EMPTY, _max, _optional)
+
+    @classmethod
+    def mean(cls) -> "Xagg[tuple[int, Any], Any, Xresult[None, float]]":
+        """Return an aggregation of the mean of the elements, wrapped in an Xopt (Xopt.Empty if there is none)."""
+        return Xagg((0, 0), _mean_step, _mean)
+
+    @classmethod
+    def variance(
+        cls, ddof: int = 0
+    ) -> "Xagg[tuple[int, float, float], Any, Xresult[None, float]]":
+        """Return an aggregation of the variance of the elements, wrapped in an Xopt.
+
+        Computed in a single pass with Welford's algorithm.
+        The divisor is the number of elements minus `ddof` (delta degrees of freedom) :
+        0 for the population variance, 1 for the sample variance.
+        Xopt.Empty is returned if there is no more elements than `ddof`.
+        """
+
+        def finish(acc: tuple[int, float, float]) -> Xresult[None, float]:
+            count, _, m2 = acc
+            return Xopt.Empty if count <= ddof else Xopt.Some(m2 / (count - ddof))
+
+        return Xagg((0, 0.0, 0.0), _variance_step, finish)
+
+
+def _aggregate(iterable: Iterable[Any], aggregators: dict[str, Xagg]) -> dict[str, Any]:
+    "Internally used to compute several aggregations in a single pass."
+    fs = [agg.f for agg in aggregators.values()]
+    accs = [agg.zero for agg in aggregators.values()]
+    indexes = range(len(fs))
+    for el in iterable:
+        for i in indexes:
+            accs[i] = fs[i](accs[i], el)
+    return {
+        name: agg.finish(acc) for (name, agg), acc in zip(aggregators.items(), accs)
+    }
@@ -0,0 +1,370 @@
+import asyncio
+from collections import deque
+from inspect import isawaitable
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Generic,
+    Iterable,
+    Iterator,
+    TypeVar,
+    cast,
+    overload,
+)
+from collections.abc import (
+    AsyncIterable as ABCAsyncIterable,
+    Iterable as ABCIterable,
+)
+
+from xfp import Xiter, Xlist
+from xfp.functions import F1
+
+X = TypeVar("X", covariant=True)
+
+# functions given to Xaiter can either be regular ones or coroutine functions
+type _MaybeAwaitable[T] = T | Awaitable[T]
+
+
+async def _resolve[T](value: _MaybeAwaitable[T]) -> T:
+    if isawaitable(value):
+        return await value
+    return cast(T, value)
+
+
+async def _from_iterable[T](iterable: Iterable[T]) -> AsyncIterator[T]:
+    for el in iterable:
+        yield el
+
+
+def _to_async_iterator[T](iterable: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    match iterable:
+        case ABCAsyncIterable():
+            return aiter(iterable)
+        case ABCIterable():
+            return _from_iterable(iterable)
+        case _:
+            raise TypeError("Xaiter must be constructed from an iterable")
+
+
+class Xaiter(Generic[X]):
+    """Enhance async iterators (lazy) with functional behaviors.
+
+    This class is the asynchronous sibling of Xiter : it wraps an async iterable
+    (async generators, async streams, ...) and provides the same declarative API.
+    Functions given to the transformations can either be regular functions or
+    coroutine functions, the latter being awaited.
+
+    Contrary to Xiter, an Xaiter can not be tee-ed : each transformation consumes
+    the Xaiter it is called on.
+
+    ### Features
+
+    - Monadic behavior
+    - Concurrent mapping of coroutine functions
+    - Conversions from and to Xiter
+    """
+
+    def __init__(self, iterable: Iterable[X] | AsyncIterable[X]) -> None:
+        """Construct an Xaiter from an iterable or an async iterable.
+
+        Regular iterables (including Xiter) are iterated on the event loop thread,
+        meaning a slow synchronous source blocks the loop while producing.
+        """
+        self.__aiter: AsyncIterator = _to_async_iterator(iterable)
+
+    def __aiter__(self) -> AsyncIterator[X]:
+        """Return an async iterator over the underlying data."""
+        return self.__aiter
+
+    async def __anext__(self) -> X:
+        """Return the next element of the async iterator.
+
+        Consume this element in the data structure.
+        """
+        return await anext(self.__aiter)
+
+    def __repr__(self) -> str:
+        """Return the representation of the underlying data"""
+        return repr(self.__aiter)
+
+    @overload
+    def map[T](self, f: F1[[X], Awaitable[T]], concurrency: int = 1) -> "Xaiter[T]": ...
+
+    @overload
+    def map[T](self, f: F1[[X], T], concurrency: int = 1) -> "Xaiter[T]": ...
+
+    def map(self, f: F1[[X], Any], concurrency: int = 1) -> "Xaiter[Any]":
+        """Return a new async iterator, with f applied to each future element.
+
+        If f returns an awaitable (coroutine function), it is awaited.
+        With a concurrency greater than one, up to `concurrency` calls of f are
+        awaited at the same time. Elements are yielded in the order of the source.
+
+        ### Raise
+
+        - ValueError -- if concurrency is lower than 1
+
+        ### Usage
+
+        ```python
+            import asyncio
+            from xfp import Xaiter, Xlist
+
+            async def fetch(i: int) -> int:
+                await asyncio.sleep(0.1)
+                return i * 2
+
+            async def main():
+                result = Xaiter(range(100)).map(fetch, concurrency=100)
+                assert await result.to_Xlist() == Xlist(range(0, 200, 2)) # ~0.1s, not ~10s
+
+            asyncio.run(main())
+        ```
+        """
+        if concurrency < 1:
+            raise ValueError(f"<map> concurrency must be at least 1, got {concurrency}")
+
+        async def sequential(ait: AsyncIterator[X]) -> AsyncIterator[Any]:
+            async for el in ait:
+                yield await _resolve(f(el))
+
+        async def concurrent(ait: AsyncIterator[X]) -> AsyncIterator[Any]:
+            pending: deque[asyncio.Future[Any]] = deque()
+            try:
+                async for el in ait:
+                    pending.append(asyncio.ensure_future(_resolve(f(el))))
+                    if len(pending) >= concurrency:
+                        yield await pending.popleft()
+                while pending:
+                    yield await pending.popleft()
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        match concurrency:
+            case 1:
+                return Xaiter(sequential(self.__aiter))
+            case _:
+                return Xaiter(concurrent(self.__aiter))
+
+    def filter(self, predicate: F1[[X], _MaybeAwaitable[bool]]) -> "Xaiter[X]":
+        """Return a new async iterator skipping the elements with predicate = False.
+
+        If predicate returns an awaitable (coroutine function), it is awaited.
+
+        ### Usage
+
+        ```python
+            from xfp import Xaiter
+
+            input = Xaiter(range(1,5))
+            predicate = lambda el: el % 2 == 0
+            r1 = input.filter(predicate)
+            # keep only even numbers
+            assert await anext(r1) == 2
+            assert await anext(r1) == 4
+        ```
+        """
+
+        async def result(ait: AsyncIterator[X]) -> AsyncIterator[X]:
+            async for el in ait:
+                if await _resolve(predicate(el)):
+                    yield el
+
+        return Xaiter(result(self.__aiter))
+
+    def flatten[XS](
+        self: "Xaiter[Iterable[XS] | AsyncIterable[XS]]",
+    ) -> "Xaiter[XS]":
+        """Return a new async iterator, with each element nested iterated on individually.
+
+        Nested elements can either be iterables or async iterables.
+
+        ## Usage
+
+        ```python
+            from xfp import Xaiter
+
+            # Both resulting objects are equivalent to Xaiter([1,2,3])
+            Xaiter([[1, 2], [3]]).flatten()
+            Xaiter([Xaiter([1, 2]), [3]]).flatten()
+        ```
+        """
+
+        async def result(ait: AsyncIterator) -> AsyncIterator[XS]:
+            async for el in ait:
+                async for inner_el in _to_async_iterator(el):
+                    yield inner_el
+
+        return Xaiter(result(self.__aiter))
+
+    def flat_map[T](
+        self, f: F1[[X], _MaybeAwaitable[Iterable[T] | AsyncIterable[T]]]
+    ) -> "Xaiter[T]":
+        """Return the result of map and then flatten.
+
+        Exists as homogenisation with Xiter.flat_map.
+
+        ### Usage
+
+        ```python
+            from xfp import Xaiter
+
+            Xaiter([1, 2, 3]).flat_map(lambda x: [(x, 4), (x, 5)])
+            # equivalent to Xaiter([(1, 4), (1, 5), (2, 4), (2, 5), (3, 4), (3, 5)])
+        ```
+        """
+        return cast(Xaiter[Iterable[T] | AsyncIterable[T]], self.map(f)).flatten()
+
+    def take(self, n: int) -> "Xaiter[X]":
+        """Return a new async iterator limited to the first 'n' elements.
+        Return an empty Xaiter if n is negative.
+
+        The source is not pulled further than the 'n'-th element.
+        """
+
+        async def result(ait: AsyncIterator[X]) -> AsyncIterator[X]:
+            if n <= 0:
+                return
+            taken = 0
+            async for el in ait:
+                yield el
+                taken += 1
+                if taken >= n:
+                    return
+
+        return Xaiter(result(self.__aiter))
+
+    def takewhile(self, predicate: F1[[X], _MaybeAwaitable[bool]]) -> "Xaiter[X]":
+        """Return a new async iterator that stops yielding elements when predicate = False.
+
+        If predicate returns an awaitable (coroutine function), it is awaited.
+        Useful to limit an infinite Xaiter with a predicate.
+        """
+
+        async def result(ait: AsyncIterator[X]) -> AsyncIterator[X]:
+            async for el in ait:
+                if not await _resolve(predicate(el)):
+                    return
+                yield el
+
+        return Xaiter(result(self.__aiter))
+
+    def chain[T](self, other: Iterable[T] | AsyncIterable[T]) -> "Xaiter[X | T]":
+        """Return an async iterator over self, then over other once self is exhausted.
+
+        Other can either be an iterable or an async iterable.
+        """
+
+        async def result(ait: AsyncIterator[X]) -> AsyncIterator[X | T]:
+            async for el in ait:
+                yield el
+            async for other_el in _to_async_iterator(other):
+                yield other_el
+
+        return Xaiter(result(self.__aiter))
+
+    def zip[T](self, other: Iterable[T] | AsyncIterable[T]) -> "Xaiter[tuple[X, T]]":
+        """Zip this async iterator with another iterable or async iterable.
+
+        Stop as soon as one of them is exhausted.
+        """
+
+        async def result(ait: AsyncIterator[X]) -> AsyncIterator[tuple[X, T]]:
+            other_ait = _to_async_iterator(other)
+            async for el in ait:
+                try:
+                    other_el = await anext(other_ait)
+                except StopAsyncIteration:
+                    return
+                yield (el, other_el)
+
+        return Xaiter(result(self.__aiter))
+
+    async def fold_left[T](self, zero: T, f: F1[[T, X], _MaybeAwaitable[T]]) -> T:
+        """Return the accumulation of the Xaiter elements.
+
+        - Uses a custom accumulator (zero, f) to aggregate the elements of the Xaiter
+        - Initialize the accumulator with the zero value
+        - Then from the first to the last element, compute accumulator(n+1) using f, accumulator(n) and self.data[n], such as:
+          accumulator(n+1) = f(accumulator(n), self.data[n])
+        - Return the last state of the accumulator
+
+        If f returns an awaitable (coroutine function), it is awaited.
+
+        ### Keyword Arguments
+
+        - zero -- initial state of the accumulator
+        - f    -- accumulation function, compute the next state of the accumulator
+
+        ### Warnings
+
+        This function falls in infinite loop in the case of infinite async iterator.
+
+        ### Usage
+
+        ```python
+            from xfp import Xaiter
+
+            assert await Xaiter([1, 2, 3]).fold_left(0, lambda x, y: x + y) == 6
+            assert await Xaiter(["1", "2", "3"]).fold_left("", lambda x, y: x + y) == "123"
+        ```
+        """
+        acc: T = zero
+        async for el in self.__aiter:
+            acc = await _resolve(f(acc, el))
+        return acc
+
+    async def fold[T](self, zero: T, f: F1[[T, X], _MaybeAwaitable[T]]) -> T:
+        """Return the accumulation of the Xaiter elements.
+
+        Shorthand for fold_left
+        """
+        return await self.fold_left(zero, f)
+
+    async def foreach(self, statement: F1[[X], Any]) -> None:
+        """Do the 'statement' procedure once for each element of the async iterator.
+
+        If statement returns an awaitable (coroutine function), it is awaited.
+        """
+        async for el in self.__aiter:
+            await _resolve(statement(el))
+
+    async def to_Xlist(self) -> Xlist[X]:
+        """Return an Xlist being the evaluated version of self."""
+        return Xlist([el async for el in self.__aiter])
+
+    def to_Xiter(self) -> Xiter[X]:
+        """Return an Xiter pulling the elements of self synchronously.
+
+        Each element is awaited on a private event loop, created on the first
+        `next` call and closed on exhaustion.
+
+        ### Warning
+
+        The resulting Xiter can not be consumed from a running event loop.
+        Use `to_Xlist` or `async for` in that case.
+        """
+
+        async def pull(ait: AsyncIterator[X]) -> X:
+            return await anext(ait)
+
+        async def close(ait: AsyncIterator[X]) -> None:
+            aclose = getattr(ait, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        def result(ait: AsyncIterator[X]) -> Iterator[X]:
+            with asyncio.Runner() as runner:
+                try:
+                    while True:
+                        try:
+                            yield runner.run(pull(ait))
+                        except StopAsyncIteration:
+                            return
+                finally:
+                    runner.run(close(ait))
+
+        return Xiter(result(self.__aiter))
@@ -0,0 +1,190 @@
+import itertools
+import os
+from os import PathLike
+import pickle
+from typing import Any, Iterable, Iterator
+
+from xfp import Xiter
+from xfp.functions import F0, F1
+
+
+def _offset_lines(
+    path: str | PathLike, encoding: str, start: int, position: list[int]
+) -> Iterator[str]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        for line in f:
+            # the offset is updated before yielding, so that it points after the line being processed
+            position[0] += len(line)
+            yield line.decode(encoding).removesuffix("\n").removesuffix("\r")
+
+
+def _counted_rows[T](
+    iterable: Iterable[T], start: int, position: list[int]
+) -> Iterator[T]:
+    for el in itertools.islice(iterable, start, None):
+        position[0] += 1
+        yield el
+
+
+class Xcheckpoint:
+    """Make a long running Xiter job resumable, saving its progress to a local file.
+
+    A checkpoint follows one source and one terminal operation (fold or foreach) :
+    every `every` elements processed by the terminal operation, the position in the source
+    and the state of the terminal operation are saved together in the checkpoint file.
+    A new Xcheckpoint on the same file then resumes the job from the last save,
+    without processing again what was already done.
+    The file is removed once the terminal operation completes.
+
+    Sources can either be :
+    - `lines` -- lines of a text file, resumed from the byte offset of the last processed line
+    - `rows`  -- any iterable yielding the same elements on each run, resumed by skipping the processed rows
+    - none    -- the terminal operation then skips the elements it already processed,
+                 meaning the upstream pipeline is evaluated again for them
+
+    ### Warning
+
+    Only `map` and `filter` can be used between the source and the terminal operation,
+    since they never pull elements ahead : the source position then always matches the last processed element.
+    Stateful operations (windows, grouping, ...) must be expressed in the terminal accumulator to be checkpointed.
+
+    ### Usage
+
+    ```python
+        from xfp import Xcheckpoint
+
+        checkpoint = Xcheckpoint("/tmp/nightly.ckpt", every=100_000)
+        total = checkpoint.fold(
+            checkpoint.lines("huge_file.txt").map(parse).filter(is_valid),
+            0,
+            lambda acc, el: acc + el.amount,
+        )
+        # after a crash, running the same code resumes from the last save
+    ```
+    """
+
+    def __init__(self, path: str | PathLike, every: int = 10_000) -> None:
+        """Construct an Xcheckpoint saving to 'path', and load the state of the last save if any.
+
+        ### Keyword Arguments
+
+        - path           -- local file the progress is saved to
+        - every (=10000) -- number of elements processed by the terminal operation between two saves
+
+        ### Raise
+
+        - ValueError -- if every is lower than 1
+        """
+        if every < 1:
+            raise ValueError(f"<Xcheckpoint> every must be at least 1, got {every}")
+        self.__path = path
+        self.__every = every
+        self.__state: dict[str, Any] | None = None
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                self.__state = pickle.load(f)
+        self.__position: F0[Any] | None = None
+
+    def resumed(self) -> bool:
+        """Return True if the checkpoint was loaded from a previous run."""
+        return self.__state is not None
+
+    def lines(self, path: str | PathLike, encoding: str = "utf-8") -> Xiter[str]:
+        """Return an Xiter over the lines of a text file, without line endings, followed by the checkpoint.
+
+        When resuming, the file is read from the byte offset following the last processed line.
+
+        ### Raise
+
+        - ValueError -- if the checkpoint already follows a source
+        """
+        position = [self.__saved("source", 0)]
+        self.__follow(lambda: position[0])
+        return Xiter(_offset_lines(path, encoding, position[0], position))
+
+    def rows[T](self, iterable: Iterable[T]) -> Xiter[T]:
+        """Return an Xiter over the iterable, followed by the checkpoint.
+
+        When resuming, the rows already processed are skipped without being processed,
+        the iterable must therefore yield the same elements on each run.
+
+        ### Raise
+
+        - ValueError -- if the checkpoint already follows a source
+        """
+        position = [self.__saved("source", 0)]
+        self.__follow(lambda: position[0])
+        return Xiter(_counted_rows(iterable, position[0], position))
+
+    def fold[X, T](self, xiter: Iterable[X], zero: T, f: F1[[T, X], T]) -> T:
+        """Return the accumulation of the elements of xiter, saving the accumulator periodically.
+
+        When resuming, the accumulation starts from the saved accumulator instead of zero.
+        The accumulator must be picklable.
+
+        ### Keyword Arguments
+
+        - xiter -- elements to accumulate, usually built from the source of the checkpoint
+        - zero  -- initial state of the accumulator
+        - f     -- accumulation function, compute the next state of the accumulator
+        """
+        acc: T = self.__saved("acc", zero)
+        count: int = self.__saved("count", 0)
+        every = self.__every
+        for el in self.__remaining(xiter, count):
+            acc = f(acc, el)
+            count += 1
+            if count % every == 0:
+                self.__save(count, acc)
+        self.clear()
+        return acc
+
+    def foreach[X](self, xiter: Iterable[X], statement: F1[[X], Any]) -> None:
+        """Do the 'statement' procedure once for each element of xiter, saving the progress periodically.
+
+        When resuming, the statement is not done again for the elements processed before the last save.
+        Elements processed after the last save and before a crash are processed again.
+        """
+        count: int = self.__saved("count", 0)
+        every = self.__every
+        for el in self.__remaining(xiter, count):
+            statement(el)
+            count += 1
+            if count % every == 0:
+                self.__save(count, None)
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove the checkpoint file, the next run starting from scratch."""
+        if os.path.exists(self.__path):
+            os.remove(self.__path)
+        self.__state = None
+
+    def __saved(self, name: str, default: Any) -> Any:
+        if self.__state is None or self.__state[name] is None:
+            return default
+        return self.__state[name]
+
+    def __follow(self, position: F0[Any]) -> None:
+        if self.__position is not None:
+            raise ValueError("<Xcheckpoint> a checkpoint can only follow one source")
+        self.__position = position
+
+    def __remaining[X](self, xiter: Iterable[X], count: int) -> Iterator[X]:
+        if self.__position is None:
+            # without a followed source, the processed elements are skipped here
+            return itertools.islice(xiter, count, None)
+        return iter(xiter)
+
+    def __save(self, count: int, acc: Any) -> None:
+        # the file is replaced atomically, a crash while saving keeps the previous save
+        state = {
+            "source": None if self.__position is None else self.__position(),
+            "count": count,
+            "acc": acc,
+        }
+        tmp_path = f"{os.fspath(self.__path)}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.__path)
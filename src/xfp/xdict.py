@@ -1,17 +1,25 @@
 from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from threading import get_ident
 from typing import (
     Any,
     Iterator,
     Protocol,
+    TYPE_CHECKING,
     cast,
     overload,
     runtime_checkable,
 )
 
-from xfp import Xlist, Xresult, Xtry, tupled
+from xfp import Xlist, Xresult, Xtry
+from xfp._hamt import _MISSING, _Hamt, _TransientHamt
 from collections.abc import Iterable as ABCIterable
 
-from xfp.functions import F1
+from xfp.functions import F0, F1
+
+if TYPE_CHECKING:
+    from xfp import Xiter
 
 
 @runtime_checkable
@@ -28,6 +36,150 @@ class ABCDict[Y, X](Protocol):
     def values(self) -> ABCIterable[X]: ...
     def __contains__(self, key: object, /) -> bool: ...
     def __eq__(self, other: object, /) -> bool: ...
+    def __len__(self) -> int: ...
+
+
+def _combined(
+    base: Any, items: ABCIterable[tuple[Any, Any]], combine: Any, flipped: bool
+) -> Iterator[tuple[Any, Any]]:
+    "Internally used to yield the couples of items, combined with the value of base when the key is in both."
+    for key, value in items:
+        found = base.get(key, _MISSING)
+        if found is _MISSING:
+            yield key, value
+        elif flipped:
+            yield key, combine(value, found)
+        else:
+            yield key, combine(found, value)
+
+
+def _merge_pair(
+    left: "Xdict[Any, Any]", right: "Xdict[Any, Any]", combine: Any
+) -> "Xdict[Any, Any]":
+    "Internally used to merge two Xdicts, as a top-level function for process pools."
+    return left.merge_with(right, combine)
+
+
+class XdictView[X]:
+    """Live read-only view over the keys, values or couples (key, value) of an Xdict.
+
+    Iterates the backing store of the Xdict directly, without copying it.
+    Transformations are lazy and return an Xiter, materialize the view with `to_Xlist`
+    when random access or several passes are needed.
+
+    ### Usage
+
+    ```python
+        from xfp import Xdict, Xlist
+
+        keys = Xdict({"a": 1, "b": 2}).keys()
+        assert len(keys) == 2 and "a" in keys
+        assert keys.map(str.upper).to_Xlist() == Xlist(["A", "B"])
+    ```
+    """
+
+    def __init__(
+        self,
+        iterable: F0[ABCIterable[X]],
+        length: F0[int],
+        contains: F1[[Any], bool],
+    ) -> None:
+        """Construct an XdictView, from functions accessing the backing store of an Xdict."""
+        self.__iterable = iterable
+        self.__length = length
+        self.__contains = contains
+
+    def __iter__(self) -> Iterator[X]:
+        """Return an iterator over the backing store."""
+        return iter(self.__iterable())
+
+    def __len__(self) -> int:
+        """Return the number of elements of the view, in O(1)."""
+        return self.__length()
+
+    def __contains__(self, el: Any) -> bool:
+        """Return True if el is in the view, in O(1) for keys and couples."""
+        return self.__contains(el)
+
+    def __eq__(self, other: object) -> bool:
+        """Return the equality by comparison of inner values (and order)."""
+        match other:
+            case ABCIterable():
+                return [e for e in self] == [e for e in other]
+            case _:
+                return False
+
+    def __repr__(self) -> str:
+        """Return the representation of the viewed elements."""
+        return f"XdictView({repr(list(self))})"
+
+    def to_Xlist(self) -> Xlist[X]:
+        """Return an Xlist copy of the viewed elements."""
+        return Xlist(self)
+
+    def to_Xiter(self) -> "Xiter[X]":
+        """Return an Xiter over the backing store, without copying it."""
+        from xfp import Xiter
+
+        return Xiter(self.__iterable())
+
+    def map[T](self, f: F1[[X], T]) -> "Xiter[T]":
+        """Return a lazy Xiter of the viewed elements transformed through `f`."""
+        return self.to_Xiter().map(f)
+
+    def filter(self, predicate: F1[[X], bool]) -> "Xiter[X]":
+        """Return a lazy Xiter of the viewed elements matching `predicate`."""
+        return self.to_Xiter().filter(predicate)
+
+    def flat_map[T](self, f: F1[[X], ABCIterable[T]]) -> "Xiter[T]":
+        """Return a lazy Xiter of the viewed elements transformed through `f`, then flattened."""
+        return self.to_Xiter().flat_map(f)
+
+    def zip[T](self, other: ABCIterable[T]) -> "Xiter[tuple[X, T]]":
+        """Return a lazy Xiter zipping the viewed elements with `other`."""
+        return self.to_Xiter().zip(other)
+
+    def foreach(self, statement: F1[[X], Any]) -> None:
+        """Do the 'statement' procedure once for each viewed element."""
+        for el in self.__iterable():
+            statement(el)
+
+    def fold[T](self, zero: T, f: F1[[T, X], T]) -> T:
+        """Return the accumulation of the viewed elements, starting from zero (see Xiter.fold)."""
+        return self.to_Xiter().fold(zero, f)
+
+    def reduce(self, f: F1[[X, X], X]) -> X:
+        """Return the accumulation of the viewed elements, starting from the first one (see Xiter.reduce).
+
+        ### Raises
+
+        - IndexError -- if the view is empty
+        """
+        return self.to_Xiter().reduce(f)
+
+    def min(self, key: Any = None) -> X:
+        """Return the smallest viewed element (see Xiter.min).
+
+        ### Raises
+
+        - ValueError -- if the view is empty
+        """
+        return min(cast(ABCIterable[Any], self.__iterable()), key=key)
+
+    def max(self, key: Any = None) -> X:
+        """Return the biggest viewed element (see Xiter.max).
+
+        ### Raises
+
+        - ValueError -- if the view is empty
+        """
+        return max(cast(ABCIterable[Any], self.__iterable()), key=key)
+
+    def sorted(self, key: Any = None, reverse: bool = False) -> Xlist[X]:
+        """Return an Xlist of the viewed elements, sorted (eventually by a custom key)."""
+        return Xlist(
+            sorted(cast(ABCIterable[Any], self.__iterable()), key=key, reverse=reverse)
+        )
 
 
 class Xdict[Y, X]:
@@ -49,16 +201,56 @@ class Xdict[Y, X]:
         """
         return cls({k: v for k, v in iterable})
 
+    @classmethod
+    def __wrap(cls, data: "dict[Y, X] | _Hamt") -> "Xdict[Y, X]":
+        xdict = cls.__new__(cls)
+        xdict.__data = data
+        xdict.__hash = None
+        return xdict
+
+    @classmethod
+    def builder(cls) -> "XdictTransient[Any, Any]":
+        """Return an empty XdictTransient, to build a new Xdict by mutation.
+
+        The result is backed by a plain dict, as an Xdict built from a dict.
+
+        ### Usage
+
+        ```python
+            from xfp import Xdict
+
+            with Xdict.builder() as builder:
+                for i in range(3):
+                    builder[f"key{i}"] = i
+            assert builder.freeze() == Xdict({"key0": 0, "key1": 1, "key2": 2})
+        ```
+        """
+        return XdictTransient({}, Xdict.__wrap)
+
     def __init__(self, dic: ABCDict[Y, X]) -> None:
         """Construct an Xdict from a dict-like.
 
         Dict-like is defined by the existence of the "items" method.
+        An Xdict shares the data of another Xdict, both being immutable.
         """
-        self.__data = dict(dic.items())
+        self.__data: dict[Y, X] | _Hamt = (
+            dic.__data if isinstance(dic, Xdict) else dict(dic.items())
+        )
+        self.__hash: int | None = None
+
+    def __persistent(self) -> _Hamt:
+        """Return the data as a persistent trie, built on the first update of a dict backed Xdict.
+
+        Xdicts are backed by a plain dict, for the fastest reads, until they are updated :
+        the updated versions are then backed by a trie sharing its structure between versions.
+        """
+        if isinstance(self.__data, _Hamt):
+            return self.__data
+        return _Hamt.from_items(self.__data.items())
 
     def __iter__(self) -> Iterator[tuple[Y, X]]:
-        """Return an iterable over the underlying data."""
-        return iter(self.items())
+        """Return an iterator over the couples (key, value) of the underlying data, without copying them."""
+        return iter(self.__data.items())
 
     def __len__(self) -> int:
         """Return the length of the underlying data.
@@ -68,20 +260,57 @@ class Xdict[Y, X]:
         return len(self.__data)
 
     def __eq__(self, other: object) -> bool:
-        """Return the equality by comparison of inner values (unordered)."""
+        """Return the equality by comparison of inner values (unordered).
+
+        Compare the sizes first, then look each key of self up in other, stopping at the first difference.
+        Values don't need to be hashable. Two Xdicts already hashed are known to differ in O(1) if their hashes differ.
+        """
         match other:
+            case Xdict() if self.__data is other.__data:
+                return True
+            case Xdict() if (
+                self.__hash is not None
+                and other.__hash is not None
+                and self.__hash != other.__hash
+            ):
+                return False
             case ABCDict():
-                return set([e for e in self.items()]) == set([e for e in other.items()])
+                if len(self.__data) != len(other):
+                    return False
+                for key, value in self.__data.items():
+                    found = other.get(key, _MISSING)
+                    if not (found is value or found == value):
+                        return False
+                return True
             case _:
                 return False
 
+    def __hash__(self) -> int:
+        """Return the structural hash of the Xdict, independent of the order of the couples.
+
+        Computed on the first call only, then cached since an Xdict is immutable.
+
+        ### Raises
+
+        - TypeError : if a value of the Xdict is unhashable
+        """
+        if self.__hash is None:
+            self.__hash = hash(frozenset(self.__data.items()))
+        return self.__hash
+
     def __repr__(self) -> str:
         """Return the representation of the underlying data"""
         return f"Xdict({repr(self.__data)})"
 
     def __contains__(self, key: Any) -> bool:
-        """Return the presence of the key in the xdict keyset."""
-        return key in self.keys()
+        """Return the presence of the key in the xdict keyset.
+
+        Hashed lookup, in O(1). Unhashable keys are never present.
+        """
+        try:
+            return key in self.__data
+        except TypeError:
+            return False
 
     def __getitem__(self, i: Y) -> X:
         """Alias for get(i).
@@ -92,7 +321,10 @@ class Xdict[Y, X]:
 
         - IndexError : if the key is not found in the Xdict
         """
-        return self.get(i)
+        try:
+            return self.__data[i]
+        except (KeyError, TypeError):
+            raise IndexError(f"Key not found in Xdict : {i}") from None
 
     @overload
     def get(self, y: Y, /) -> X:
@@ -123,13 +355,11 @@ class Xdict[Y, X]:
         - IndexError : if the key is not found in the Xdict and no default is provided
         - AttributeError : if the method is called with an unspecified set of parameters (signature not found in overload)
         """
-        match args:
-            case [y] if y in self.keys():
-                return cast(X, self.__data.get(y))
-            case [y]:
-                raise IndexError(f"Key not found in Xdict : {y}")
-            case [y, default]:
-                return self.__data.get(y, default)
+        match len(args):  # cheaper than a sequence pattern, get being on hot paths
+            case 1:
+                return self[args[0]]
+            case 2:
+                return self.__data.get(*args)
             case _:
                 raise AttributeError("Wrong set of parameters for <get> method")
 
@@ -157,10 +387,36 @@ class Xdict[Y, X]:
         """
         return cast(Xresult[IndexError, X], Xtry.from_unsafe(lambda: self.get(y)))
 
+    def transient(self) -> "XdictTransient[Y, X]":
+        """Return an XdictTransient initialized with the couples of self, to derive a new Xdict by mutation.
+
+        Self is left untouched. The entries of an updated Xdict are shared with the transient,
+        and only copied on their first modification. Others are copied at once, as a plain dict.
+
+        ### Usage
+
+        ```python
+            from xfp import Xdict
+
+            input = Xdict({"a": 1, "b": 2})
+            with input.transient() as t:
+                t["c"] = 3
+                del t["a"]
+            assert t.freeze() == Xdict({"b": 2, "c": 3})
+        ```
+        """
+        match self.__data:
+            case _Hamt():
+                return XdictTransient(_TransientHamt(self.__data), Xdict.__wrap)
+            case _:
+                return XdictTransient(dict(self.__data), Xdict.__wrap)
+
     def updated[T](self, key: Y, value: T) -> "Xdict[Y, X | T]":
         """Return a new Xdict, with an updated couple (key: Y, value: E).
 
-        Upsert a new `value` at `key`.
+        Upsert a new `value` at `key`, in O(log32 n), sharing the unchanged entries with self.
+        The result does not keep the insertion order : like every updated Xdict,
+        it iterates in the arbitrary order of the hashes of its keys.
 
         ### Usage
 
@@ -171,12 +427,13 @@ class Xdict[Y, X]:
             assert Xdict({"a": 1}).updated("a", 2) == Xdict({"a": 2})
         ```
         """
-        return self.union(Xdict({key: value}))
+        return Xdict.__wrap(self.__persistent().updated(key, value))
 
     def removed(self, key: Y) -> "Xdict[Y, X]":
         """Return a new Xdict, with the given key deleted.
 
-        Filter the provided key if found.
+        Filter the provided key if found, in O(log32 n), sharing the other entries with self.
+        As for `updated`, the result iterates in the arbitrary order of the hashes of its keys.
         No error is raised if the key doesn't exist.
 
         ### Usage
@@ -188,13 +445,49 @@ class Xdict[Y, X]:
             assert Xdict({"a": 1}).removed("b") == Xdict({"a": 1})
         ```
         """
-        return self.filter(lambda y, _: y is not key)
+        try:
+            return Xdict.__wrap(self.__persistent().removed(key))
+        except TypeError:  # unhashable keys are never present
+            return self
+
+    def updated_all[T, U](self, mapping: ABCDict[U, T]) -> "Xdict[Y | U, X | T]":
+        """Return a new Xdict, with all the couples (key, value) of `mapping` upserted.
+
+        Equivalent to successive `updated` calls, in a single pass :
+        each node of the underlying trie is copied at most once, whatever the number of changes.
+
+        ### Usage
+
+        ```python
+            from xfp import Xdict
+
+            assert Xdict({"a": 1}).updated_all({"a": 2, "b": 3}) == Xdict({"a": 2, "b": 3})
+        ```
+        """
+        return Xdict.__wrap(self.__persistent().updated_all(mapping.items()))
+
+    def removed_all(self, keys: ABCIterable[Y]) -> "Xdict[Y, X]":
+        """Return a new Xdict, with all the given keys deleted.
+
+        Equivalent to successive `removed` calls, in a single pass :
+        each node of the underlying trie is copied at most once, whatever the number of changes.
+        No error is raised for keys that don't exist.
+
+        ### Usage
+
+        ```python
+            from xfp import Xdict
+
+            assert Xdict({"a": 1, "b": 2, "c": 3}).removed_all(["a", "c", "d"]) == Xdict({"b": 2})
+        ```
+        """
+        return Xdict.__wrap(self.__persistent().removed_all(keys))
 
     def union[T, U](self, other: ABCDict[U, T]) -> "Xdict[Y | U, X | T]":
         """Return a new Xdict, being the merge of self and a given one.
 
-        Works as if multiple updateds are done successively.
-        It means if a key is present in both Xdict, the `other` Xdict has priority.
+        Works as if multiple updateds are done successively, in a single pass (see `updated_all`).
+        It means if a key is present in both Xdict, the `other` Xdict has priority (see `merge_with` to combine them).
 
         ### Usage
 
@@ -204,19 +497,116 @@ class Xdict[Y, X]:
             assert Xdict({"a": 1, "b": 2}).union(Xdict({"a": 3, "c": 4})) == Xdict({"a": 3, "b": 2, "c": 4})
         ```
         """
-        return Xdict.from_list(list(self.items()) + list(other.items()))
+        return self.updated_all(other)
+
+    def merge_with[T](
+        self, other: ABCDict[Y, T], combine: F1[[X, T], X | T]
+    ) -> "Xdict[Y, X | T]":
+        """Return a new Xdict, being the merge of self and a given one, combining the values of common keys.
+
+        The couples of the smaller side are inserted into the bigger one, in O(min(n, m) * log32 max(n, m))
+        for an updated Xdict, whose structure is shared with the result.
+        Whatever the side iterated, `combine` receives the value of self first, and the value of other second.
+
+        ### Usage
+
+        ```python
+            from xfp import Xdict
+
+            counts = Xdict({"a": 1, "b": 2}).merge_with(Xdict({"a": 3, "c": 4}), lambda x, y: x + y)
+            assert counts == Xdict({"a": 4, "b": 2, "c": 4})
+        ```
+        """
+        right = other if isinstance(other, Xdict) else Xdict(other)
+        if len(right) == 0:
+            return cast(Xdict[Y, X | T], self)
+        if len(self) == 0:
+            return right
+        flipped = len(right) > len(self)
+        base, smaller = (right, self) if flipped else (self, right)
+        data = base.__data
+        items = _combined(data, smaller.__data.items(), combine, flipped)
+        match data:
+            case _Hamt():
+                return Xdict.__wrap(data.updated_all(items))
+            case _:
+                merged = dict(data)
+                merged.update(items)
+                return Xdict.__wrap(merged)
+
+    @classmethod
+    def merge_all[T](
+        cls,
+        dicts: ABCIterable[ABCDict[Any, T]],
+        combine: F1[[T, T], T],
+        workers: int = 0,
+    ) -> "Xdict[Any, T]":
+        """Return a new Xdict, being the merge of all the given ones, combining the values of common keys.
 
-    def keys(self) -> Xlist[Y]:
-        """Return an Xlist of the keys of the Xdict."""
-        return Xlist(self.__data.keys())
+        The dicts are merged two by two with `merge_with`, as a balanced tree :
+        `combine` must be associative, but does not need to be commutative.
+        With `workers` greater than 0, the merges of each level of the tree are distributed on a pool of processes,
+        `combine` and the couples (key, value) must then be picklable.
 
-    def values(self) -> Xlist[X]:
-        """Return an Xlist of the values of the Xdict."""
-        return Xlist(self.__data.values())
+        ### Keyword Arguments
 
-    def items(self) -> Xlist[tuple[Y, X]]:
-        """Return an Xlist of the couples (key, value) of the Xdict."""
-        return Xlist(self.__data.items())
+        - dicts       -- dicts to merge, in order
+        - combine     -- function combining two values of a common key, the leftmost value being first
+        - workers (=0) -- number of processes merging the dicts (no pool if 0)
+
+        ### Usage
+
+        ```python
+            from operator import add
+            from xfp import Xdict
+
+            shards = [Xdict({"a": 1}), Xdict({"a": 2, "b": 1}), Xdict({"b": 5})]
+            assert Xdict.merge_all(shards, add) == Xdict({"a": 3, "b": 6})
+        ```
+        """
+        level: list[Xdict[Any, T]] = [Xdict(d) for d in dicts]
+        if len(level) == 0:
+            return Xdict({})
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+        try:
+            while len(level) > 1:
+                lefts, rights = level[0::2], level[1::2]
+                merged = (
+                    list(map(_merge_pair, lefts, rights, repeat(combine)))
+                    if executor is None
+                    else list(executor.map(_merge_pair, lefts, rights, repeat(combine)))
+                )
+                level = merged + lefts[len(rights) :]
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return level[0]
+
+    def keys(self) -> XdictView[Y]:
+        """Return a view of the keys of the Xdict, without copying them."""
+        data = self.__data
+        return XdictView(data.keys, data.__len__, self.__contains__)
+
+    def values(self) -> XdictView[X]:
+        """Return a view of the values of the Xdict, without copying them.
+
+        Unlike keys, membership in values is tested in O(n).
+        """
+        data = self.__data
+        return XdictView(data.values, data.__len__, lambda x: x in data.values())
+
+    def items(self) -> XdictView[tuple[Y, X]]:
+        """Return a view of the couples (key, value) of the Xdict, without copying them."""
+        data = self.__data
+        return XdictView(data.items, data.__len__, self.__contains_item)
+
+    def __contains_item(self, item: Any) -> bool:
+        match item:
+            case (key, value) if key in self:
+                found = self.__data[key]
+                return found is value or found == value
+            case _:
+                return False
 
     def map[T, U](self, f: F1[[Y, X], tuple[U, T]]) -> "Xdict[U, T]":
         """Return a new Xdict, after transformation of the couples (key, value) through `f`.
@@ -237,7 +627,8 @@ class Xdict[Y, X]:
             assert collisioned == Xdict({"c": 20}) or collisioned == Xdict({"c": 10}) # but it will always return the same
         ```
         """
-        return Xdict.from_list(self.items().map(tupled(f)))
+        data = self.__data
+        return Xdict.__wrap(dict(map(f, data.keys(), data.values())))
 
     def map_keys[U](self, f: F1[[Y], U]) -> "Xdict[U, X]":
         """Return a new Xdict, after transformation of the keys through `f`.
@@ -258,7 +649,7 @@ class Xdict[Y, X]:
             assert collisioned == Xdict({"c": 2}) or collisioned == Xdict({"c": 1}) # but it will always return the same
         ```
         """
-        return self.map(lambda y, x: (f(y), x))
+        return Xdict.__wrap({f(key): value for key, value in self.__data.items()})
 
     def map_values[T](self, f: F1[[X], T]) -> "Xdict[Y, T]":
         """Return a new Xdict, after transformation of the values through `f`.
@@ -273,7 +664,7 @@ class Xdict[Y, X]:
             assert Xdict({"a": 1, "b": 2}).map_values(lambda x: x * 10) == Xdict({"a": 10, "b": 20})
         ```
         """
-        return self.map(lambda y, x: (y, f(x)))
+        return Xdict.__wrap({key: f(value) for key, value in self.__data.items()})
 
     def filter(self, predicate: F1[[Y, X], bool]) -> "Xdict[Y, X]":
         """Return a new Xdict, with the couples not matching the predicate deleted.
@@ -289,7 +680,9 @@ class Xdict[Y, X]:
             assert Xdict({"a": "a", "b": "c"}).filter(lambda y, x: y == x) == Xdict({"a": "a"})
         ```
         """
-        return self.from_list(self.items().filter(tupled(predicate)))
+        return Xdict.__wrap(
+            {key: value for key, value in self.__data.items() if predicate(key, value)}
+        )
 
     def filter_keys(self, predicate: F1[[Y], bool]) -> "Xdict[Y, X]":
         """Return a new Xdict, with the couples not matching the predicate deleted.
@@ -305,7 +698,9 @@ class Xdict[Y, X]:
             assert Xdict({"a": 1, "b": 20}).filter(lambda y: y in ["a", "c"]) == Xdict({"a": 1})
         ```
         """
-        return self.filter(lambda y, _: predicate(y))
+        return Xdict.__wrap(
+            {key: value for key, value in self.__data.items() if predicate(key)}
+        )
 
     def filter_values(self, predicate: F1[[X], bool]) -> "Xdict[Y, X]":
         """Return a new Xdict, with the couples not matching the predicate deleted.
@@ -321,7 +716,9 @@ class Xdict[Y, X]:
             assert Xdict({"a": 1, "b": 20}).filter(lambda x: x < 10) == Xdict({"a": 1})
         ```
         """
-        return self.filter(lambda _, x: predicate(x))
+        return Xdict.__wrap(
+            {key: value for key, value in self.__data.items() if predicate(value)}
+        )
 
     def foreach(self, statement: F1[[Y, X], Any]) -> None:
         """Do the 'statement' procedure once for each couple (key, value) of the Xdict.
@@ -338,7 +735,8 @@ class Xdict[Y, X]:
             # This is an element of the dict : (b, 2)
         ```
         """
-        self.items().foreach(tupled(statement))
+        for key, value in self.__data.items():
+            statement(key, value)
 
     def foreach_keys(self, statement: F1[[Y], Any]) -> None:
         """Do the 'statement' procedure once for each key of the Xdict.
@@ -373,3 +771,90 @@ class Xdict[Y, X]:
         ```
         """
         return self.foreach(lambda _, x: statement(x))
+
+
+class XdictTransient[Y, X]:
+    """Mutable version of an Xdict, to apply many changes before freezing them into a new Xdict.
+
+    Built with `Xdict.builder()` or `Xdict.transient()`.
+    A transient can only be mutated by the thread which created it, and until it is frozen.
+    Used as a context manager, it is frozen when exiting the `with` block.
+
+    ### Raises
+
+    - RuntimeError -- when mutated after being frozen, or from another thread
+    """
+
+    def __init__(
+        self,
+        data: dict[Any, Any] | _TransientHamt,
+        wrap: F1[[dict[Any, Any] | _Hamt], Xdict[Any, Any]],
+    ) -> None:
+        self.__data = data
+        self.__wrap = wrap
+        self.__owner = get_ident()
+        self.__frozen: Xdict[Y, X] | None = None
+
+    def __enter__(self) -> "XdictTransient[Y, X]":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.freeze()
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            return key in self.__data
+        except TypeError:
+            return False
+
+    def __getitem__(self, key: Y) -> X:
+        try:
+            return self.__data[key]
+        except (KeyError, TypeError):
+            raise IndexError(f"Key not found in XdictTransient : {key}") from None
+
+    def get(self, key: Y, default: Any = None) -> Any:
+        """Return the value associated with a given key, or default if not found."""
+        return self.__data.get(key, default)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.__check()
+        self.__data[key] = value
+
+    def __delitem__(self, key: Y) -> None:
+        """Delete the key.
+
+        ### Raises
+
+        - IndexError : if the key is not found in the transient
+        """
+        self.__check()
+        try:
+            del self.__data[key]
+        except (KeyError, TypeError):
+            raise IndexError(f"Key not found in XdictTransient : {key}") from None
+
+    def freeze(self) -> Xdict[Y, X]:
+        """Return the content of the transient as an Xdict, in O(1).
+
+        The transient can not be mutated anymore, freezing it again returns the same Xdict.
+        """
+        if self.__frozen is None:
+            self.__check()
+            match self.__data:
+                case _TransientHamt():
+                    self.__frozen = self.__wrap(self.__data.persistent())
+                case _:
+                    self.__frozen = self.__wrap(self.__data)
+        return self.__frozen
+
+    def __check(self) -> None:
+        if self.__frozen is not None:
+            raise RuntimeError("<transient> can not be mutated once frozen")
+        if get_ident() != self.__owner:
+            raise RuntimeError(
+                "<transient> can only be mutated by the thread which created it"
+            )
@@ -1,17 +1,754 @@
-from copy import deepcopy
-from itertools import tee
+import codecs
+from collections import OrderedDict, deque
+from collections.abc import Iterable as ABCIterable, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from copy import copy, deepcopy
+import csv
+from functools import partial, reduce
+import heapq
+import io
 import itertools
-from typing import Generic, Iterable, Iterator, Any, TypeVar, cast, overload
-from collections.abc import Iterable as ABCIterable
+from itertools import tee
+import json
+import math
+import mmap
+import operator
+from os import PathLike
+import pickle
+from queue import Empty, Queue
+import sys
+from threading import Condition, Event, Thread
+from typing import (
+    Generic,
+    Iterable,
+    Iterator,
+    Any,
+    Literal,
+    TypeVar,
+    cast,
+    overload,
+)
 from deprecation import deprecated  # type: ignore
 
-from xfp import Xresult, Xlist, Xtry
-from xfp.functions import F1, curry2
+from xfp import Xresult, Xlist, Xopt, Xtry, Xdict, Xagg
+from xfp.xagg import _aggregate
+from xfp.functions import F0, F1, curry2
 from xfp.utils import _Comparable
 
 X = TypeVar("X", covariant=True)
 
 
+class _Raised:
+    "Internally used to carry an exception from a producer thread to the consumer."
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+_EXHAUSTED = object()
+
+# iterators over sized containers, whose length hint is exactly the number of remaining elements
+_COPYABLE_ITERATORS: tuple[type, ...] = tuple(
+    map(type, map(iter, ([], (), range(0), range(2**64), "", "€", b"", bytearray())))
+)
+_SIZED_ITERATORS = _COPYABLE_ITERATORS + tuple(
+    map(type, map(iter, ({}, {}.values(), {}.items(), set())))
+)
+
+
+def _sliced_length(
+    length: F0[int], start: int | None, stop: int | None, step: int | None
+) -> F0[int]:
+    "Internally used to follow the remaining length of an islice over an iterator of remaining `length`."
+    start, step, initial = start or 0, step or 1, length()
+    end = initial if stop is None else min(stop, initial)
+    indexes = range(start, end, step)
+
+    def remaining() -> int:
+        consumed = initial - length()
+        return len(indexes) - len(range(start, min(consumed, end), step))
+
+    return remaining
+
+
+class _Counted:
+    "Iterator counting the elements it yields, to follow the remaining length of a tee-ed Xiter."
+
+    __slots__ = ("iterator", "count")
+
+    def __init__(self, iterator: Iterator[Any]) -> None:
+        self.iterator = iterator
+        self.count = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        el = next(self.iterator)
+        self.count += 1
+        return el
+
+
+def _teed_lengths(length: F0[int], a: _Counted, b: _Counted) -> tuple[F0[int], F0[int]]:
+    """Internally used to follow the remaining lengths of two tee-ed iterators, over a source of remaining `length`.
+
+    The source is only pulled by the leading iterator, the other one having the difference left in the tee buffer.
+    """
+
+    def remaining(counted: _Counted) -> F0[int]:
+        return lambda: length() + max(a.count, b.count) - counted.count
+
+    return remaining(a), remaining(b)
+
+
+def _prefetched[T](iterator: Iterator[T], n: int) -> Iterator[T]:
+    buffer: Queue[Any] = Queue(maxsize=n)
+    stop = Event()
+
+    def produce() -> None:
+        try:
+            for el in iterator:
+                if stop.is_set():
+                    return
+                buffer.put(el)
+            buffer.put(_EXHAUSTED)
+        except BaseException as e:
+            buffer.put(_Raised(e))
+
+    producer = Thread(target=produce, name="xiter-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            match buffer.get():
+                case _Raised(error=e):
+                    raise e
+                case el if el is _EXHAUSTED:
+                    return
+                case el:
+                    yield el
+    finally:
+        stop.set()
+        # unblock a producer waiting on a full buffer, until it notices the stop
+        while producer.is_alive():
+            with suppress(Empty):
+                buffer.get_nowait()
+            producer.join(timeout=0.01)
+
+
+def _split_chunks[S: (str, bytes)](chunks: Iterable[S], delimiter: S) -> Iterator[S]:
+    remainder = delimiter[:0]
+    for chunk in chunks:
+        records = (remainder + chunk).split(delimiter)
+        remainder = records.pop()
+        yield from records
+    if remainder:
+        yield remainder
+
+
+def _lines(
+    path: str | PathLike, encoding: str, buffer_size: int, raw: bool, keepends: bool
+) -> Iterator[str] | Iterator[bytes]:
+    if raw:
+        with open(path, "rb", buffering=buffer_size) as bf:
+            if keepends:
+                yield from bf
+            else:
+                yield from _split_chunks(
+                    iter(partial(bf.read, buffer_size), b""), b"\n"
+                )
+    else:
+        with open(path, "r", buffering=buffer_size, encoding=encoding) as tf:
+            if keepends:
+                yield from tf
+            else:
+                yield from _split_chunks(iter(partial(tf.read, buffer_size), ""), "\n")
+
+
+def _streamed_records(
+    path: str | PathLike, delimiter: str | bytes, encoding: str, buffer_size: int
+) -> Iterator[str] | Iterator[bytes]:
+    match delimiter:
+        case bytes():
+            with open(path, "rb", buffering=0) as bf:
+                yield from _split_chunks(
+                    iter(partial(bf.read, buffer_size), b""), delimiter
+                )
+        case str():
+            with open(path, "r", encoding=encoding, newline="") as tf:
+                yield from _split_chunks(
+                    iter(partial(tf.read, buffer_size), ""), delimiter
+                )
+
+
+@contextmanager
+def _mapped(path: str | PathLike) -> Iterator[mmap.mmap | None]:
+    with open(path, "rb") as f:
+        if f.seek(0, io.SEEK_END) == 0:
+            yield None  # empty files can not be mapped
+            return
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield mapped
+    finally:
+        # records still referenced by the consumer keep the mapping open until collected
+        with suppress(BufferError):
+            mapped.close()
+
+
+def _mmap_records(path: str | PathLike, delimiter: bytes) -> Iterator[memoryview]:
+    with _mapped(path) as mapped:
+        if mapped is None:
+            return
+        view = memoryview(mapped)
+        try:
+            start, size, step = 0, len(mapped), len(delimiter)
+            while start < size:
+                end = mapped.find(delimiter, start)
+                if end < 0:
+                    end = size
+                yield view[start:end]
+                start = end + step
+        finally:
+            view.release()
+
+
+def _mmap_decoded_records(
+    path: str | PathLike, delimiter: str, encoding: str, buffer_size: int
+) -> Iterator[str]:
+    with _mapped(path) as mapped:
+        if mapped is None:
+            return
+        decoder = codecs.getincrementaldecoder(encoding)()
+        blocks = (
+            decoder.decode(
+                mapped[i : i + buffer_size], final=i + buffer_size >= len(mapped)
+            )
+            for i in range(0, len(mapped), buffer_size)
+        )
+        yield from _split_chunks(blocks, delimiter)
+
+
+def _csv_rows(
+    path: str | PathLike,
+    columns: Iterable[str] | None,
+    encoding: str,
+    buffer_size: int,
+    fmtparams: dict[str, Any],
+) -> Iterator[dict[str, str | None]]:
+    with open(path, "r", buffering=buffer_size, encoding=encoding, newline="") as f:
+        reader = csv.reader(f, **fmtparams)
+        header = next(reader, None)
+        if header is None:
+            return
+        match columns:
+            case None:
+                names, indexes = header, list(range(len(header)))
+            case _:
+                names = list(columns)
+                missing = [name for name in names if name not in header]
+                if missing:
+                    raise KeyError(f"Columns not found in csv header : {missing}")
+                indexes = [header.index(name) for name in names]
+        # as in csv.DictReader, blank rows are skipped and short rows are filled with None
+        yield from (
+            dict(zip(names, [row[i] if i < len(row) else None for i in indexes]))
+            for row in reader
+            if row
+        )
+
+
+def _parse_json_lines(lines: Iterable[str]) -> list[Any]:
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def _jsonl_rows(
+    path: str | PathLike, encoding: str, buffer_size: int, batch_size: int, workers: int
+) -> Iterator[Any]:
+    with open(path, "r", buffering=buffer_size, encoding=encoding) as f:
+        batches = itertools.batched(f, batch_size)
+        if workers <= 0:
+            for batch in batches:
+                yield from _parse_json_lines(batch)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # at most 2 batches per worker are in memory at once
+            pending: deque[Future[list[Any]]] = deque()
+            try:
+                for batch in batches:
+                    pending.append(executor.submit(_parse_json_lines, batch))
+                    if len(pending) >= 2 * workers:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
+def _appended[T](acc: list[T], el: T) -> list[T]:
+    acc.append(el)
+    return acc
+
+
+def _identity(el: Any) -> Any:
+    return el
+
+
+def _window_accumulator(
+    zero: Any, f: F1[[Any, Any], Any] | None
+) -> tuple[F0[Any], F1[[Any, Any], Any], F1[[Any], Any]]:
+    "Return how to (create, update, emit) the accumulator of a window."
+    match f:
+        case None:
+            return list, _appended, Xlist
+        case _:
+            return (lambda: zero), f, (lambda acc: acc)
+
+
+def _sliding_windows[T, A, R](
+    iterator: Iterable[T],
+    key: F1[[T], Any],
+    size: Any,
+    step: Any,
+    new: F0[A],
+    add: F1[[A, T], A],
+    emit: F1[[A], R],
+    full_windows: bool,
+) -> Iterator[R]:
+    # windows are [start, start + size), with a new start every `step`, from the first key
+    # with full_windows, a trailing partial window is only emitted if it holds uncovered elements
+    opened: deque[tuple[Any, list[A]]] = deque()
+    next_start: Any = None
+    covered_until: Any = None
+    last_key: Any = None
+    for el in iterator:
+        last_key = k = key(el)
+        if next_start is None:
+            next_start = k
+        while opened and not k < opened[0][0] + size:
+            start, acc = opened.popleft()
+            covered_until = start + size
+            yield emit(acc[0])
+        if not k < next_start + size:
+            # skip the windows which would end before k, and therefore be empty
+            next_start = next_start + ((k - size - next_start) // step + 1) * step
+        while not k < next_start:
+            opened.append((next_start, [new()]))
+            next_start = next_start + step
+        for _, acc in opened:
+            acc[0] = add(acc[0], el)
+    if full_windows:
+        if opened and (covered_until is None or not last_key < covered_until):
+            yield emit(opened[0][1][0])
+    else:
+        for _, acc in opened:
+            yield emit(acc[0])
+
+
+def _session_windows[T, A, R](
+    iterator: Iterable[T],
+    key: F1[[T], Any],
+    gap: Any,
+    new: F0[A],
+    add: F1[[A, T], A],
+    emit: F1[[A], R],
+) -> Iterator[R]:
+    acc: A = new()
+    last_key: Any = _EXHAUSTED
+    for el in iterator:
+        k = key(el)
+        if last_key is not _EXHAUSTED and k - last_key > gap:
+            yield emit(acc)
+            acc = new()
+        acc = add(acc, el)
+        last_key = k
+    if last_key is not _EXHAUSTED:
+        yield emit(acc)
+
+
+class _ExactSeen:
+    "Track every element seen, in a set."
+
+    def __init__(self) -> None:
+        self.__seen: set[Any] = set()
+
+    def add(self, el: Any) -> bool:
+        "Return True if el was not seen before, and mark it as seen."
+        if el in self.__seen:
+            return False
+        self.__seen.add(el)
+        return True
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.__seen)
+
+
+class _LruSeen:
+    "Track the `capacity` most recently seen elements."
+
+    def __init__(self, capacity: int) -> None:
+        self.__seen: OrderedDict[Any, None] = OrderedDict()
+        self.__capacity = capacity
+
+    def add(self, el: Any) -> bool:
+        "Return True if el was not seen recently, and mark it as seen."
+        if el in self.__seen:
+            self.__seen.move_to_end(el)
+            return False
+        self.__seen[el] = None
+        if len(self.__seen) > self.__capacity:
+            self.__seen.popitem(last=False)
+        return True
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.__seen)
+
+
+class _BloomSeen:
+    """Track the elements seen in a Bloom filter.
+
+    Sized for `capacity` distinct elements with a false positive rate of `error_rate`,
+    a false positive meaning an element considered as seen while it was not.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.__size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.__nb_hashes = max(1, round(self.__size / capacity * math.log(2)))
+        self.__bits = bytearray((self.__size + 7) // 8)
+
+    def add(self, el: Any) -> bool:
+        "Return True if el was (probably) not seen before, and mark it as seen."
+        h1 = hash(el)
+        h2 = hash((h1, 0x9E3779B9))  # double hashing, from a second mixed hash
+        new = False
+        for i in range(self.__nb_hashes):
+            position = (h1 + i * h2) % self.__size
+            byte, bit = position >> 3, 1 << (position & 7)
+            if not self.__bits[byte] & bit:
+                self.__bits[byte] |= bit
+                new = True
+        return new
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.__bits)
+
+
+def _distinct[T](
+    iterator: Iterable[T],
+    seen: _ExactSeen | _LruSeen | _BloomSeen,
+    key: F1[[T], Any],
+    report: F1[[int], Any] | None,
+) -> Iterator[T]:
+    try:
+        for el in iterator:
+            if seen.add(key(el)):
+                yield el
+    finally:
+        if report is not None:
+            report(seen.nbytes())
+
+
+def _merge_join[T, U](
+    left: Iterable[T], right: Iterable[U], key: F1[[T], Any], other_key: F1[[U], Any]
+) -> Iterator[tuple[T, U]]:
+    left_groups = itertools.groupby(left, key)
+    right_groups = itertools.groupby(right, other_key)
+    left_group = next(left_groups, None)
+    right_group = next(right_groups, None)
+    while left_group is not None and right_group is not None:
+        left_key, left_els = left_group
+        right_key, right_els = right_group
+        if left_key < right_key:
+            left_group = next(left_groups, None)
+        elif right_key < left_key:
+            right_group = next(right_groups, None)
+        else:
+            # only the right elements of the current key are buffered
+            buffered = list(right_els)
+            for left_el in left_els:
+                for right_el in buffered:
+                    yield (left_el, right_el)
+            left_group = next(left_groups, None)
+            right_group = next(right_groups, None)
+
+
+class _Broadcast:
+    """Share the elements of one iterator between several consumers, in a bounded buffer.
+
+    The buffer holds the elements between the slowest and the fastest consumers.
+    A consumer needing a new element while `max_lag` elements are already buffered
+    either waits for the slowest consumers (threaded) or raises a BufferError.
+
+    Forking a consumer hands its place in the buffer over to a new consumer : the forked one
+    is not waited for anymore, and only resumes if its next element is still buffered.
+    """
+
+    def __init__(
+        self, source: Iterator[Any], n: int, max_lag: int, threaded: bool
+    ) -> None:
+        self.__source = source
+        self.__buffer: deque[Any] = deque()
+        self.__offset = 0  # position of the first buffered element in the source
+        self.__positions = dict.fromkeys(range(n), 0)  # only attached consumers
+        self.__forked: dict[int, int] = {}  # positions of the forked consumers
+        self.__next_id = n
+        self.__max_lag = max_lag
+        self.__threaded = threaded
+        self.__exhausted = False
+        self.__pulling = False
+        self.__condition = Condition()
+
+    def next(self, i: int) -> Any:
+        "Return the next element for the consumer i, or _EXHAUSTED."
+        with self.__condition:
+            if i not in self.__positions:
+                if i not in self.__forked:
+                    return _EXHAUSTED  # closed consumer
+                if self.__forked[i] < self.__offset:
+                    raise BufferError(
+                        f"<broadcast> consumer {i} was copied, its next element is not buffered anymore"
+                    )
+                self.__positions[i] = self.__forked.pop(i)
+            while True:
+                index = self.__positions[i] - self.__offset
+                if index < len(self.__buffer):
+                    self.__positions[i] += 1
+                    el = self.__buffer[index]
+                    self.__trim()
+                    return el
+                if self.__exhausted:
+                    return _EXHAUSTED
+                if len(self.__buffer) >= self.__max_lag and not self.__threaded:
+                    raise BufferError(
+                        f"<broadcast> consumer {i} is {self.__max_lag} elements ahead of the slowest consumer"
+                    )
+                if self.__pulling or len(self.__buffer) >= self.__max_lag:
+                    self.__condition.wait()
+                    continue
+                # the source is pulled outside of the lock, so that other consumers can read the buffer meanwhile
+                self.__pulling = True
+                self.__condition.release()
+                try:
+                    el = next(self.__source, _EXHAUSTED)
+                finally:
+                    self.__condition.acquire()
+                    self.__pulling = False
+                    self.__condition.notify_all()
+                if el is _EXHAUSTED:
+                    self.__exhausted = True
+                else:
+                    self.__buffer.append(el)
+
+    def fork(self, i: int) -> int:
+        "Return a new consumer, taking the place of the consumer i in the buffer."
+        with self.__condition:
+            j = self.__next_id
+            self.__next_id += 1
+            if i in self.__positions:
+                self.__forked[i] = self.__positions.pop(i)
+            elif i not in self.__forked:
+                return j  # copy of a closed consumer, closed as well
+            if self.__forked[i] < self.__offset:
+                raise BufferError(
+                    f"<broadcast> consumer {i} was copied, its next element is not buffered anymore"
+                )
+            self.__positions[j] = self.__forked[i]
+            return j
+
+    def detach(self, i: int) -> None:
+        "Stop waiting for the consumer i, releasing the elements only kept for it."
+        with self.__condition:
+            self.__positions.pop(i, None)
+            self.__forked.pop(i, None)
+            self.__trim()
+
+    def __trim(self) -> None:
+        slowest = min(
+            self.__positions.values(), default=self.__offset + len(self.__buffer)
+        )
+        if slowest > self.__offset:
+            for _ in range(slowest - self.__offset):
+                self.__buffer.popleft()
+            self.__offset = slowest
+            self.__condition.notify_all()
+
+
+class _Broadcasted:
+    """Consumer of a _Broadcast.
+
+    Not a generator, so that it can still be iterated after a BufferError.
+    """
+
+    def __init__(self, broadcast: _Broadcast, i: int) -> None:
+        self.__broadcast = broadcast
+        self.__i = i
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        el = self.__broadcast.next(self.__i)
+        if el is _EXHAUSTED:
+            self.close()
+            raise StopIteration
+        return el
+
+    def __copy__(self) -> "_Broadcasted":
+        # a tee over a consumer would buffer every element, whatever max_lag
+        return _Broadcasted(self.__broadcast, self.__broadcast.fork(self.__i))
+
+    def close(self) -> None:
+        "Stop being waited for by the other consumers."
+        self.__broadcast.detach(self.__i)
+
+    def __del__(self) -> None:
+        self.close()
+
+
+class _Memo:
+    "Elements of an iterator, memoised as they are produced, shared by several cursors."
+
+    def __init__(self, source: Iterator[Any], max_items: int | None) -> None:
+        self.__source = source
+        self.__elements: list[Any] = []
+        self.__max_items = max_items
+        self.__exhausted = False
+        self.__overflow: Any = (
+            _EXHAUSTED  # first element beyond max_items, never dropped
+        )
+
+    def get(self, i: int) -> Any:
+        "Return the element at position i, pulling it from the source if needed, or _EXHAUSTED."
+        if i < len(self.__elements):
+            return self.__elements[i]
+        if self.__exhausted:
+            return _EXHAUSTED
+        if self.__max_items is not None and i >= self.__max_items:
+            # pull once to tell a source of exactly max_items elements from a longer one,
+            # then raise on every pass going further, without pulling anymore
+            if self.__overflow is _EXHAUSTED:
+                self.__overflow = next(self.__source, _EXHAUSTED)
+                self.__exhausted = self.__overflow is _EXHAUSTED
+                if self.__exhausted:
+                    return _EXHAUSTED
+            raise BufferError(
+                f"<cache> more than {self.__max_items} elements to memoise, consider persist instead"
+            )
+        el = next(self.__source, _EXHAUSTED)
+        if el is _EXHAUSTED:
+            self.__exhausted = True
+        else:
+            self.__elements.append(el)
+        return el
+
+
+class _MemoCursor:
+    """Iterator over a _Memo.
+
+    Copyable, so that tee (and Xiter.copy) creates new cursors instead of buffering the elements again.
+    """
+
+    def __init__(self, memo: _Memo, i: int = 0) -> None:
+        self.__memo = memo
+        self.__i = i
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        el = self.__memo.get(self.__i)
+        if el is _EXHAUSTED:
+            raise StopIteration
+        self.__i += 1
+        return el
+
+    def __copy__(self) -> "_MemoCursor":
+        return _MemoCursor(self.__memo, self.__i)
+
+
+class _Spill:
+    "Elements of an iterator, pickled to a file as they are produced, shared by several cursors."
+
+    def __init__(self, source: Iterator[Any], path: str | PathLike) -> None:
+        self.path = path
+        self.count = 0  # number of elements written
+        self.flushed = 0  # number of elements readable from the file
+        self.size = 0  # number of bytes written
+        self.__source = source
+        self.__writer: io.BufferedWriter | None = None
+        self.__exhausted = False
+
+    def pull(self) -> Any:
+        "Write the next element of the source to the file and return it, or return _EXHAUSTED."
+        if self.__exhausted:
+            return _EXHAUSTED
+        if self.__writer is None:
+            self.__writer = open(self.path, "wb")
+        el = next(self.__source, _EXHAUSTED)
+        if el is _EXHAUSTED:
+            self.__exhausted = True
+            self.__writer.close()
+        else:
+            pickle.dump(el, self.__writer, protocol=pickle.HIGHEST_PROTOCOL)
+            self.count += 1
+            self.size = self.__writer.tell()
+        return el
+
+    def flush(self) -> None:
+        "Make the written elements readable from the file."
+        if self.__writer is not None and not self.__writer.closed:
+            self.__writer.flush()
+        self.flushed = self.count
+
+
+class _SpillCursor:
+    """Iterator over a _Spill, with its own read handle on the file.
+
+    Copyable, so that tee (and Xiter.copy) creates new cursors instead of buffering the elements again.
+    """
+
+    def __init__(self, spill: _Spill, i: int = 0, offset: int = 0) -> None:
+        self.__spill = spill
+        self.__i = i
+        self.__offset = offset
+        self.__reader: io.BufferedReader | None = None
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        spill = self.__spill
+        if self.__i < spill.count:
+            if self.__i >= spill.flushed:
+                spill.flush()
+            if self.__reader is None:
+                self.__reader = open(spill.path, "rb")
+            self.__reader.seek(self.__offset)
+            el = pickle.load(self.__reader)
+            self.__offset = self.__reader.tell()
+        else:
+            el = spill.pull()
+            if el is _EXHAUSTED:
+                self.close()
+                raise StopIteration
+            self.__offset = spill.size
+        self.__i += 1
+        return el
+
+    def __copy__(self) -> "_SpillCursor":
+        return _SpillCursor(self.__spill, self.__i, self.__offset)
+
+    def close(self) -> None:
+        if self.__reader is not None:
+            self.__reader.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+
 class Xiter(Generic[X]):
     """Enhance Lists (lazy) with functional behaviors.
 
@@ -22,6 +759,12 @@ class Xiter(Generic[X]):
     - Monadic behavior
     - List proxies or quality of lifes
     - Iter proxy from (itertools homogene)
+
+    ### Consumption
+
+    Transformations and lookups (`map`, `filter`, `get`, `head`, `to_Xlist`, ...) do not consume the Xiter.
+    Terminal operations (`foreach`, `fold`, `reduce`, `min`, `max`, `aggregate`, ...) consume it in a single pass,
+    without any tee buffer : call them on a `copy` to go through the elements again.
     """
 
     @classmethod
@@ -34,11 +777,295 @@ class Xiter(Generic[X]):
         "Proxy for itertools.repeat."
         return Xiter(itertools.repeat(x))
 
+    @overload
+    @classmethod
+    def from_lines(
+        cls,
+        path: str | PathLike,
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        *,
+        raw: Literal[False] = False,
+        keepends: bool = False,
+    ) -> "Xiter[str]": ...
+
+    @overload
+    @classmethod
+    def from_lines(
+        cls,
+        path: str | PathLike,
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        *,
+        raw: Literal[True],
+        keepends: bool = False,
+    ) -> "Xiter[bytes]": ...
+
+    @overload
+    @classmethod
+    def from_lines(
+        cls,
+        path: str | PathLike,
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        *,
+        raw: bool = False,
+        keepends: bool = False,
+    ) -> "Xiter[str] | Xiter[bytes]": ...
+
+    @classmethod
+    def from_lines(
+        cls,
+        path: str | PathLike,
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        *,
+        raw: bool = False,
+        keepends: bool = False,
+    ) -> "Xiter[str] | Xiter[bytes]":
+        """Return an Xiter over the lines of a file.
+
+        The file is opened on the first `next` call, and closed once the Xiter is exhausted or closed.
+        Universal newlines are used in text mode, meaning '\\r\\n' are read as '\\n'.
+
+        ### Keyword Arguments
+
+        - path                  -- path of the file to read
+        - encoding (="utf-8")   -- encoding used to decode the lines, ignored in raw mode
+        - buffer_size           -- size of the chunks read at once, in bytes in raw mode, in characters otherwise
+        - raw (=False)          -- yield the undecoded lines as bytes, without newline translation
+        - keepends (=False)     -- keep the line endings in the yielded lines
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter
+
+            (
+                Xiter.from_lines("sales.txt", buffer_size=1024 * 1024)
+                .filter(lambda line: line.startswith("2024"))
+                .foreach(print)
+            )
+        ```
+        """
+        return cast(
+            Xiter[str] | Xiter[bytes],
+            Xiter(_lines(path, encoding, buffer_size, raw, keepends)),
+        )
+
+    @overload
+    @classmethod
+    def from_records(
+        cls,
+        path: str | PathLike,
+        delimiter: str | bytes = b"\n",
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        *,
+        raw: Literal[False] = False,
+        mmap: bool = False,
+    ) -> "Xiter[str]": ...
+
+    @overload
+    @classmethod
+    def from_records(
+        cls,
+        path: str | PathLike,
+        delimiter: str | bytes = b"\n",
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        *,
+        raw: Literal[True],
+        mmap: Literal[False] = False,
+    ) -> "Xiter[bytes]": ...
+
+    @overload
+    @classmethod
+    def from_records(
+        cls,
+        path: str | PathLike,
+        delimiter: str | bytes = b"\n",
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        *,
+        raw: Literal[True],
+        mmap: Literal[True],
+    ) -> "Xiter[memoryview]": ...
+
+    @overload
+    @classmethod
+    def from_records(
+        cls,
+        path: str | PathLike,
+        delimiter: str | bytes = b"\n",
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        *,
+        raw: bool = False,
+        mmap: bool = False,
+    ) -> "Xiter[str] | Xiter[bytes] | Xiter[memoryview]": ...
+
+    @classmethod
+    def from_records(
+        cls,
+        path: str | PathLike,
+        delimiter: str | bytes = b"\n",
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        *,
+        raw: bool = False,
+        mmap: bool = False,
+    ) -> "Xiter[str] | Xiter[bytes] | Xiter[memoryview]":
+        """Return an Xiter over the records of a file, separated by a delimiter.
+
+        The file is opened on the first `next` call, and closed once the Xiter is exhausted or closed.
+        A delimiter ending the file does not produce an empty last record.
+
+        In mmap mode, the file is memory-mapped instead of being read, which is suited
+        to files larger than the available memory. Raw records are then yielded as
+        memoryviews sliced from the mapping, without any copy.
+
+        ### Keyword Arguments
+
+        - path                  -- path of the file to read
+        - delimiter (="\\n")    -- separator of the records, encoded with `encoding` if given as str
+        - encoding (="utf-8")   -- encoding used to decode the records, ignored in raw mode
+        - buffer_size           -- size of the chunks read at once, in characters in text mode,
+                                   in bytes in raw or mmap mode (where the decoded chunks are sliced)
+        - raw (=False)          -- yield the undecoded records (bytes, or memoryview in mmap mode)
+        - mmap (=False)         -- memory-map the file instead of reading it by chunks
+
+        ### Raise
+
+        - ValueError -- if the delimiter is empty
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter
+
+            (
+                Xiter.from_records("events.log", delimiter=b"\\x1e", mmap=True, raw=True)
+                .filter(lambda record: record[:5] == b"ERROR")
+                .map(bytes)
+                .foreach(print)
+            )
+        ```
+        """
+        if not delimiter:
+            raise ValueError("<from_records> delimiter must not be empty")
+        match (raw, delimiter):
+            case (True, str()):
+                sep: str | bytes = delimiter.encode(encoding)
+            case (False, bytes()):
+                sep = delimiter.decode(encoding)
+            case _:
+                sep = delimiter
+
+        match (mmap, sep):
+            case (True, bytes()):
+                records: Iterator[Any] = _mmap_records(path, sep)
+            case (True, str()):
+                records = _mmap_decoded_records(path, sep, encoding, buffer_size)
+            case _:
+                records = _streamed_records(path, sep, encoding, buffer_size)
+
+        return cast(Xiter[str] | Xiter[bytes] | Xiter[memoryview], Xiter(records))
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: str | PathLike,
+        columns: Iterable[str] | None = None,
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        **fmtparams: Any,
+    ) -> "Xiter[dict[str, str | None]]":
+        """Return an Xiter over the rows of a csv file, as dicts indexed by the header.
+
+        The file is opened on the first `next` call, read through a buffer of `buffer_size` bytes,
+        and closed once the Xiter is exhausted or closed.
+        Only one row at a time is held in memory.
+        As in `csv.DictReader`, blank rows are skipped and the missing fields of short rows are None.
+
+        ### Keyword Arguments
+
+        - path                  -- path of the csv file, its first row being the header
+        - columns (=None)       -- names of the columns to keep, in this order (all of them if None)
+        - encoding (="utf-8")   -- encoding of the file
+        - buffer_size           -- size in bytes of the buffer of the underlying binary file
+        - fmtparams             -- formatting parameters of `csv.reader` (delimiter, quotechar, ...)
+
+        ### Raise
+
+        - KeyError -- on the first `next` call, if a column is not found in the header
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter
+
+            (
+                Xiter.from_csv("sales.csv", columns=["ean", "amount"], delimiter=";")
+                .map(lambda row: float(row["amount"]))
+                .fold(0, lambda x, y: x + y)
+            )
+        ```
+        """
+        return Xiter(_csv_rows(path, columns, encoding, buffer_size, fmtparams))
+
+    @classmethod
+    def from_jsonl(
+        cls,
+        path: str | PathLike,
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        batch_size: int = 1000,
+        workers: int = 0,
+    ) -> "Xiter[Any]":
+        """Return an Xiter over the json documents of a json-lines file.
+
+        The file is opened on the first `next` call, and closed once the Xiter is exhausted or closed.
+        Blank lines are skipped.
+        Lines are parsed by batches of `batch_size`. With `workers` greater than 0,
+        batches are parsed in parallel on a pool of processes, at most 2 batches per worker
+        being held in memory at once. Documents are yielded in the order of the file.
+
+        ### Keyword Arguments
+
+        - path                  -- path of the json-lines file
+        - encoding (="utf-8")   -- encoding of the file
+        - buffer_size           -- size in bytes of the buffer of the underlying binary file
+        - batch_size (=1000)    -- number of lines parsed at once
+        - workers (=0)          -- number of processes parsing the batches (no pool if 0)
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter
+
+            (
+                Xiter.from_jsonl("events.jsonl", workers=4)
+                .filter(lambda event: event["type"] == "sale")
+                .foreach(print)
+            )
+        ```
+        """
+        return Xiter(_jsonl_rows(path, encoding, buffer_size, batch_size, workers))
+
     def __init__(self, iterable: Iterable[X]) -> None:
         """Construct an Xiter from an iterable."""
         match iterable:
             case ABCIterable():
                 self.__iter: Iterator = iter(iterable)
+                # return the exact number of remaining elements, when it is known
+                self.__length: F0[int] | None = (
+                    iterable.__length
+                    if isinstance(iterable, Xiter)
+                    else partial(operator.length_hint, self.__iter)
+                    if isinstance(self.__iter, _SIZED_ITERATORS)
+                    else None
+                )
             case _:
                 raise TypeError("Xiter must be constructed from an iterable")
 
@@ -103,9 +1130,48 @@ class Xiter(Generic[X]):
 
         ```
         """
+        if isinstance(self.__iter, _COPYABLE_ITERATORS):
+            # independent iterator over the same container, no tee buffer needed
+            return Xiter(copy(self.__iter))
+        length = self.__length
         a, b = tee(self)
-        self.__iter = a
-        return Xiter(b)
+        if length is None:
+            self.__iter = a
+            return Xiter(b)
+        # the copies now advance independently, each one counting what it yields
+        counted_a, counted_b = _Counted(a), _Counted(b)
+        length_a, length_b = _teed_lengths(length, counted_a, counted_b)
+        self.__iter, self.__length = counted_a, length_a
+        return Xiter(counted_b).__with_length(length_b)
+
+    def __with_length(self, length: F0[int] | None) -> "Xiter[X]":
+        self.__length = length
+        return self
+
+    def __length_hint__(self) -> int:
+        """Return the number of remaining elements, when known.
+
+        Used by `list` and `operator.length_hint` to preallocate.
+        """
+        return NotImplemented if self.__length is None else self.__length()
+
+    def known_length(self) -> Xresult[None, int]:
+        """Return the number of remaining elements, in O(1), wrapped in an Xopt.
+
+        The length is known for Xiters over sized containers (list, tuple, range, str, dict, ...),
+        and kept through `map`, `zip`, `slice` and `take` on them.
+        Return Xopt.Empty otherwise, without iterating.
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter, Xopt
+
+            assert Xiter(range(10)).map(str).take(3).known_length() == Xopt.Some(3)
+            assert Xiter(range(10)).filter(lambda x: x > 5).known_length() == Xopt.Empty
+        ```
+        """
+        return Xopt.Empty if self.__length is None else Xopt.Some(self.__length())
 
     def deepcopy(self) -> "Xiter[X]":
         """Return a new Xiter, with both iterator and elements distincts from self.
@@ -254,7 +1320,8 @@ class Xiter(Generic[X]):
             assert next(result) == 4 # Xiter([2*2, 3*3]) => 2*2 == 4
         ```
         """
-        return Xiter(map(f, self.copy()))
+        copied = self.copy()
+        return Xiter(map(f, copied)).__with_length(copied.__length)
 
     def filter(self, predicate: F1[[X], bool]) -> "Xiter[X]":
         """Return a new iterator skipping the elements with predicate = False.
@@ -277,7 +1344,7 @@ class Xiter(Generic[X]):
     def foreach(self, statement: F1[[X], Any]) -> None:
         """Do the 'statement' procedure once for each element of the iterator.
 
-        Do not consume the original iterator.
+        Consume the iterator, in a single pass : iterate over a `copy` to go through the elements again.
 
         ### Usage
 
@@ -286,19 +1353,20 @@ class Xiter(Generic[X]):
 
             input = Xiter(range(1,4))
             statement = lambda el: print(f"This is an element of the range : ${el}")
-            input.foreach(statement)
+            input.copy().foreach(statement)
             # This is an element of the range : 1
             # This is an element of the range : 2
             # This is an element of the range : 3
 
-            input.foreach(statement) # you can reconsume the same iterable
+            input.foreach(statement) # the copy left input untouched
             # This is an element of the range : 1
             # This is an element of the range : 2
             # This is an element of the range : 3
 
         ```
         """
-        [statement(e) for e in self.copy()]
+        for el in self.__iter:
+            statement(el)
 
     def flatten[XS](self: "Xiter[Iterable[XS]]") -> "Xiter[XS]":
         """Return a new iterator, with each element nested iterated on individually.
@@ -347,6 +1415,8 @@ class Xiter(Generic[X]):
           accumulator(n+1) = f(accumulator(n), self.data[n])
         - Return the last state of the accumulator
 
+        Consume the iterator, in a single pass.
+
         ### Keyword Arguments
 
         - zero -- initial state of the accumulator
@@ -367,10 +1437,7 @@ class Xiter(Generic[X]):
             assert Xiter([]).fold_left(0)(lambda x, y: x + y) == 0
         ```
         """
-        acc: T = zero
-        for e in self:
-            acc = f(acc, e)
-        return acc
+        return reduce(f, self.__iter, zero)
 
     def fold[T](self, zero: T, f: F1[[T, X], T]) -> T:
         """Return the accumulation of the Xiter elements.
@@ -382,6 +1449,8 @@ class Xiter(Generic[X]):
     def reduce(self, f: F1[[X, X], X]) -> X:
         """Return the accumulation of the Xiter elements using the first element as the initial state of accumulation.
 
+        Consume the iterator, in a single pass.
+
         ### Raise
 
         - IndexError -- when the Xiter is empty
@@ -406,15 +1475,16 @@ class Xiter(Generic[X]):
                 Xiter([]).reduce(lambda x, y: x + y)
         ```
         """
-        try:
-            h = self.head()
-        except IndexError:
+        iterator = self.__iter
+        h = next(iterator, _EXHAUSTED)
+        if h is _EXHAUSTED:
             raise IndexError("<reduce> operation not allowed on empty list")
-        return self.tail().fold(h, f)
+        return reduce(f, iterator, cast(X, h))
 
     def reduce_fr(self, f: F1[[X, X], X]) -> Xresult[IndexError, X]:
         """Return the accumulation of the Xiter elements using the first element as the initial state of accumulation.
 
+        Consume the iterator, in a single pass.
         Wrap the potential error in an Xresult.
 
         ### Keyword Arguments
@@ -438,16 +1508,88 @@ class Xiter(Generic[X]):
         """
         return cast(Xresult[IndexError, X], Xtry.from_unsafe(lambda: self.reduce(f)))
 
-    def min(self, key: F1[[X], _Comparable] = id) -> X:
+    def aggregate(self, **aggregators: Xagg[Any, X, Any]) -> Xdict[str, Any]:
+        """Return an Xdict of the results of several aggregations, computed in a single pass.
+
+        Each keyword argument names an aggregation (see Xagg), and is the key of its result.
+        Elements are pulled only once, without tee-ing the iterator for each aggregation.
+
+        Consume the iterator.
+
+        ### Warnings
+
+        This function falls in infinite loop in the case of infinite iterator.
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter, Xagg, Xdict, Xopt
+
+            actual = Xiter([1, 2, 3, 4]).aggregate(
+                count=Xagg.count(),
+                max=Xagg.max(),
+                variance=Xagg.variance(),
+            )
+            assert actual == Xdict({"count": 4, "max": Xopt.Some(4), "variance": Xopt.Some(1.25)})
+        ```
+        """
+        return Xdict(_aggregate(self, aggregators))
+
+    def scan_left[T](self, zero: T, f: F1[[T, X], T]) -> "Xiter[T]":
+        """Return a new iterator over the successive states of the accumulation of the Xiter elements.
+
+        Lazy version of fold_left : yield the zero value, then each accumulator(n+1) = f(accumulator(n), self.data[n]).
+        Only the current accumulator is held in memory, so it works on infinite iterators.
+        Proxy for itertools.accumulate.
+
+        Do not consume the original iterator.
+
+        ### Keyword Arguments
+
+        - zero -- initial state of the accumulator
+        - f    -- accumulation function, compute the next state of the accumulator
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter, Xlist
+
+            assert Xiter([1, 2, 3]).scan_left(10, lambda x, y: x + y).to_Xlist() == Xlist([10, 11, 13, 16])
+        ```
+        """
+        return Xiter(itertools.accumulate(self.copy(), f, initial=zero))
+
+    def accumulate(self, f: F1[[X, X], X]) -> "Xiter[X]":
+        """Return a new iterator over the successive states of the accumulation of the Xiter elements, using the first element as the initial state.
+
+        Lazy version of reduce, proxy for itertools.accumulate.
+        Only the current accumulator is held in memory, so it works on infinite iterators.
+
+        Do not consume the original iterator.
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter, Xlist
+
+            assert Xiter([1, 2, 3]).accumulate(lambda x, y: x + y).to_Xlist() == Xlist([1, 3, 6])
+        ```
+        """
+        return Xiter(itertools.accumulate(self.copy(), f))
+
+    def min(self, key: F1[[X], _Comparable] | None = None) -> X:
         """Return the smallest element of the Xiter given the key criteria.
 
+        Consume the iterator, in a single pass.
+
         ### Raise
 
         - ValueError -- when the Xiter is empty
 
         ### Keyword Arguments
 
-        - key (default id) -- the function which extrapolate a sortable from the elements of the list
+        - key (default None) -- the function which extrapolate a sortable from the elements of the list,
+                                the elements themselves are compared when None
 
         ### Warning
 
@@ -459,16 +1601,15 @@ class Xiter(Generic[X]):
             from xfp import Xiter
             import pytest
 
-            input = Xiter(["ae", "bd", "cc"])
-            assert input.min() == "ae"
-            assert input.min(lambda x: x[-1]) == "cc"
-            with pytest.raises(IndexError):
+            assert Xiter(["ae", "bd", "cc"]).min() == "ae"
+            assert Xiter(["ae", "bd", "cc"]).min(lambda x: x[-1]) == "cc"
+            with pytest.raises(ValueError):
                 Xiter([]).min()
         ```
         """
-        return min(self, key=key)
+        return min(cast(Iterator[Any], self.__iter), key=cast(Any, key))
 
-    def min_fr(self, key: F1[[X], _Comparable] = id) -> Xresult[ValueError, X]:
+    def min_fr(self, key: F1[[X], _Comparable] | None = None) -> Xresult[ValueError, X]:
         """Return the smallest element of the Xiter given the key criteria.
 
         Wrap the potential failure in an Wresult
@@ -480,8 +1621,10 @@ class Xiter(Generic[X]):
         """
         return cast(Xresult[ValueError, X], Xtry.from_unsafe(lambda: self.min(key)))
 
-    def max(self, key: F1[[X], _Comparable] = id) -> X:
-        """Return the bigget element of the Xiter given the key criteria.
+    def max(self, key: F1[[X], _Comparable] | None = None) -> X:
+        """Return the biggest element of the Xiter given the key criteria.
+
+        Consume the iterator, in a single pass.
 
         ### Raise
 
@@ -489,7 +1632,8 @@ class Xiter(Generic[X]):
 
         ### Keyword Arguments
 
-        - key (default id) -- the function which extrapolate a sortable from the elements of the list
+        - key (default None) -- the function which extrapolate a sortable from the elements of the list,
+                                the elements themselves are compared when None
 
         ### Warning
 
@@ -501,16 +1645,15 @@ class Xiter(Generic[X]):
             from xfp import Xiter
             import pytest
 
-            input = Xiter(["ae", "bd", "cc"])
-            assert input.max() == "cc"
-            assert input.max(lambda x: x[-1]) == "ae"
-            with pytest.raises(IndexError):
+            assert Xiter(["ae", "bd", "cc"]).max() == "cc"
+            assert Xiter(["ae", "bd", "cc"]).max(lambda x: x[-1]) == "ae"
+            with pytest.raises(ValueError):
                 Xiter([]).max()
         ```
         """
-        return max(self, key=key)
+        return max(cast(Iterator[Any], self.__iter), key=cast(Any, key))
 
-    def max_fr(self, key: F1[[X], _Comparable] = id) -> Xresult[ValueError, X]:
+    def max_fr(self, key: F1[[X], _Comparable] | None = None) -> Xresult[ValueError, X]:
         """Return the biggest element of the Xiter given the key criteria.
 
         Wrap the potential failure in an Wresult
@@ -599,11 +1742,619 @@ class Xiter(Generic[X]):
                 "slice expected from 1 to 3 positional arguments: 'stop' | 'start' 'stop' ['step']"
             )
 
-        return Xiter(itertools.islice(__iter_copy, *args))
+        result = Xiter(itertools.islice(__iter_copy, *args))
+        if __iter_copy.__length is None:
+            return result
+        bounds = slice(*args)
+        return result.__with_length(
+            _sliced_length(__iter_copy.__length, bounds.start, bounds.stop, bounds.step)
+        )
+
+    def merge_sorted[T](
+        self,
+        *others: Iterable[T],
+        key: F1[[X | T], _Comparable] | None = None,
+        reverse: bool = False,
+    ) -> "Xiter[X | T]":
+        """Return a new iterator merging self and other sorted iterables into a single sorted one.
+
+        Proxy for heapq.merge : self and each other iterable must already be sorted
+        (given the same key and order), only their current elements are held in memory.
+
+        Do not consume the original iterator.
+
+        ### Keyword Arguments
+
+        - key (=None)       -- the function which extrapolate a sortable from the elements
+        - reverse (=False)  -- should the iterables be merged descending (True) or ascending (False)
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter, Xlist
+
+            actual = Xiter([1, 4, 7]).merge_sorted([2, 5], Xiter([3, 6]))
+            assert actual.to_Xlist() == Xlist([1, 2, 3, 4, 5, 6, 7])
+        ```
+        """
+        return Xiter(
+            heapq.merge(self.copy(), *others, key=cast(Any, key), reverse=reverse)
+        )
+
+    def merge_join[T](
+        self,
+        other: Iterable[T],
+        key: F1[[X], _Comparable],
+        other_key: F1[[T], _Comparable] | None = None,
+    ) -> "Xiter[tuple[X, T]]":
+        """Return a new iterator over the couples of elements of self and other sharing the same key.
+
+        Inner join of two iterables sorted ascending by key, done in a single forward pass :
+        only the elements of other sharing the current key are held in memory.
+        Couples are yielded ordered by key, then in the order of self, then of other.
+
+        Do not consume the original iterator.
+
+        ### Keyword Arguments
+
+        - key               -- extract the join key of the elements of self
+        - other_key (=None) -- extract the join key of the elements of other, `key` if None
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter, Xlist
+
+            sales = Xiter([(1, 10), (1, 20), (3, 30)])
+            products = [(1, "apple"), (2, "peach"), (3, "blackberry")]
+            actual = sales.merge_join(products, key=lambda sale: sale[0])
+            assert actual.to_Xlist() == Xlist([
+                ((1, 10), (1, "apple")),
+                ((1, 20), (1, "apple")),
+                ((3, 30), (3, "blackberry")),
+            ])
+        ```
+        """
+        return Xiter(
+            _merge_join(self.copy(), other, key, cast(F1[[T], Any], other_key or key))
+        )
+
+    def distinct(
+        self,
+        mode: Literal["exact", "lru", "bloom"] = "exact",
+        key: F1[[X], Any] | None = None,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.01,
+        report: F1[[int], Any] | None = None,
+    ) -> "Xiter[X]":
+        """Return a new iterator skipping the elements already seen.
+
+        The first occurrence of each element is kept, the source is never buffered.
+        How the seen elements are tracked depends on the mode :
+        - exact : every element is kept in a set, memory grows with the number of distinct elements
+        - lru   : only the `capacity` most recently seen elements are kept, older duplicates are yielded again
+        - bloom : a Bloom filter sized for `capacity` distinct elements, with fixed memory, whose
+          false positives (rate `error_rate` once `capacity` elements are seen) skip new elements
+
+        Do not consume the original iterator.
+
+        ### Keyword Arguments
+
+        - mode (="exact")           -- how the seen elements are tracked
+        - key (=None)               -- extract what identifies an element, the element itself if None
+        - capacity (=1_000_000)     -- number of elements tracked (lru), or expected number of distinct elements (bloom)
+        - error_rate (=0.01)        -- false positive rate of the bloom mode
+        - report (=None)            -- called with the size in bytes of the tracking structure, once the new iterator is exhausted or closed
+
+        ### Raise
+
+        - ValueError -- if the mode is unknown, capacity is not positive or error_rate not in ]0, 1[
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter, Xlist
+
+            assert Xiter([1, 2, 1, 3, 2]).distinct().to_Xlist() == Xlist([1, 2, 3])
+            assert Xiter([1, 2, 1, 3, 1]).distinct("lru", capacity=1).to_Xlist() == Xlist([1, 2, 1, 3, 1])
+
+            (
+                Xiter.from_lines("billions_of_ids.txt")
+                .distinct("bloom", capacity=10**9, error_rate=0.001, report=print) # ~1.8GB
+                .foreach(print)
+            )
+        ```
+        """
+        if capacity < 1:
+            raise ValueError(f"<distinct> capacity must be positive, got {capacity}")
+        if not 0 < error_rate < 1:
+            raise ValueError(
+                f"<distinct> error_rate must be in ]0, 1[, got {error_rate}"
+            )
+
+        seen: _ExactSeen | _LruSeen | _BloomSeen
+        match mode:
+            case "exact":
+                seen = _ExactSeen()
+            case "lru":
+                seen = _LruSeen(capacity)
+            case "bloom":
+                seen = _BloomSeen(capacity, error_rate)
+            case _:
+                raise ValueError(f"<distinct> unknown mode : {mode}")
+
+        return Xiter(_distinct(self.copy(), seen, key or _identity, report))
+
+    def group_consecutive[K](self, key: F1[[X], K]) -> "Xiter[tuple[K, Xlist[X]]]":
+        """Return a new iterator over the groups of consecutive elements sharing the same key.
+
+        Proxy for itertools.groupby : a new group starts each time the key changes,
+        meaning elements must be sorted by key to get a single group per key.
+        Each group is evaluated as an Xlist, and only the current group is held in memory.
+
+        Do not consume the original iterator.
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter, Xlist
+
+            actual = Xiter([1, 3, 2, 4, 5]).group_consecutive(lambda x: x % 2)
+            assert actual.to_Xlist() == Xlist([(1, Xlist([1, 3])), (0, Xlist([2, 4])), (1, Xlist([5]))])
+        ```
+        """
+        return Xiter(
+            (k, Xlist(group)) for k, group in itertools.groupby(self.copy(), key)
+        )
+
+    def group_aggregate[K, T](
+        self, key: F1[[X], K], zero: T, f: F1[[T, X], T]
+    ) -> "Xdict[K, T]":
+        """Return an Xdict of the accumulation of the elements sharing the same key.
+
+        Works as a fold_left per key : each key gets its own accumulator,
+        initialized with the zero value. The elements are not retained,
+        meaning memory scales with the number of distinct keys.
+
+        Elements do not need to be sorted by key.
+
+        ### Keyword Arguments
+
+        - key  -- extract the key of the group of an element
+        - zero -- initial state of the accumulator of each group
+        - f    -- accumulation function, compute the next state of the accumulator
+
+        ### Warning
+
+        This function falls in infinite loop in the case of infinite iterator.
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter, Xdict
+
+            actual = Xiter(["a", "bb", "c"]).group_aggregate(len, 0, lambda acc, _: acc + 1)
+            assert actual == Xdict({1: 2, 2: 1})
+        ```
+        """
+        accumulators: dict[K, T] = {}
+        for el in self:
+            k = key(el)
+            accumulators[k] = f(accumulators.get(k, zero), el)
+        return Xdict(accumulators)
+
+    @overload
+    def window_tumbling(
+        self, size: Any, key: F1[[X], Any] | None = None
+    ) -> "Xiter[Xlist[X]]": ...
+
+    @overload
+    def window_tumbling[T](
+        self, size: Any, key: F1[[X], Any] | None = None, *, zero: T, f: F1[[T, X], T]
+    ) -> "Xiter[T]": ...
+
+    def window_tumbling(
+        self,
+        size: Any,
+        key: F1[[X], Any] | None = None,
+        *,
+        zero: Any = None,
+        f: F1[[Any, X], Any] | None = None,
+    ) -> "Xiter[Any]":
+        """Return a new iterator over the consecutive, non overlapping windows of self.
+
+        Without key, each window holds `size` elements (the last one possibly less).
+        With a key, each window holds the elements whose key is in [start, start + size),
+        the first window starting at the key of the first element.
+        Empty windows are skipped. Elements are expected to be ordered by key.
+
+        Each window is emitted as an Xlist, or as the accumulation of its elements
+        when (zero, f) is given, in which case only the accumulator is held in memory.
+        Only the current window is held in memory, so it works on infinite iterators.
+
+        Shorthand for window_sliding with step = size.
+
+        Do not consume the original iterator.
+
+        ### Keyword Arguments
+
+        - size          -- number of elements, or span of keys (eg. a timedelta), of each window
+        - key (=None)   -- extract the position of the elements (eg. a timestamp)
+        - zero          -- initial state of the accumulator of each window
+        - f             -- accumulation function, compute the next state of the accumulator
+
+        ### Usage
+
+        ```python
+            from datetime import date, timedelta
+            from xfp import Xiter, Xlist
+
+            assert Xiter(range(5)).window_tumbling(2).to_Xlist() == Xlist([Xlist([0, 1]), Xlist([2, 3]), Xlist([4])])
+
+            weekly_amounts = (
+                Xiter(sales)
+                .window_tumbling(
+                    timedelta(days=7),
+                    key=lambda sale: date.fromisoformat(sale.ref_date),
+                    zero=0,
+                    f=lambda acc, sale: acc + sale.amount,
+                )
+            )
+        ```
+        """
+        return self.window_sliding(size, size, key, zero=zero, f=cast(Any, f))
+
+    @overload
+    def window_sliding(
+        self, size: Any, step: Any, key: F1[[X], Any] | None = None
+    ) -> "Xiter[Xlist[X]]": ...
+
+    @overload
+    def window_sliding[T](
+        self,
+        size: Any,
+        step: Any,
+        key: F1[[X], Any] | None = None,
+        *,
+        zero: T,
+        f: F1[[T, X], T],
+    ) -> "Xiter[T]": ...
+
+    def window_sliding(
+        self,
+        size: Any,
+        step: Any,
+        key: F1[[X], Any] | None = None,
+        *,
+        zero: Any = None,
+        f: F1[[Any, X], Any] | None = None,
+    ) -> "Xiter[Any]":
+        """Return a new iterator over the windows of self, a new window starting every `step`.
+
+        Without key, each window holds `size` elements, a new window starting every `step` elements.
+        A trailing partial window is only emitted if it holds elements not emitted yet.
+        With a key, each window holds the elements whose key is in [start, start + size),
+        a new window starting every `step` from the key of the first element.
+        Empty windows are skipped. Elements are expected to be ordered by key.
+
+        Each window is emitted as an Xlist, or as the accumulation of its elements
+        when (zero, f) is given, in which case only the accumulators are held in memory.
+        Only the opened windows are held in memory, so it works on infinite iterators.
+
+        Do not consume the original iterator.
+
+        ### Keyword Arguments
+
+        - size          -- number of elements, or span of keys (eg. a timedelta), of each window
+        - step          -- number of elements, or span of keys, between the start of two windows
+        - key (=None)   -- extract the position of the elements (eg. a timestamp)
+        - zero          -- initial state of the accumulator of each window
+        - f             -- accumulation function, compute the next state of the accumulator
+
+        ### Raise
+
+        - ValueError -- if size or step are not positive
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter, Xlist
+
+            assert Xiter(range(5)).window_sliding(3, 1).to_Xlist() == Xlist([Xlist([0, 1, 2]), Xlist([1, 2, 3]), Xlist([2, 3, 4])])
+            assert Xiter(range(5)).window_sliding(3, 1, zero=0, f=lambda x, y: x + y).to_Xlist() == Xlist([3, 6, 9])
+        ```
+        """
+        if not size > size * 0 or not step > step * 0:
+            raise ValueError(
+                f"<window> size and step must be positive, got {size} and {step}"
+            )
+
+        new, add, emit = _window_accumulator(zero, f)
+
+        match key:
+            case None:
+                return Xiter(
+                    _sliding_windows(
+                        enumerate(self.copy()),
+                        lambda pair: pair[0],
+                        size,
+                        step,
+                        new,
+                        lambda acc, pair: add(acc, pair[1]),
+                        emit,
+                        full_windows=True,
+                    )
+                )
+            case _:
+                return Xiter(
+                    _sliding_windows(
+                        self.copy(), key, size, step, new, add, emit, full_windows=False
+                    )
+                )
+
+    @overload
+    def window_session(
+        self, gap: Any, key: F1[[X], Any] | None = None
+    ) -> "Xiter[Xlist[X]]": ...
+
+    @overload
+    def window_session[T](
+        self, gap: Any, key: F1[[X], Any] | None = None, *, zero: T, f: F1[[T, X], T]
+    ) -> "Xiter[T]": ...
+
+    def window_session(
+        self,
+        gap: Any,
+        key: F1[[X], Any] | None = None,
+        *,
+        zero: Any = None,
+        f: F1[[Any, X], Any] | None = None,
+    ) -> "Xiter[Any]":
+        """Return a new iterator over the sessions of self.
+
+        A session is a window of consecutive elements, closed as soon as the keys of two
+        consecutive elements are more than `gap` apart. Elements are expected to be ordered by key.
+
+        Each session is emitted as an Xlist, or as the accumulation of its elements
+        when (zero, f) is given, in which case only the accumulator is held in memory.
+        Only the current session is held in memory, so it works on infinite iterators.
+
+        Do not consume the original iterator.
+
+        ### Keyword Arguments
+
+        - gap           -- maximum span of keys (eg. a timedelta) between two elements of a session
+        - key (=None)   -- extract the position of the elements (eg. a timestamp), the element itself if None
+        - zero          -- initial state of the accumulator of each window
+        - f             -- accumulation function, compute the next state of the accumulator
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter, Xlist
+
+            assert Xiter([1, 2, 5, 6, 7, 10]).window_session(1).to_Xlist() == Xlist([Xlist([1, 2]), Xlist([5, 6, 7]), Xlist([10])])
+        ```
+        """
+        new, add, emit = _window_accumulator(zero, f)
+
+        return Xiter(
+            _session_windows(self.copy(), key or _identity, gap, new, add, emit)
+        )
+
+    def prefetch(self, n: int, executor: Literal["thread"] = "thread") -> "Xiter[X]":
+        """Return a new iterator, pulling up to 'n' elements ahead in the background.
+
+        The elements are produced by a background thread into a bounded buffer,
+        letting a slow producer (file, socket, database cursor, ...) work while the
+        consumer processes the previous elements.
+        Exceptions raised by the producer are re-raised to the consumer, in order.
+        The background thread starts on the first `next` call, and is stopped
+        when the new iterator is exhausted or closed (it then finishes the pull in progress).
+
+        Do not consume the original iterator.
+        However the original iterator must not be iterated while the prefetched one
+        is being consumed, since tee-ed iterators are not thread safe.
+
+        ### Keyword Arguments
+
+        - n                   -- maximum number of elements pulled ahead
+        - executor (="thread") -- where the elements are pulled, only "thread" is supported
+
+        ### Raise
+
+        - ValueError -- if n is lower than 1 or the executor is unknown
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter
+
+            (
+                Xiter(open("huge_file.txt"))
+                .prefetch(1000)              # reading the file overlaps with ...
+                .map(expensive_computation)  # ... the computation
+                .foreach(print)
+            )
+        ```
+        """
+        if n < 1:
+            raise ValueError(f"<prefetch> n must be at least 1, got {n}")
+        if executor != "thread":
+            raise ValueError(f"<prefetch> unknown executor : {executor}")
+
+        return Xiter(_prefetched(iter(self.copy()), n))
+
+    def cache(self, max_items: int | None = None) -> "Xiter[X]":
+        """Return a new iterator, memoising the elements of self as they are produced.
+
+        The elements are computed once : every copy of the new iterator (`copy`, and
+        any transformation or evaluation relying on it) replays the memoised elements,
+        pulling the source only for the elements not produced yet.
+        Useful to iterate several times over an expensive Xiter.
+
+        Consume the iterator : the original must not be used afterwards,
+        so that no tee buffer keeps the elements a second time.
+
+        ### Keyword Arguments
+
+        - max_items (=None) -- maximum number of memoised elements, unbounded if None
+
+        ### Raise
+
+        - ValueError  -- if max_items is negative
+        - BufferError -- (when iterating) if more than max_items elements are produced
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter
+
+            cached = Xiter(range(10)).map(expensive_computation).cache()
+            cached.foreach(print)           # expensive_computation is called 10 times
+            total = cached.copy().fold(0, lambda x, y: x + y) # and not once more
+        ```
+        """
+        if max_items is not None and max_items < 0:
+            raise ValueError(f"<cache> max_items must be positive, got {max_items}")
+
+        return Xiter(_MemoCursor(_Memo(self.__iter, max_items)))
+
+    def persist(self, path: str | PathLike) -> "Xiter[X]":
+        """Return a new iterator, spilling the elements of self to a local file as they are produced.
+
+        Same as `cache`, with the elements pickled to the file at 'path' instead of
+        being kept in memory, for streams larger than the RAM.
+        Each copy of the new iterator reads the file with its own handle.
+        The file is created on the first pull (overwriting any existing file), and
+        is not removed afterwards.
+
+        Consume the iterator : the original must not be used afterwards.
+
+        ### Keyword Arguments
+
+        - path -- path of the file the elements are written to, they must be picklable
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter
+
+            persisted = Xiter.from_lines("huge_file.txt").map(parse).persist("/tmp/parsed.pickle")
+            count = persisted.copy().fold(0, lambda acc, _: acc + 1)
+            persisted.filter(is_valid).foreach(print)  # the file is read, not parsed again
+        ```
+        """
+        return Xiter(_SpillCursor(_Spill(self.__iter, path)))
+
+    def broadcast(
+        self, n: int, max_lag: int = 1000, threaded: bool = False
+    ) -> "Xlist[Xiter[X]]":
+        """Return an Xlist of 'n' iterators, each one yielding all the elements of self.
+
+        Contrary to `copy`, the elements are shared in a buffer bounded to 'max_lag' elements :
+        a consumer can not be more than 'max_lag' elements ahead of the slowest one.
+        When it tries to, it raises a BufferError, or waits for the slowest consumers
+        if they are iterated from other threads (see `threaded`).
+        An element is released as soon as every consumer has yielded it.
+        A consumer stops being waited for once it is exhausted, garbage collected, or closed
+        (`iter(consumer).close()`).
+        Copying a consumer (as its transformations do) hands its place over to the copy,
+        so that `consumer.map(f)` stays bounded : the original consumer then only resumes
+        while its next element is still buffered.
+
+        Consume the iterator : the original must not be used afterwards,
+        so that no tee buffer keeps the elements alive.
+
+        ### Keyword Arguments
+
+        - n                -- number of consumers
+        - max_lag (=1000)  -- maximum number of elements buffered between the slowest and the fastest consumer
+        - threaded (=False) -- whether the consumers are iterated from different threads,
+                             a consumer too far ahead then blocks instead of raising
+
+        ### Raise
+
+        - ValueError  -- if n or max_lag is lower than 1
+        - BufferError -- (when iterating a consumer, non threaded) if the consumer is too far ahead
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter
+
+            left, right = Xiter(range(10)).broadcast(2, max_lag=1)
+            for l, r in zip(left, right):   # consumers in lockstep, 1 element buffered
+                assert l == r
+        ```
+        """
+        if n < 1:
+            raise ValueError(f"<broadcast> n must be at least 1, got {n}")
+        if max_lag < 1:
+            raise ValueError(f"<broadcast> max_lag must be at least 1, got {max_lag}")
+
+        shared = _Broadcast(self.__iter, n, max_lag, threaded)
+        return Xlist([Xiter(_Broadcasted(shared, i)) for i in range(n)])
+
+    def drive_all[T](
+        self, *sinks: F1[["Xiter[X]"], T], max_lag: int = 1000
+    ) -> "Xlist[T]":
+        """Return the results of the sinks, all fed in a single pass over self.
+
+        Each sink is a function consuming an Xiter, run in its own thread on a
+        threaded `broadcast` consumer. A sink not consuming its whole Xiter stops
+        being waited for once it returns.
+        Exceptions raised by a sink are re-raised once every sink is done.
+
+        Consume the iterator.
+
+        ### Keyword Arguments
+
+        - sinks            -- functions consuming the elements of self
+        - max_lag (=1000)  -- maximum number of elements buffered between the slowest and the fastest sink
+
+        ### Raise
+
+        - ValueError -- if max_lag is lower than 1
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter, Xlist
+
+            total, count = Xiter(range(1_000_000)).drive_all(
+                lambda xi: xi.fold(0, lambda acc, el: acc + el),
+                lambda xi: xi.fold(0, lambda acc, _: acc + 1),
+            )
+            assert (total, count) == (499999500000, 1_000_000)
+        ```
+        """
+        if max_lag < 1:
+            raise ValueError(f"<drive_all> max_lag must be at least 1, got {max_lag}")
+
+        shared = _Broadcast(self.__iter, len(sinks), max_lag, threaded=True)
+
+        def drive(i: int, sink: F1[[Xiter[X]], T]) -> T:
+            try:
+                return sink(Xiter(_Broadcasted(shared, i)))
+            finally:
+                shared.detach(i)
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, len(sinks)), thread_name_prefix="xiter-drive"
+        ) as executor:
+            futures = [executor.submit(drive, i, sink) for i, sink in enumerate(sinks)]
+        return Xlist([future.result() for future in futures])
 
     def zip[T](self, other: Iterable[T]) -> "Xiter[tuple[X, T]]":
         """Zip this iterator with another iterable."""
-        return Xiter(zip(self.copy(), other))
+        copied = self.copy()
+        others = Xiter(other)
+        result = Xiter(zip(copied, others))
+        length, other_length = copied.__length, others.__length
+        if length is None or other_length is None:
+            return result
+        return result.__with_length(lambda: min(length(), other_length()))
 
     def to_Xlist(self) -> "Xlist[X]":
         """Return an Xlist being the evaluated version of self.
@@ -611,3 +2362,95 @@ class Xiter(Generic[X]):
         Do not consume the original iterator.
         """
         return Xlist(self.copy())
+
+    def to_csv(
+        self,
+        path: str | PathLike,
+        columns: Iterable[str] | None = None,
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        batch_size: int = 1000,
+        **fmtparams: Any,
+    ) -> None:
+        """Write the elements of the Xiter as the rows of a csv file.
+
+        Elements can either be mappings, written under a header, or sequences of values.
+        Rows are written by batches of `batch_size` through a buffer of `buffer_size` bytes,
+        meaning at most one batch is held in memory.
+
+        Consume the iterator.
+
+        ### Keyword Arguments
+
+        - path                  -- path of the csv file, overwritten if it exists
+        - columns (=None)       -- header of the file, defaults to the keys of the first mapping
+        - encoding (="utf-8")   -- encoding of the file
+        - buffer_size           -- size in bytes of the write buffer
+        - batch_size (=1000)    -- number of rows written at once
+        - fmtparams             -- formatting parameters of `csv.writer` (delimiter, quotechar, ...)
+
+        ### Raise
+
+        - ValueError -- if a mapping holds a key absent from the header
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter
+
+            Xiter([{"ean": 1, "amount": 10}, {"ean": 2, "amount": 20}]).to_csv("sales.csv")
+            Xiter.from_csv("sales.csv").to_Xlist() # Xlist([{"ean": "1", "amount": "10"}, ...])
+        ```
+        """
+        iterator: Iterator[Any] = iter(self)
+        first: Any = next(iterator, _EXHAUSTED)
+        with open(path, "w", buffering=buffer_size, encoding=encoding, newline="") as f:
+            match first:
+                case Mapping():
+                    header = list(columns) if columns is not None else list(first)
+                    dict_writer = csv.DictWriter(f, header, **fmtparams)
+                    dict_writer.writeheader()
+                    dict_writer.writerow(first)
+                    for batch in itertools.batched(iterator, batch_size):
+                        dict_writer.writerows(batch)
+                case _:
+                    writer = csv.writer(f, **fmtparams)
+                    if columns is not None:
+                        writer.writerow(columns)
+                    if first is not _EXHAUSTED:
+                        writer.writerow(first)
+                    for batch in itertools.batched(iterator, batch_size):
+                        writer.writerows(batch)
+
+    def to_jsonl(
+        self,
+        path: str | PathLike,
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        batch_size: int = 1000,
+    ) -> None:
+        """Write the elements of the Xiter as the lines of a json-lines file.
+
+        Documents are written by batches of `batch_size` through a buffer of `buffer_size` bytes,
+        meaning at most one batch is held in memory.
+
+        Consume the iterator.
+
+        ### Raise
+
+        - TypeError -- if an element is not json serializable
+
+        ### Usage
+
+        ```python
+            from xfp import Xiter
+
+            Xiter([{"ean": 1}, {"ean": 2}]).to_jsonl("sales.jsonl")
+            Xiter.from_jsonl("sales.jsonl").to_Xlist() # Xlist([{"ean": 1}, {"ean": 2}])
+        ```
+        """
+        encode = json.JSONEncoder().encode
+        with open(path, "w", buffering=buffer_size, encoding=encoding) as f:
+            for batch in itertools.batched(self, batch_size):
+                f.write("\n".join(map(encode, batch)))
+                f.write("\n")
@@ -3,6 +3,8 @@ from __future__ import annotations
 from warnings import warn
 
 from copy import copy, deepcopy
+from threading import get_ident
+import itertools
 from typing import (
     Any,
     Callable,
@@ -10,14 +12,19 @@ from typing import (
     Iterable,
     Iterator,
     Protocol,
+    TYPE_CHECKING,
     TypeVar,
     cast,
     overload,
 )
 from collections.abc import Iterable as ABCIterable
-from xfp import Xresult, Xtry
+from xfp import Xresult, Xtry, Xagg
+from xfp.xagg import _aggregate
 from xfp.functions import F1
 
+if TYPE_CHECKING:
+    from xfp import Xdict
+
 
 class _SupportsDunderLT(Protocol):
     def __lt__(self, other: Any, /) -> bool: ...
@@ -59,6 +66,29 @@ class Xlist(Generic[X]):
     - List proxies or quality of lifes
     """
 
+    @classmethod
+    def __wrap(cls, data: list[X]) -> Xlist[X]:
+        xlist = cls.__new__(cls)
+        xlist.__data = data
+        return xlist
+
+    @classmethod
+    def builder(cls) -> XlistTransient[Any]:
+        """Return an empty XlistTransient, to build a new Xlist by mutation.
+
+        ### Usage
+
+        ```python
+            from xfp import Xlist
+
+            with Xlist.builder() as builder:
+                for i in range(3):
+                    builder.append(i)
+            assert builder.freeze() == Xlist([0, 1, 2])
+        ```
+        """
+        return XlistTransient([], Xlist.__wrap)
+
     def __init__(self, iterable: Iterable[X]) -> None:
         """Construct an Xlist from an iterable."""
         match iterable:
@@ -96,6 +126,26 @@ class Xlist(Generic[X]):
         """
         return self.get(i)
 
+    def transient(self) -> XlistTransient[X]:
+        """Return an XlistTransient initialized with the elements of self, to derive a new Xlist by mutation.
+
+        The elements are copied once, self is left untouched.
+
+        ### Usage
+
+        ```python
+            from xfp import Xlist
+
+            input = Xlist([1, 2])
+            with input.transient() as t:
+                t[0] = 10
+                t.append(3)
+            assert t.freeze() == Xlist([10, 2, 3])
+            assert input == Xlist([1, 2])
+        ```
+        """
+        return XlistTransient(list(self.__data), Xlist.__wrap)
+
     def copy(self) -> Xlist[X]:
         "Return a shallow copy of itself."
         return Xlist(copy(self.__data))
@@ -637,6 +687,127 @@ class Xlist(Generic[X]):
         """
         return cast(Xresult[IndexError, X], Xtry.from_unsafe(lambda: self.reduce(f)))
 
+    def scan_left[Y](self, zero: Y, f: F1[[Y, X], Y]) -> Xlist[Y]:
+        """Return an Xlist of the successive states of the accumulation of the Xlist elements.
+
+        Start with the zero value, then each accumulator(n+1) = f(accumulator(n), self.data[n]),
+        meaning the last element is the result of fold_left.
+        Proxy for itertools.accumulate.
+
+        ### Keyword Arguments
+
+        - zero -- initial state of the accumulator
+        - f    -- accumulation function, compute the next state of the accumulator
+
+        ### Usage
+
+        ```python
+            from xfp import Xlist
+
+            assert Xlist([1, 2, 3]).scan_left(10, lambda x, y: x + y) == Xlist([10, 11, 13, 16])
+            assert Xlist([]).scan_left(10, lambda x, y: x + y) == Xlist([10])
+        ```
+        """
+        return Xlist(itertools.accumulate(self, f, initial=zero))
+
+    def accumulate(self, f: F1[[X, X], X]) -> Xlist[X]:
+        """Return an Xlist of the successive states of the accumulation of the Xlist elements, using the first element as the initial state.
+
+        The last element is the result of reduce. Proxy for itertools.accumulate.
+
+        ### Usage
+
+        ```python
+            from xfp import Xlist
+
+            assert Xlist([1, 2, 3]).accumulate(lambda x, y: x + y) == Xlist([1, 3, 6])
+            assert Xlist([]).accumulate(lambda x, y: x + y) == Xlist([])
+        ```
+        """
+        return Xlist(itertools.accumulate(self, f))
+
+    def aggregate(self, **aggregators: Xagg[Any, X, Any]) -> "Xdict[str, Any]":
+        """Return an Xdict of the results of several aggregations, computed in a single pass.
+
+        Each keyword argument names an aggregation (see Xagg), and is the key of its result.
+        Useful to avoid iterating once per statistic on big collections.
+
+        ### Usage
+
+        ```python
+            from xfp import Xlist, Xagg, Xdict, Xopt
+
+            actual = Xlist([1, 2, 3]).aggregate(count=Xagg.count(), total=Xagg.sum(), mean=Xagg.mean())
+            assert actual == Xdict({"count": 3, "total": 6, "mean": Xopt.Some(2.0)})
+        ```
+        """
+        from xfp import Xdict  # Xdict depends on Xlist
+
+        return Xdict(_aggregate(self, aggregators))
+
     def zip[T](self, other: Iterable[T]) -> "Xlist[tuple[X, T]]":
         """Zip this Xlist with another iterable."""
         return Xlist(zip(self, other))
+
+
+class XlistTransient(Generic[X]):
+    """Mutable version of an Xlist, to apply many changes before freezing them into a new Xlist.
+
+    Built with `Xlist.builder()` or `Xlist.transient()`.
+    A transient can only be mutated by the thread which created it, and until it is frozen.
+    Used as a context manager, it is frozen when exiting the `with` block.
+
+    ### Raise
+
+    - RuntimeError -- when mutated after being frozen, or from another thread
+    """
+
+    def __init__(self, data: list[Any], wrap: F1[[list[Any]], Xlist[Any]]) -> None:
+        self.__data = data
+        self.__wrap = wrap
+        self.__owner = get_ident()
+        self.__frozen: Xlist[X] | None = None
+
+    def __enter__(self) -> XlistTransient[X]:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.freeze()
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def __getitem__(self, i: int) -> X:
+        return self.__data[i]
+
+    def __setitem__(self, i: int, el: Any) -> None:
+        self.__check()
+        self.__data[i] = el
+
+    def append(self, el: Any) -> None:
+        """Add an element at the end of the transient."""
+        self.__check()
+        self.__data.append(el)
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Add the elements of an iterable at the end of the transient."""
+        self.__check()
+        self.__data.extend(iterable)
+
+    def freeze(self) -> Xlist[X]:
+        """Return the content of the transient as an Xlist, in O(1).
+
+        The transient can not be mutated anymore, freezing it again returns the same Xlist.
+        """
+        if self.__frozen is None:
+            self.__check()
+            self.__frozen = self.__wrap(self.__data)
+        return self.__frozen
+
+    def __check(self) -> None:
+        if self.__frozen is not None:
+            raise RuntimeError("<transient> can not be mutated once frozen")
+        if get_ident() != self.__owner:
+            raise RuntimeError(
+                "<transient> can only be mutated by the thread which created it"
+            )
@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from hypothesis import given, settings, strategies as st
+import pytest
+
+from xfp import DiskXdict, Xdict, Xiter, Xlist
+
+
+def test_diskxdict_build_should_keep_the_last_value(tmp_path) -> None:
+    pairs = Xiter([("a", 1), ("b", 2), ("a", 3)])
+    with DiskXdict.build(tmp_path / "xdict.db", pairs, batch_size=2) as actual:
+        assert actual == Xdict({"a": 3, "b": 2})
+        assert len(actual) == 2
+
+
+def test_diskxdict_lookups(tmp_path) -> None:
+    with DiskXdict.build(
+        tmp_path / "xdict.db", [("a", [1]), (("b", 2), None)]
+    ) as actual:
+        assert actual["a"] == [1] and actual[("b", 2)] is None
+        assert actual.get("c") is None and actual.get("c", 0) == 0
+        assert "a" in actual and "c" not in actual and (lambda: 0) not in actual
+        assert actual.get_fr("a").value == [1]
+        assert isinstance(actual.get_fr("c").value, IndexError)
+        with pytest.raises(IndexError):
+            actual["c"]
+
+
+def test_diskxdict_views(tmp_path) -> None:
+    pairs = [(f"key{i}", i) for i in range(100)]
+    with DiskXdict.build(tmp_path / "xdict.db", pairs) as actual:
+        assert sorted(actual.keys()) == sorted(key for key, _ in pairs)
+        assert "key1" in actual.keys() and 99 in actual.values()
+        assert ("key1", 1) in actual.items() and ("key1", 2) not in actual.items()
+        assert actual.values().filter(lambda x: x >= 98).to_Xlist().sorted() == Xlist(
+            [98, 99]
+        )
+        assert actual.items().fold(0, lambda acc, item: acc + item[1]) == sum(
+            range(100)
+        )
+        assert actual.to_Xdict() == Xdict(dict(pairs))
+
+
+@settings(max_examples=20)
+@given(
+    st.dictionaries(st.text(), st.integers()), st.lists(st.text()), st.integers(0, 3)
+)
+def test_diskxdict_cache_should_not_alter_lookups(
+    tmp_path_factory, input, keys, cache_size
+) -> None:
+    path = tmp_path_factory.mktemp("cache") / "xdict.db"
+    with DiskXdict.build(path, input.items(), cache_size=cache_size) as actual:
+        for key in keys + list(input) + keys:
+            assert actual.get(key, None) == input.get(key, None)
+
+
+def test_diskxdict_should_be_read_from_several_threads(tmp_path) -> None:
+    DiskXdict.build(tmp_path / "xdict.db", [(i, i * 2) for i in range(1000)]).close()
+    with DiskXdict[int, int](tmp_path / "xdict.db", cache_size=10) as actual:
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(actual.__getitem__, range(1000)))
+    assert results == [i * 2 for i in range(1000)]
+
+
+def test_diskxdict_should_fail_on_missing_file(tmp_path) -> None:
+    with pytest.raises(FileNotFoundError):
+        DiskXdict(tmp_path / "missing.db")
+
+
+def test_diskxdict_should_match_equal_keys(tmp_path) -> None:
+    s = "ab"
+    pairs = [
+        ((s, s), "tuple"),
+        (1, "int"),
+        (("x", (2, b"y")), "nested"),
+        (2.5, "float"),
+    ]
+    with DiskXdict.build(tmp_path / "xdict.db", pairs) as actual:
+        assert actual[("ab", "".join(["a", "b"]))] == "tuple"
+        assert actual[1.0] == actual[True] == "int"
+        assert actual[("x", (2.0, b"y"))] == "nested"
+        assert actual[2.5] == "float" and 2 not in actual
+        assert sorted(map(str, actual.keys())) == sorted(str(key) for key, _ in pairs)
+
+
+def test_diskxdict_build_should_reject_unsupported_keys(tmp_path) -> None:
+    with pytest.raises(TypeError):
+        DiskXdict.build(tmp_path / "xdict.db", [(("a", frozenset()), 1)])
+
+
+def test_diskxdict_combinators(tmp_path) -> None:
+    with DiskXdict.build(tmp_path / "xdict.db", [("a", 1), ("b", 2)]) as actual:
+        assert sorted(actual.map(lambda y, x: (x, y))) == [(1, "a"), (2, "b")]
+        assert list(actual.filter(lambda y, x: x > 1)) == [("b", 2)]
+        assert actual.fold(0, lambda acc, _, x: acc + x) == 3
+        seen: list[str] = []
+        actual.foreach(lambda y, _: seen.append(y))
+        assert sorted(seen) == ["a", "b"]
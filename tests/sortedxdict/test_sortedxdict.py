@@ -0,0 +1,121 @@
+from bisect import bisect_left, bisect_right
+
+from hypothesis import given, strategies as st
+import pytest
+
+from xfp import SortedXdict, Xdict, Xlist, Xopt
+
+st_keys = st.integers(-50, 50)
+st_dict = st.dictionaries(st_keys, st.integers())
+
+
+def test_sortedxdict_should_iterate_in_key_order() -> None:
+    input = SortedXdict({3: "c", 1: "a", 2: "b"})
+    assert list(input) == [(1, "a"), (2, "b"), (3, "c")]
+    assert input.keys().to_Xlist() == Xlist([1, 2, 3])
+    assert input.values().to_Xlist() == Xlist(["a", "b", "c"])
+
+
+def test_sortedxdict_lookups() -> None:
+    input = SortedXdict({1: "a", 3: "c"})
+    assert input[3] == "c" and input.get(2) is None and input.get(2, "b") == "b"
+    assert 1 in input and 2 not in input and "a" not in input
+    assert (1, "a") in input.items() and (1, "b") not in input.items()
+    assert input == Xdict({1: "a", 3: "c"}) and input == {3: "c", 1: "a"}
+    with pytest.raises(IndexError):
+        input[2]
+    assert isinstance(input.get_fr(2).value, IndexError)
+
+
+def test_sortedxdict_empty_bounds() -> None:
+    input = SortedXdict[int, str]({})
+    assert input.first() == Xopt.Empty and input.last() == Xopt.Empty
+    assert input.floor(1) == Xopt.Empty and input.ceiling(1) == Xopt.Empty
+    assert input.range(0, 10).to_Xlist() == Xlist([])
+
+
+@given(st_dict, st_keys, st_keys)
+def test_sortedxdict_ordered_queries(input, lo, hi) -> None:
+    sorted_xdict = SortedXdict(input)
+    items = sorted(input.items())
+    keys = [key for key, _ in items]
+    assert sorted_xdict.first() == (Xopt.Some(items[0]) if items else Xopt.Empty)
+    assert sorted_xdict.last() == (Xopt.Some(items[-1]) if items else Xopt.Empty)
+    floor = bisect_right(keys, lo) - 1
+    assert sorted_xdict.floor(lo) == (
+        Xopt.Some(items[floor]) if floor >= 0 else Xopt.Empty
+    )
+    ceiling = bisect_left(keys, lo)
+    assert sorted_xdict.ceiling(lo) == (
+        Xopt.Some(items[ceiling]) if ceiling < len(items) else Xopt.Empty
+    )
+    expected = Xlist([(key, value) for key, value in items if lo <= key < hi])
+    assert sorted_xdict.range(lo, hi).to_Xlist() == expected
+    assert sorted_xdict.range(lo=lo).to_Xlist() == Xlist(
+        [item for item in items if item[0] >= lo]
+    )
+    assert sorted_xdict.range(hi=hi).to_Xlist() == Xlist(
+        [item for item in items if item[0] < hi]
+    )
+
+
+@given(
+    st.lists(
+        st.tuples(st.integers(0, 3000), st.integers() | st.none()),
+        max_size=300,
+    )
+)
+def test_sortedxdict_updates_should_keep_versions(operations) -> None:
+    sorted_xdict = SortedXdict({i: i for i in range(0, 3000, 2)})
+    expected = {i: i for i in range(0, 3000, 2)}
+    versions = [(sorted_xdict, dict(expected))]
+    for key, value in operations:
+        if value is None:
+            sorted_xdict = sorted_xdict.removed(key)
+            expected.pop(key, None)
+        else:
+            sorted_xdict = sorted_xdict.updated(key, value)
+            expected[key] = value
+        versions.append((sorted_xdict, dict(expected)))
+    for version, version_expected in versions:
+        assert list(version) == sorted(version_expected.items())
+        assert len(version) == len(version_expected)
+        assert all(version[key] == value for key, value in version_expected.items())
+        assert version.ceiling(1500) == Xopt.from_optional(
+            min(
+                (item for item in version_expected.items() if item[0] >= 1500),
+                default=None,
+            )
+        )
+
+
+def test_sortedxdict_updates_should_split_chunks() -> None:
+    sorted_xdict = SortedXdict[int, int]({})
+    for i in reversed(range(5000)):
+        sorted_xdict = sorted_xdict.updated(i, i)
+    assert list(sorted_xdict.keys()) == list(range(5000))
+    assert sorted_xdict.floor(2500) == Xopt.Some((2500, 2500))
+    for i in range(5000):
+        sorted_xdict = sorted_xdict.removed(i)
+    assert len(sorted_xdict) == 0 and sorted_xdict.first() == Xopt.Empty
+
+
+def test_sortedxdict_combinators() -> None:
+    input = SortedXdict({3: "c", 1: "a", 2: "b"})
+    assert list(input.map(lambda y, x: (-y, x * 2))) == [
+        (-3, "cc"),
+        (-2, "bb"),
+        (-1, "aa"),
+    ]
+    assert list(input.map_values(str.upper)) == [(1, "A"), (2, "B"), (3, "C")]
+    assert list(input.filter(lambda y, _: y != 2)) == [(1, "a"), (3, "c")]
+    assert input.filter(lambda y, _: y != 2).floor(2) == Xopt.Some((1, "a"))
+    assert list(input.union({0: "z", 2: "y"})) == [
+        (0, "z"),
+        (1, "a"),
+        (2, "y"),
+        (3, "c"),
+    ]
+    visited: list[tuple[int, str]] = []
+    input.foreach(lambda y, x: visited.append((y, x)))
+    assert visited == list(input)
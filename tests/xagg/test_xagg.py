@@ -0,0 +1,92 @@
+import statistics
+
+import pytest
+from xfp import Xagg, Xdict, Xiter, Xlist, Xopt
+
+
+def test_xagg_builtins() -> None:
+    input = [3, 1, 4, 1, 5, 9, 2, 6]
+    actual = Xlist(input).aggregate(
+        count=Xagg.count(),
+        sum=Xagg.sum(),
+        min=Xagg.min(),
+        max=Xagg.max(),
+        mean=Xagg.mean(),
+    )
+    assert actual == Xdict(
+        {
+            "count": 8,
+            "sum": 31,
+            "min": Xopt.Some(1),
+            "max": Xopt.Some(9),
+            "mean": Xopt.Some(31 / 8),
+        }
+    )
+
+
+def test_xagg_variance() -> None:
+    input = [2.5, 3.0, 10.25, -4.0, 7.5]
+    actual = Xlist(input).aggregate(pvar=Xagg.variance(), svar=Xagg.variance(ddof=1))
+    assert actual.get("pvar").value == pytest.approx(statistics.pvariance(input))
+    assert actual.get("svar").value == pytest.approx(statistics.variance(input))
+
+
+def test_xagg_empty() -> None:
+    actual = Xlist[int]([]).aggregate(
+        count=Xagg.count(),
+        sum=Xagg.sum(),
+        min=Xagg.min(),
+        max=Xagg.max(),
+        mean=Xagg.mean(),
+        variance=Xagg.variance(),
+    )
+    assert actual == Xdict(
+        {
+            "count": 0,
+            "sum": 0,
+            "min": Xopt.Empty,
+            "max": Xopt.Empty,
+            "mean": Xopt.Empty,
+            "variance": Xopt.Empty,
+        }
+    )
+    assert Xlist([1]).aggregate(v=Xagg.variance(ddof=1)) == Xdict({"v": Xopt.Empty})
+
+
+def test_xagg_min_max_with_falsy_elements() -> None:
+    actual = Xlist([0, -1, 0]).aggregate(min=Xagg.min(), max=Xagg.max())
+    assert actual == Xdict({"min": Xopt.Some(-1), "max": Xopt.Some(0)})
+
+
+def test_xagg_user_defined() -> None:
+    longest: Xagg[str, str, str] = Xagg(
+        "", lambda acc, el: el if len(el) > len(acc) else acc
+    )
+    distinct: Xagg[frozenset[str], str, int] = Xagg(
+        frozenset[str](), lambda acc, el: acc | {el}, len
+    )
+    actual = Xlist(["a", "ccc", "bb", "a"]).aggregate(
+        longest=longest, distinct=distinct
+    )
+    assert actual == Xdict({"longest": "ccc", "distinct": 3})
+
+
+def test_xiter_aggregate_single_pass() -> None:
+    pulled = 0
+
+    def source() -> Xiter[int]:
+        def gen():
+            nonlocal pulled
+            for i in range(10):
+                pulled += 1
+                yield i
+
+        return Xiter(gen())
+
+    actual = source().aggregate(count=Xagg.count(), sum=Xagg.sum(), max=Xagg.max())
+    assert actual == Xdict({"count": 10, "sum": 45, "max": Xopt.Some(9)})
+    assert pulled == 10
+
+
+def test_aggregate_without_aggregators() -> None:
+    assert Xiter([1, 2]).aggregate() == Xdict({})
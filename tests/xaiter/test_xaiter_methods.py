@@ -0,0 +1,162 @@
+import asyncio
+import itertools
+import time
+from typing import AsyncIterator
+
+import pytest
+from xfp import Xaiter, Xiter, Xlist
+
+
+async def agen(n: int) -> AsyncIterator[int]:
+    for i in range(n):
+        await asyncio.sleep(0)
+        yield i
+
+
+async def double(x: int) -> int:
+    await asyncio.sleep(0)
+    return x * 2
+
+
+def run[T](xaiter: Xaiter[T]) -> Xlist[T]:
+    return asyncio.run(xaiter.to_Xlist())
+
+
+def test_xaiter__init__not_iterable() -> None:
+    with pytest.raises(TypeError):
+        Xaiter(123)  # type: ignore
+
+
+def test_xaiter_from_iterable() -> None:
+    assert run(Xaiter([1, 2, 3])) == Xlist([1, 2, 3])
+
+
+def test_xaiter_from_async_generator() -> None:
+    assert run(Xaiter(agen(3))) == Xlist([0, 1, 2])
+
+
+def test_xaiter_from_xiter() -> None:
+    assert run(Xaiter(Xiter(range(3)))) == Xlist([0, 1, 2])
+
+
+def test_xaiter_anext() -> None:
+    async def main() -> None:
+        input = Xaiter(agen(3))
+        assert await anext(input) == 0
+        assert await anext(input) == 1
+
+    asyncio.run(main())
+
+
+def test_xaiter_map_sync() -> None:
+    assert run(Xaiter(agen(3)).map(lambda x: x + 1)) == Xlist([1, 2, 3])
+
+
+def test_xaiter_map_async() -> None:
+    assert run(Xaiter(agen(3)).map(double)) == Xlist([0, 2, 4])
+
+
+def test_xaiter_map_concurrency_keeps_order() -> None:
+    async def wait_inverse(x: int) -> int:
+        await asyncio.sleep((5 - x) / 100)
+        return x
+
+    assert run(Xaiter(range(5)).map(wait_inverse, concurrency=5)) == Xlist(range(5))
+
+
+def test_xaiter_map_concurrency_overlaps_waits() -> None:
+    async def wait(x: int) -> int:
+        await asyncio.sleep(0.05)
+        return x
+
+    start = time.perf_counter()
+    actual = run(Xaiter(range(20)).map(wait, concurrency=20))
+    elapsed = time.perf_counter() - start
+
+    assert actual == Xlist(range(20))
+    assert elapsed < 0.5
+
+
+def test_xaiter_map_concurrency_is_bounded() -> None:
+    running = 0
+    peak = 0
+
+    async def track(x: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return x
+
+    run(Xaiter(range(20)).map(track, concurrency=3))
+    assert peak == 3
+
+
+def test_xaiter_map_invalid_concurrency() -> None:
+    with pytest.raises(ValueError):
+        Xaiter([1]).map(double, concurrency=0)
+
+
+def test_xaiter_filter() -> None:
+    async def is_even(x: int) -> bool:
+        return x % 2 == 0
+
+    assert run(Xaiter(agen(6)).filter(is_even)) == Xlist([0, 2, 4])
+    assert run(Xaiter(agen(6)).filter(lambda x: x > 3)) == Xlist([4, 5])
+
+
+def test_xaiter_flatten() -> None:
+    assert run(Xaiter([[1, 2], [3]]).flatten()) == Xlist([1, 2, 3])
+    assert run(Xaiter([agen(2), agen(1)]).flatten()) == Xlist([0, 1, 0])
+
+
+def test_xaiter_flat_map() -> None:
+    actual = run(Xaiter([1, 2]).flat_map(lambda x: [x, x**2]))
+    assert actual == Xlist([1, 1, 2, 4])
+
+
+def test_xaiter_take() -> None:
+    infinite = Xaiter(itertools.count())
+    assert run(infinite.take(3)) == Xlist([0, 1, 2])
+    assert run(Xaiter(agen(3)).take(-1)) == Xlist([])
+
+
+def test_xaiter_takewhile() -> None:
+    infinite = Xaiter(itertools.count())
+    assert run(infinite.takewhile(lambda x: x < 3)) == Xlist([0, 1, 2])
+
+
+def test_xaiter_chain() -> None:
+    assert run(Xaiter(agen(2)).chain([5])) == Xlist([0, 1, 5])
+
+
+def test_xaiter_zip() -> None:
+    assert run(Xaiter(agen(3)).zip(agen(2))) == Xlist([(0, 0), (1, 1)])
+    assert run(Xaiter(agen(2)).zip(["a", "b", "c"])) == Xlist([(0, "a"), (1, "b")])
+
+
+def test_xaiter_fold() -> None:
+    async def add(acc: str, el: int) -> str:
+        return acc + str(el)
+
+    assert asyncio.run(Xaiter(agen(3)).fold("a", add)) == "a012"
+    assert asyncio.run(Xaiter(agen(3)).fold_left(0, lambda x, y: x + y)) == 3
+
+
+def test_xaiter_foreach() -> None:
+    out: list[int] = []
+    asyncio.run(Xaiter(agen(3)).foreach(out.append))
+    assert out == [0, 1, 2]
+
+
+def test_xaiter_to_xiter() -> None:
+    actual = Xaiter(agen(3)).map(double).to_Xiter()
+    assert isinstance(actual, Xiter)
+    assert actual.to_Xlist() == Xlist([0, 2, 4])
+
+
+def test_xaiter_to_xiter_partial_consumption() -> None:
+    actual = Xaiter(agen(100)).to_Xiter()
+    assert next(actual) == 0
+    assert next(actual) == 1
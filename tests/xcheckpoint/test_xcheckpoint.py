@@ -0,0 +1,95 @@
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+from xfp import Xcheckpoint, Xiter
+
+
+class Crash(Exception):
+    pass
+
+
+def crashing_at(n: int, f: Callable[..., Any]) -> Callable[..., Any]:
+    calls = 0
+
+    def result(*args: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        if calls == n:
+            raise Crash()
+        return f(*args)
+
+    return result
+
+
+def test_xcheckpoint_fold_lines(tmp_path: Path) -> None:
+    source = tmp_path / "data.txt"
+    source.write_text("".join(f"{i}\n" for i in range(100)))
+    path = tmp_path / "job.ckpt"
+
+    def job(f: Callable[[int, int], int]) -> int:
+        checkpoint = Xcheckpoint(path, every=10)
+        return checkpoint.fold(
+            checkpoint.lines(source).map(int).filter(lambda x: x % 2 == 0), 0, f
+        )
+
+    with pytest.raises(Crash):
+        job(crashing_at(25, lambda acc, el: acc + el))
+    assert path.exists() and Xcheckpoint(path).resumed()
+
+    processed: list[int] = []
+
+    def add(acc: int, el: int) -> int:
+        processed.append(el)
+        return acc + el
+
+    assert job(add) == sum(range(0, 100, 2))
+    assert processed == list(range(40, 100, 2))
+    assert not path.exists()
+
+
+def test_xcheckpoint_lines_endings(tmp_path: Path) -> None:
+    source = tmp_path / "data.txt"
+    source.write_bytes("é\r\nb\nc".encode())
+    checkpoint = Xcheckpoint(tmp_path / "job.ckpt")
+    assert checkpoint.fold(checkpoint.lines(source), "", str.__add__) == "ébc"
+
+
+def test_xcheckpoint_foreach_rows(tmp_path: Path) -> None:
+    path = tmp_path / "job.ckpt"
+    out: list[int] = []
+
+    def job(statement: Callable[[int], Any]) -> None:
+        checkpoint = Xcheckpoint(path, every=3)
+        checkpoint.foreach(checkpoint.rows(range(10)).map(lambda x: x * 10), statement)
+
+    with pytest.raises(Crash):
+        job(crashing_at(8, out.append))
+    assert out == [0, 10, 20, 30, 40, 50, 60]
+
+    job(out.append)
+    # elements processed after the last save are processed again
+    assert out == [0, 10, 20, 30, 40, 50, 60, 60, 70, 80, 90]
+
+
+def test_xcheckpoint_without_source(tmp_path: Path) -> None:
+    path = tmp_path / "job.ckpt"
+    with pytest.raises(Crash):
+        Xcheckpoint(path, every=4).fold(
+            Xiter(range(10)), [], crashing_at(7, lambda acc, el: acc + [el])
+        )
+    checkpoint = Xcheckpoint(path, every=4)
+    assert checkpoint.resumed()
+    assert checkpoint.fold(
+        Xiter(range(10)), list[int](), lambda acc, el: acc + [el]
+    ) == list(range(10))
+    assert not checkpoint.resumed()
+
+
+def test_xcheckpoint_invalid(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        Xcheckpoint(tmp_path / "job.ckpt", every=0)
+    checkpoint = Xcheckpoint(tmp_path / "job.ckpt")
+    checkpoint.rows([1])
+    with pytest.raises(ValueError):
+        checkpoint.rows([2])
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+import operator
+from typing import Any
 from hypothesis import assume, given, strategies as st
 import pytest
 
@@ -143,16 +146,14 @@ def test_map_should_keep_only_one_key_if_collision() -> None:
     assert len(transformations.head()) == 1
 
 
-def test_map_keys_proxy_map(mocker) -> None:
-    patch = mocker.patch("xfp.Xdict.map")
-    Xdict({"a": 1}).map_keys(lambda k: k)
-    assert patch.called
+@given(st_xdict)
+def test_map_keys_should_match_map(xdict) -> None:
+    assert xdict.map_keys(str.upper) == xdict.map(lambda y, x: (y.upper(), x))
 
 
-def test_map_values_proxy_map(mocker):
-    patch = mocker.patch("xfp.Xdict.map")
-    Xdict({"a": 1}).map_values(lambda k: k)
-    assert patch.called
+@given(st_xdict)
+def test_map_values_should_match_map(xdict) -> None:
+    assert xdict.map_values(lambda x: x * 2) == xdict.map(lambda y, x: (y, x * 2))
 
 
 def test_filter_should_keep_true_predicate():
@@ -208,3 +209,325 @@ def test_foreach_values_proxy_foreach(mocker):
     patch = mocker.patch("xfp.Xdict.foreach")
     Xdict({"a": 1}).foreach_values(lambda k: print(k))
     assert patch.called
+
+
+def test_lookups_should_use_key_equality() -> None:
+    key = "".join(["k", "e", "y"])
+    input = Xdict({"key": 1, (1, 2): 2})
+    assert key in input
+    assert input[key] == 1
+    assert input.get((1, 2)) == 2
+
+
+def test_lookups_of_unhashable_keys_should_not_be_found() -> None:
+    input = Xdict({"a": 1})
+    assert [] not in input
+    with pytest.raises(IndexError):
+        input.get([])  # type: ignore
+
+
+class CollidingKey:
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return self.value % 3
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CollidingKey) and other.value == self.value
+
+
+@given(
+    st_dict,
+    st.lists(st.tuples(st.booleans(), st.text(max_size=2), st.integers()), max_size=50),
+)
+def test_successive_updates_should_keep_previous_versions(
+    initial: dict[str, int], operations: list[tuple[bool, str, int]]
+) -> None:
+    versions = [(Xdict(initial), dict(initial))]
+    for is_update, key, value in operations:
+        xdict, expected = versions[-1]
+        expected = dict(expected)
+        if is_update:
+            expected[key] = value
+            xdict = xdict.updated(key, value)
+        else:
+            expected.pop(key, None)
+            xdict = xdict.removed(key)
+        versions.append((xdict, expected))
+    for xdict, expected in versions:
+        assert xdict == Xdict(expected)
+        assert len(xdict) == len(expected)
+        assert all(xdict[key] == value for key, value in expected.items())
+
+
+def test_updates_should_handle_hash_collisions() -> None:
+    input = Xdict({CollidingKey(i): i for i in range(10)})
+    updated = input.updated(CollidingKey(3), 30).removed(CollidingKey(4))
+    assert updated[CollidingKey(3)] == 30
+    assert CollidingKey(4) not in updated
+    assert len(updated) == 9
+    assert input[CollidingKey(3)] == 3 and CollidingKey(4) in input
+
+
+def test_removed_should_use_key_equality() -> None:
+    key = "".join(["k", "e", "y"])
+    assert Xdict({"key": 1, "b": 2}).removed(key) == Xdict({"b": 2})
+    assert Xdict({"b": 2}).removed([]) == Xdict({"b": 2})  # type: ignore
+
+
+def test_builder_should_build_a_dict_backed_xdict() -> None:
+    with Xdict.builder() as builder:
+        for i in range(3):
+            builder[f"key{i}"] = i
+        del builder["key1"]
+    assert builder.freeze() == Xdict({"key0": 0, "key2": 2})
+    assert builder.freeze() is builder.freeze()
+
+
+@given(st_dict, st.lists(st.tuples(st.text(), st.integers() | st.none())))
+def test_transient_should_not_alter_the_original(input, operations) -> None:
+    for original in (Xdict(input), Xdict(input).updated("", 0)):
+        expected = dict(original.items())
+        snapshot = dict(original.items())
+        transient = original.transient()
+        for key, value in operations:
+            if value is None:
+                if key in expected:
+                    del expected[key]
+                    del transient[key]
+            else:
+                expected[key] = value
+                transient[key] = value
+        assert len(transient) == len(expected)
+        assert transient.freeze() == Xdict(expected)
+        assert original == Xdict(snapshot)
+
+
+def test_transient_should_fail_on_missing_key() -> None:
+    transient = Xdict({"a": 1}).updated("b", 2).transient()
+    with pytest.raises(IndexError):
+        del transient["c"]
+    with pytest.raises(IndexError):
+        transient["c"]
+    assert "a" in transient and [] not in transient and transient.get("c") is None
+
+
+def test_transient_should_not_be_mutated_once_frozen() -> None:
+    with Xdict({"a": 1}).transient() as transient:
+        transient["b"] = 2
+    with pytest.raises(RuntimeError):
+        transient["c"] = 3
+    assert transient.freeze() == Xdict({"a": 1, "b": 2})
+
+
+def test_transient_should_not_be_mutated_by_another_thread() -> None:
+    transient = Xdict.builder()
+    with ThreadPoolExecutor(1) as executor:
+        error = executor.submit(transient.__setitem__, "a", 1).exception()
+    assert isinstance(error, RuntimeError)
+    assert len(transient) == 0
+
+
+@given(st_dict, st_dict, st.lists(st.text()))
+def test_bulk_updates_should_match_successive_updates(input, changes, keys) -> None:
+    original = Xdict(input)
+    updated = original
+    for key, value in changes.items():
+        updated = updated.updated(key, value)
+    removed = original
+    for key in keys:
+        removed = removed.removed(key)
+    assert original.updated_all(changes) == updated
+    assert original.removed_all(keys) == removed
+    assert original == Xdict(input)
+
+
+def test_removed_all_should_use_key_equality() -> None:
+    key = "".join(["k", "e", "y"])
+    input = Xdict({"key": 1, "b": 2})
+    assert input.removed_all([key, []]) == Xdict({"b": 2})  # type: ignore
+    assert input.removed_all([]) == input
+
+
+@given(st_dict)
+def test_views_should_support_len_and_in(input) -> None:
+    for xdict in (Xdict(input), Xdict(input).updated("", 0)):
+        expected = dict(xdict.items())
+        assert (
+            len(xdict.keys())
+            == len(xdict.values())
+            == len(xdict.items())
+            == len(expected)
+        )
+        assert all(key in xdict.keys() for key in expected)
+        assert all(value in xdict.values() for value in expected.values())
+        assert all(item in xdict.items() for item in expected.items())
+        assert ("", None) not in xdict.items() and [] not in xdict.keys()
+
+
+def test_views_should_be_lazy_and_not_copy() -> None:
+    calls: list[int] = []
+
+    def times_ten(x: int) -> int:
+        calls.append(x)
+        return x * 10
+
+    view = Xdict({"a": 1, "b": 2}).values()
+    mapped = view.map(times_ten)
+    assert calls == []
+    assert sorted(mapped) == [10, 20]
+    assert view.filter(lambda x: x > 1).to_Xlist() == Xlist([2])
+    assert view.fold(0, lambda acc, x: acc + x) == 3
+    assert view.sorted(reverse=True) == Xlist([2, 1])
+    assert view.max() == 2 and view.min() == 1
+
+
+def test_views_should_be_iterated_several_times() -> None:
+    keys = Xdict({"a": 1}).updated("b", 2).keys()
+    assert sorted(keys) == sorted(keys) == ["a", "b"]
+
+
+def test_eq_should_handle_unhashable_values() -> None:
+    input = Xdict({"a": [1, 2], "b": {"c": Xlist([3])}})
+    assert input == Xdict({"b": {"c": Xlist([3])}, "a": [1, 2]})
+    assert input == {"a": [1, 2], "b": {"c": Xlist([3])}}
+    assert input != Xdict({"a": [1, 2], "b": {"c": Xlist([4])}})
+    assert input != Xdict({"a": [1, 2]})
+
+
+@given(st_dict, st_dict)
+def test_eq_should_match_dict_eq(left, right) -> None:
+    assert (Xdict(left) == Xdict(right)) == (left == right)
+    assert (Xdict(left).updated("", 0) == right) == ({**left, "": 0} == right)
+
+
+@given(st_dict)
+def test_hash_should_be_structural(input) -> None:
+    xdict = Xdict(input)
+    rebuilt = Xdict(dict(reversed(list(input.items())))).updated("", 0).removed("")
+    if "" in input:
+        rebuilt = rebuilt.updated("", input[""])
+    assert hash(xdict) == hash(rebuilt) == hash(xdict)
+    assert len({xdict, rebuilt}) == 1
+
+
+def test_hashed_xdicts_with_different_hashes_should_differ() -> None:
+    left, right = Xdict({"a": 1}), Xdict({"a": 2})
+    assert hash(left) != hash(right)
+    assert left != right
+    with pytest.raises(TypeError):
+        hash(Xdict({"a": []}))
+
+
+@given(
+    st_dict,
+    st.lists(
+        st.sampled_from(["map", "map_values", "filter_keys", "filter_values", "filter"])
+    ),
+)
+def test_transformation_chains_should_match_successive_dicts(input, kinds) -> None:
+    transformations = {
+        "map": (
+            lambda xd: xd.map(lambda y, x: (y[:3], x + 1)),
+            lambda d: {y[:3]: x + 1 for y, x in d.items()},
+        ),
+        "map_values": (
+            lambda xd: xd.map_values(lambda x: x * 2),
+            lambda d: {y: x * 2 for y, x in d.items()},
+        ),
+        "filter_keys": (
+            lambda xd: xd.filter_keys(lambda y: len(y) % 2 == 0),
+            lambda d: {y: x for y, x in d.items() if len(y) % 2 == 0},
+        ),
+        "filter_values": (
+            lambda xd: xd.filter_values(lambda x: x % 3 != 0),
+            lambda d: {y: x for y, x in d.items() if x % 3 != 0},
+        ),
+        "filter": (
+            lambda xd: xd.filter(lambda y, x: len(y) < x),
+            lambda d: {y: x for y, x in d.items() if len(y) < x},
+        ),
+    }
+    xdict, expected = Xdict(input), input
+    for kind in kinds:
+        transform, transform_dict = transformations[kind]
+        xdict, expected = transform(xdict), transform_dict(expected)
+    assert xdict == Xdict(expected)
+
+
+def test_transformations_should_be_eager() -> None:
+    calls: list[str] = []
+
+    def traced(name: str, result: Any) -> Any:
+        calls.append(name)
+        return result
+
+    mapped = Xdict({"a": 1, "b": 2}).map_values(lambda x: traced("map", x * 10))
+    assert calls == ["map", "map"]
+    assert mapped.filter_values(lambda x: traced("filter", x > 10)) == Xdict({"b": 20})
+    assert calls == ["map", "map", "filter", "filter"]
+
+
+def test_transformation_errors_should_be_raised_on_call() -> None:
+    actual = Xtry.from_unsafe(lambda: Xdict({"a": 1}).map_values(lambda x: x / 0))
+    assert isinstance(actual.value, ZeroDivisionError)
+
+
+def test_transformation_chains_should_be_fused_through_items() -> None:
+    calls: list[str] = []
+
+    def traced(name: str, result: Any) -> Any:
+        calls.append(name)
+        return result
+
+    fused = Xdict.from_list(
+        Xdict({"a": 1, "b": 2})
+        .items()
+        .map(lambda item: (item[0], traced("map", item[1] * 10)))
+        .filter(lambda item: traced("filter", item[1] > 10))
+    )
+    assert fused == Xdict({"b": 20})
+    assert calls == ["map", "filter", "map", "filter"]
+
+
+def concat_merge(left: dict[str, str], right: dict[str, str]) -> dict[str, str]:
+    return {
+        **left,
+        **right,
+        **{key: left[key] + right[key] for key in left.keys() & right.keys()},
+    }
+
+
+st_str_dict = st.dictionaries(st.text(max_size=2), st.text(max_size=2))
+
+
+@given(st_str_dict, st_str_dict)
+def test_merge_with_should_combine_common_keys_in_order(left, right) -> None:
+    expected = Xdict(concat_merge(left, right))
+    assert Xdict(left).merge_with(right, operator.add) == expected
+    assert (
+        Xdict[str, str]({}).updated_all(left).merge_with(right, operator.add)
+        == expected
+    )
+
+
+def test_merge_with_should_share_the_side_without_changes() -> None:
+    input = Xdict({"a": 1})
+    assert input.merge_with(Xdict({}), operator.add) is input
+    assert Xdict[str, int]({}).merge_with(input, operator.add) is input
+
+
+@given(st.lists(st_str_dict, max_size=9))
+def test_merge_all_should_combine_dicts_in_order(dicts) -> None:
+    expected: dict[str, str] = {}
+    for d in dicts:
+        expected = concat_merge(expected, d)
+    assert Xdict.merge_all(dicts, operator.add) == Xdict(expected)
+
+
+def test_merge_all_should_merge_on_workers() -> None:
+    shards = [Xdict({f"word{i % 7}": 1, f"shard{i}": i}) for i in range(20)]
+    expected = Xdict.merge_all(shards, operator.add)
+    assert Xdict.merge_all(shards, operator.add, workers=2) == expected
+    assert expected[f"word{0}"] == 3 and len(expected) == 27
@@ -1,4 +1,7 @@
-from typing import Any, Generator, NoReturn
+from pathlib import Path
+from typing import Any, Generator, NoReturn, cast
+
+import pytest
 from xfp.xiter import Xiter
 
 
@@ -20,3 +23,116 @@ def test_xiter_from_generator() -> None:
 
     expected = [2, 4, 6, 8, 10, 12, 14, 16, 18, 20]
     assert out == expected
+
+
+def test_xiter_from_lines(tmp_path: Path) -> None:
+    path = tmp_path / "lines.txt"
+    path.write_bytes("a\nbé\r\nc".encode("utf-8"))
+
+    assert list(Xiter.from_lines(path)) == ["a", "bé", "c"]
+    assert list(Xiter.from_lines(path, keepends=True)) == ["a\n", "bé\n", "c"]
+    assert list(Xiter.from_lines(path, raw=True)) == [b"a", "bé\r".encode(), b"c"]
+
+
+def test_xiter_from_lines_is_lazy(tmp_path: Path) -> None:
+    lines = Xiter.from_lines(tmp_path / "missing.txt")
+    with pytest.raises(FileNotFoundError):
+        next(lines)
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_xiter_from_records(tmp_path: Path, mmap: bool) -> None:
+    path = tmp_path / "records.txt"
+    path.write_bytes("a;bé;;c;".encode("utf-8"))
+
+    actual = Xiter.from_records(path, ";", buffer_size=2, mmap=mmap)
+    assert list(actual) == ["a", "bé", "", "c"]
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_xiter_from_records_raw(tmp_path: Path, mmap: bool) -> None:
+    path = tmp_path / "records.txt"
+    path.write_bytes(b"ab||cd||e")
+
+    actual = Xiter.from_records(path, b"||", buffer_size=3, raw=True, mmap=mmap)
+    assert [bytes(cast(bytes, record)) for record in actual] == [b"ab", b"cd", b"e"]
+
+
+def test_xiter_from_records_mmap_yields_views(tmp_path: Path) -> None:
+    path = tmp_path / "records.txt"
+    path.write_bytes(b"ab\ncd")
+
+    actual = Xiter.from_records(path, raw=True, mmap=True)
+    assert isinstance(next(actual), memoryview)
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_xiter_from_records_empty_file(tmp_path: Path, mmap: bool) -> None:
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    assert list(Xiter.from_records(path, mmap=mmap)) == []
+
+
+def test_xiter_from_records_empty_delimiter(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        Xiter.from_records(tmp_path / "any.txt", b"")
+
+
+def test_xiter_from_csv(tmp_path: Path) -> None:
+    path = tmp_path / "sales.csv"
+    path.write_text('ean;amount;label\n1;10;"a;b"\n2;20;c\n')
+
+    actual = Xiter.from_csv(path, delimiter=";")
+    assert list(actual) == [
+        {"ean": "1", "amount": "10", "label": "a;b"},
+        {"ean": "2", "amount": "20", "label": "c"},
+    ]
+
+
+def test_xiter_from_csv_projects_columns(tmp_path: Path) -> None:
+    path = tmp_path / "sales.csv"
+    path.write_text("ean,amount,label\n1,10,a\n2,20,b\n")
+
+    actual = Xiter.from_csv(path, columns=["label", "ean"])
+    assert list(actual) == [{"label": "a", "ean": "1"}, {"label": "b", "ean": "2"}]
+
+
+def test_xiter_from_csv_blank_and_short_rows(tmp_path: Path) -> None:
+    path = tmp_path / "sales.csv"
+    path.write_text("a,b\n1,2\n\n3\n4,5\n")
+
+    assert list(Xiter.from_csv(path)) == [
+        {"a": "1", "b": "2"},
+        {"a": "3", "b": None},
+        {"a": "4", "b": "5"},
+    ]
+    assert list(Xiter.from_csv(path, columns=["b"])) == [
+        {"b": "2"},
+        {"b": None},
+        {"b": "5"},
+    ]
+
+
+def test_xiter_from_csv_unknown_column(tmp_path: Path) -> None:
+    path = tmp_path / "sales.csv"
+    path.write_text("ean,amount\n1,10\n")
+
+    with pytest.raises(KeyError):
+        next(Xiter.from_csv(path, columns=["price"]))
+
+
+def test_xiter_from_csv_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "empty.csv"
+    path.write_text("")
+
+    assert list(Xiter.from_csv(path)) == []
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_xiter_from_jsonl(tmp_path: Path, workers: int) -> None:
+    path = tmp_path / "events.jsonl"
+    path.write_text("".join(f'{{"id": {i}}}\n' for i in range(25)) + "\n")
+
+    actual = Xiter.from_jsonl(path, batch_size=4, workers=workers)
+    assert list(actual) == [{"id": i} for i in range(25)]
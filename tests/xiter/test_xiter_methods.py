@@ -1,9 +1,16 @@
 from dataclasses import dataclass
+from datetime import date, timedelta
 import itertools
-from typing import Never
-
+import operator
+from pathlib import Path
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Generator, Iterator, Never, cast
+
+from hypothesis import given, strategies as st
 import pytest
-from xfp import XRBranch, Xeither, Xiter, Xlist
+from xfp import XRBranch, Xdict, Xeither, Xiter, Xlist, Xopt
 from xfp.functions import tupled2
 from xfp.xresult._xresult import Xresult
 
@@ -295,3 +302,619 @@ def test_xiter_zip() -> None:
     in2 = Xiter([4, 5])
     assert compare(in1.zip(in2), Xiter([(1, 4), (2, 5)]))
     assert compare(in2.zip(in1), in1.zip(in2).map(tupled2(lambda x, y: (y, x))))
+
+
+def test_xiter_prefetch() -> None:
+    input = Xiter(range(100))
+    assert compare(input.prefetch(10), Xiter(range(100)))
+    assert next(input) == 0
+
+
+def test_xiter_prefetch_propagates_errors() -> None:
+    def failing() -> Iterator[int]:
+        yield 1
+        raise ValueError("boom")
+
+    actual = Xiter(failing()).prefetch(5)
+    assert next(actual) == 1
+    with pytest.raises(ValueError, match="boom"):
+        next(actual)
+
+
+def test_xiter_prefetch_is_bounded() -> None:
+    pulled = []
+
+    def source() -> Iterator[int]:
+        for i in itertools.count():
+            pulled.append(i)
+            yield i
+
+    actual = Xiter(source()).prefetch(3)
+    assert next(actual) == 0
+    time.sleep(0.05)
+    # the consumed element, the buffer, and the one waiting to be put
+    assert len(pulled) <= 5
+
+
+def test_xiter_prefetch_stops_thread_when_closed() -> None:
+    actual = Xiter(itertools.count()).prefetch(2)
+    iterator = iter(actual)
+    assert next(iterator) == 0
+    cast(Generator, iterator).close()
+    assert not any(t.name == "xiter-prefetch" for t in threading.enumerate())
+
+
+def test_xiter_prefetch_invalid_parameters() -> None:
+    with pytest.raises(ValueError):
+        Xiter([1]).prefetch(0)
+    with pytest.raises(ValueError):
+        Xiter([1]).prefetch(1, executor="process")  # type: ignore
+
+
+def test_xiter_to_csv_mappings(tmp_path: Path) -> None:
+    path = tmp_path / "sales.csv"
+    Xiter([{"ean": 1, "amount": 10}, {"ean": 2, "amount": 20}]).to_csv(
+        path, batch_size=1
+    )
+
+    assert path.read_bytes() == b"ean,amount\r\n1,10\r\n2,20\r\n"
+    assert list(Xiter.from_csv(path)) == [
+        {"ean": "1", "amount": "10"},
+        {"ean": "2", "amount": "20"},
+    ]
+
+
+def test_xiter_to_csv_sequences(tmp_path: Path) -> None:
+    path = tmp_path / "sales.csv"
+    Xiter([(1, "a;b"), (2, "c")]).to_csv(path, columns=["ean", "label"], delimiter=";")
+
+    assert path.read_bytes() == b'ean;label\r\n1;"a;b"\r\n2;c\r\n'
+
+
+def test_xiter_to_csv_empty(tmp_path: Path) -> None:
+    path = tmp_path / "empty.csv"
+    Xiter([]).to_csv(path)
+
+    assert path.read_text() == ""
+
+
+def test_xiter_to_jsonl(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    input = [{"id": i, "tags": ["a"]} for i in range(5)]
+    Xiter(input).to_jsonl(path, batch_size=2)
+
+    assert len(path.read_text().splitlines()) == 5
+    assert list(Xiter.from_jsonl(path)) == input
+
+
+def xlists[X](*lists: list[X]) -> Xlist[Xlist[X]]:
+    return Xlist([Xlist(list_) for list_ in lists])
+
+
+def test_xiter_window_tumbling() -> None:
+    input = Xiter(range(5))
+    assert input.window_tumbling(2).to_Xlist() == xlists([0, 1], [2, 3], [4])
+    assert input.window_tumbling(5).to_Xlist() == xlists([0, 1, 2, 3, 4])
+    assert next(input) == 0
+
+
+def test_xiter_window_tumbling_key() -> None:
+    input = Xiter(
+        [
+            (date(2024, 4, 1), 10),
+            (date(2024, 4, 3), 20),
+            (date(2024, 4, 8), 30),
+            (date(2024, 4, 29), 40),
+        ]
+    )
+    actual = input.window_tumbling(
+        timedelta(days=7), key=lambda sale: sale[0], zero=0, f=lambda x, y: x + y[1]
+    )
+    assert actual.to_Xlist() == Xlist([30, 30, 40])
+
+
+def test_xiter_window_tumbling_infinite() -> None:
+    actual = Xiter(itertools.count()).window_tumbling(3, zero=0, f=lambda x, y: x + y)
+    assert actual.take(3).to_Xlist() == Xlist([3, 12, 21])
+
+
+def test_xiter_window_sliding() -> None:
+    input = Xiter(range(5))
+    assert input.window_sliding(3, 1).to_Xlist() == xlists(
+        [0, 1, 2], [1, 2, 3], [2, 3, 4]
+    )
+    assert input.window_sliding(3, 2).to_Xlist() == xlists([0, 1, 2], [2, 3, 4])
+    assert input.window_sliding(2, 2).to_Xlist() == xlists([0, 1], [2, 3], [4])
+    assert input.window_sliding(1, 2).to_Xlist() == xlists([0], [2], [4])
+    assert input.window_sliding(10, 1).to_Xlist() == xlists([0, 1, 2, 3, 4])
+    assert Xiter([]).window_sliding(2, 1).to_Xlist() == Xlist([])
+
+
+def test_xiter_window_sliding_key() -> None:
+    input = Xiter([0, 1, 2, 5, 9])
+    actual = input.window_sliding(4, 2, key=lambda x: x)
+    # windows [0, 4), [2, 6), [4, 8), [6, 10) and [8, 12)
+    assert actual.to_Xlist() == xlists([0, 1, 2], [2, 5], [5], [9], [9])
+
+
+def test_xiter_window_sliding_fold() -> None:
+    actual = Xiter(range(5)).window_sliding(3, 1, zero=0, f=lambda x, y: x + y)
+    assert actual.to_Xlist() == Xlist([3, 6, 9])
+
+
+def test_xiter_window_sliding_invalid() -> None:
+    with pytest.raises(ValueError):
+        Xiter([1]).window_sliding(0, 1)
+    with pytest.raises(ValueError):
+        Xiter([1]).window_sliding(1, timedelta(0))
+
+
+def test_xiter_window_session() -> None:
+    input = Xiter([1, 2, 5, 6, 7, 10])
+    assert input.window_session(1).to_Xlist() == xlists([1, 2], [5, 6, 7], [10])
+    assert input.window_session(3).to_Xlist() == xlists([1, 2, 5, 6, 7, 10])
+    assert Xiter([]).window_session(1).to_Xlist() == Xlist([])
+
+
+def test_xiter_window_session_key_fold() -> None:
+    input = Xiter([("a", 1), ("b", 2), ("c", 10)])
+    actual = input.window_session(
+        2, key=lambda x: x[1], zero="", f=lambda x, y: x + y[0]
+    )
+    assert actual.to_Xlist() == Xlist(["ab", "c"])
+
+
+def test_xiter_group_consecutive() -> None:
+    input = Xiter([1, 3, 2, 4, 5])
+    actual = input.group_consecutive(lambda x: x % 2)
+    expected = Xlist([(1, Xlist([1, 3])), (0, Xlist([2, 4])), (1, Xlist([5]))])
+    assert actual.to_Xlist() == expected
+    assert next(input) == 1
+
+
+def test_xiter_group_consecutive_infinite() -> None:
+    actual = Xiter(itertools.count()).group_consecutive(lambda x: x // 2)
+    assert actual.take(2).to_Xlist() == Xlist([(0, Xlist([0, 1])), (1, Xlist([2, 3]))])
+
+
+def test_xiter_group_aggregate() -> None:
+    input = Xiter(["a", "bb", "c", "dd", "eee"])
+    actual = input.group_aggregate(len, "", lambda acc, x: acc + x)
+    assert actual == Xdict({1: "ac", 2: "bbdd", 3: "eee"})
+
+
+def test_xiter_group_aggregate_empty() -> None:
+    assert Xiter[int]([]).group_aggregate(lambda x: x, 0, lambda x, y: x + y) == Xdict(
+        {}
+    )
+
+
+def test_xiter_distinct_exact() -> None:
+    input = Xiter([1, 2, 1, 3, 2])
+    assert input.distinct().to_Xlist() == Xlist([1, 2, 3])
+    assert next(input) == 1
+
+
+def test_xiter_distinct_compares_by_equality() -> None:
+    input = Xiter(["".join(["a", "b"]), "ab"])
+    assert input.distinct().to_Xlist() == Xlist(["ab"])
+
+
+def test_xiter_distinct_key() -> None:
+    input = Xiter(["a", "bb", "c", "dd"])
+    assert input.distinct(key=len).to_Xlist() == Xlist(["a", "bb"])
+
+
+def test_xiter_distinct_lru() -> None:
+    input = Xiter([1, 2, 1, 3, 1, 2])
+    assert input.distinct("lru", capacity=2).to_Xlist() == Xlist([1, 2, 3, 2])
+
+
+def test_xiter_distinct_bloom() -> None:
+    input = Xiter(range(10_000)).chain(range(10_000))
+    actual = input.distinct("bloom", capacity=10_000, error_rate=0.01).to_Xlist()
+    assert len(actual) == len(set(actual))
+    assert len(actual) > 9_800
+
+
+def test_xiter_distinct_is_lazy() -> None:
+    actual = Xiter(itertools.count()).map(lambda x: x // 2).distinct()
+    assert actual.take(3).to_Xlist() == Xlist([0, 1, 2])
+
+
+def test_xiter_distinct_reports_memory() -> None:
+    reports: list[int] = []
+    Xiter(range(1000)).distinct(
+        "bloom", capacity=1000, report=reports.append
+    ).to_Xlist()
+    Xiter(range(1000)).distinct(report=reports.append).to_Xlist()
+    assert len(reports) == 2
+    assert 1000 < reports[0] < 2000  # ~9.6 bits per element for 1% false positives
+    assert reports[1] > reports[0]
+
+
+def test_xiter_distinct_invalid_parameters() -> None:
+    with pytest.raises(ValueError):
+        Xiter([1]).distinct("cuckoo")  # type: ignore
+    with pytest.raises(ValueError):
+        Xiter([1]).distinct("lru", capacity=0)
+    with pytest.raises(ValueError):
+        Xiter([1]).distinct("bloom", error_rate=1)
+
+
+def test_xiter_merge_sorted() -> None:
+    input = Xiter([1, 4, 7])
+    actual = input.merge_sorted([2, 5], Xiter([3, 6, 8]))
+    assert actual.to_Xlist() == Xlist([1, 2, 3, 4, 5, 6, 7, 8])
+    assert next(input) == 1
+
+
+def test_xiter_merge_sorted_key_reverse() -> None:
+    actual = Xiter(["ccc", "a"]).merge_sorted(["bb", ""], key=len, reverse=True)
+    assert actual.to_Xlist() == Xlist(["ccc", "bb", "a", ""])
+
+
+def test_xiter_merge_sorted_infinite() -> None:
+    actual = Xiter(itertools.count(0, 2)).merge_sorted(itertools.count(1, 2))
+    assert actual.take(5).to_Xlist() == Xlist([0, 1, 2, 3, 4])
+
+
+def test_xiter_merge_join() -> None:
+    sales = Xiter([(1, 10), (1, 20), (3, 30), (4, 40)])
+    products = [(0, "pear"), (1, "apple"), (1, "red apple"), (3, "peach")]
+    actual = sales.merge_join(products, key=lambda x: x[0])
+    assert actual.to_Xlist() == Xlist(
+        [
+            ((1, 10), (1, "apple")),
+            ((1, 10), (1, "red apple")),
+            ((1, 20), (1, "apple")),
+            ((1, 20), (1, "red apple")),
+            ((3, 30), (3, "peach")),
+        ]
+    )
+    assert next(sales) == (1, 10)
+
+
+def test_xiter_merge_join_other_key() -> None:
+    actual = Xiter([1, 2, 3]).merge_join(["a", "ccc"], key=lambda x: x, other_key=len)
+    assert actual.to_Xlist() == Xlist([(1, "a"), (3, "ccc")])
+
+
+def test_xiter_merge_join_infinite() -> None:
+    evens = Xiter(itertools.count(0, 2))
+    actual = evens.merge_join(itertools.count(0, 3), key=lambda x: x)
+    assert actual.take(3).to_Xlist() == Xlist([(0, 0), (6, 6), (12, 12)])
+
+
+def test_xiter_scan_left() -> None:
+    input = Xiter(["b", "c"])
+    actual = input.scan_left("a", lambda acc, el: acc + el)
+    assert compare(actual, Xiter(["a", "ab", "abc"]))
+    assert next(input) == "b"
+
+
+def test_xiter_scan_left_infinite() -> None:
+    actual = Xiter(itertools.count(1)).scan_left(0, lambda x, y: x + y)
+    assert actual.take(4).to_Xlist() == Xlist([0, 1, 3, 6])
+
+
+def test_xiter_accumulate() -> None:
+    input = Xiter([4, 3, -1, 2])
+    assert compare(input.accumulate(lambda x, y: x + y), Xiter([4, 7, 6, 8]))
+    assert next(input) == 4
+
+
+def test_xiter_broadcast() -> None:
+    a, b, c = Xiter(range(5)).broadcast(3)
+    assert a.to_Xlist() == Xlist(range(5))
+    assert b.to_Xlist() == Xlist(range(5))
+    assert list(c) == list(range(5))
+
+
+def test_xiter_broadcast_lockstep() -> None:
+    a, b = Xiter(range(1000)).broadcast(2, max_lag=1)
+    assert list(zip(a, b)) == [(i, i) for i in range(1000)]
+
+
+def test_xiter_broadcast_too_far_ahead() -> None:
+    a, b = Xiter(range(10)).broadcast(2, max_lag=3)
+    assert [next(a), next(a), next(a)] == [0, 1, 2]
+    with pytest.raises(BufferError):
+        next(a)
+    assert next(b) == 0
+    assert next(a) == 3
+
+
+def test_xiter_broadcast_closed_consumer_is_not_waited() -> None:
+    a, b = Xiter(range(10)).broadcast(2, max_lag=2)
+    it_b = iter(b)
+    next(it_b)
+    cast(Any, it_b).close()
+    assert a.to_Xlist() == Xlist(range(10))
+
+
+def test_xiter_broadcast_threaded_blocks() -> None:
+    a, b = Xiter(range(100)).broadcast(2, max_lag=2, threaded=True)
+    out_a: list[int] = []
+    consumer = threading.Thread(target=lambda: out_a.extend(a))
+    consumer.start()
+    consumer.join(timeout=0.1)
+    assert consumer.is_alive()
+    assert len(out_a) == 0 or out_a == [0, 1][: len(out_a)]
+    out_b = list(b)
+    consumer.join()
+    assert out_a == out_b == list(range(100))
+
+
+def test_xiter_broadcast_chained_consumers_stay_bounded() -> None:
+    a, b = Xiter(range(10)).broadcast(2, max_lag=2)
+    mapped = a.map(lambda x: x * 10)
+    assert list(zip(mapped, b)) == [(i * 10, i) for i in range(10)]
+    with pytest.raises(BufferError):
+        next(a)  # its elements were released once handed over to mapped
+
+
+def test_xiter_drive_all_chained_sinks_memory_bound() -> None:
+    def peak(sink: Callable[[Xiter[int]], int]) -> int:
+        tracemalloc.start()
+        try:
+            Xiter(range(300_000)).drive_all(sink, sink, max_lag=100)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    # a tee buffer over the whole stream would weigh megabytes
+    assert peak(lambda xi: xi.map(lambda x: x + 1).fold(0, operator.add)) < 1_000_000
+
+
+def test_xiter_broadcast_invalid() -> None:
+    with pytest.raises(ValueError):
+        Xiter(range(3)).broadcast(0)
+    with pytest.raises(ValueError):
+        Xiter(range(3)).broadcast(2, max_lag=0)
+
+
+def test_xiter_drive_all() -> None:
+    pulled = 0
+
+    def source() -> Iterator[int]:
+        nonlocal pulled
+        for i in range(10_000):
+            pulled += 1
+            yield i
+
+    total, count, first = Xiter(source()).drive_all(
+        lambda xi: xi.fold(0, lambda acc, el: acc + el),
+        lambda xi: xi.fold(0, lambda acc, _: acc + 1),
+        lambda xi: xi.head(),
+        max_lag=10,
+    )
+    assert (total, count, first) == (sum(range(10_000)), 10_000, 0)
+    assert pulled == 10_000
+
+
+def test_xiter_drive_all_raises() -> None:
+    def fail(xi: Xiter[int]) -> int:
+        raise KeyError("boom")
+
+    with pytest.raises(KeyError):
+        Xiter(range(100)).drive_all(lambda xi: xi.to_Xlist(), fail, max_lag=1)
+    assert Xiter(range(3)).drive_all() == Xlist([])
+
+
+def test_xiter_terminal_operations_single_pass() -> None:
+    pulled = 0
+
+    def source() -> Xiter[int]:
+        def gen() -> Iterator[int]:
+            nonlocal pulled
+            for i in [4, 3, -1, 2]:
+                pulled += 1
+                yield i
+
+        return Xiter(gen())
+
+    assert source().reduce(lambda x, y: x + y) == 8
+    assert source().fold_left(0, lambda x, y: x + y) == 8
+    assert source().min() == -1
+    assert source().max() == 4
+    assert pulled == 16
+
+
+def test_xiter_min_max_without_key_compare_elements() -> None:
+    words = ["bd", "ae", "cc"]
+    assert Xiter(words).min() == "ae"
+    assert Xiter(words).max() == "cc"
+    assert Xiter(words).min(lambda x: x[-1]) == "cc"
+    assert Xiter(words).max(lambda x: x[-1]) == "ae"
+
+
+def test_xiter_foreach() -> None:
+    out: list[int] = []
+    input = Xiter(range(3))
+    input.copy().foreach(out.append)
+    input.foreach(out.append)
+    input.foreach(out.append)
+    assert out == [0, 1, 2, 0, 1, 2]
+
+
+def test_xiter_foreach_should_not_buffer() -> None:
+    tracemalloc.start()
+    try:
+        Xiter(x for x in range(300_000)).foreach(lambda _: None)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # a tee buffer over the whole stream would weigh megabytes
+    assert peak < 1_000_000
+
+
+def counted_source(n: int) -> tuple[Xiter[int], list[int]]:
+    pulled: list[int] = []
+
+    def gen() -> Iterator[int]:
+        for i in range(n):
+            pulled.append(i)
+            yield i
+
+    return Xiter(gen()), pulled
+
+
+def test_xiter_cache() -> None:
+    source, pulled = counted_source(5)
+    cached = source.map(lambda x: x * 2).cache()
+    assert cached.to_Xlist() == Xlist([0, 2, 4, 6, 8])
+    assert cached.copy().fold(0, lambda x, y: x + y) == 20
+    cached.copy().foreach(lambda _: None)
+    assert list(cached) == [0, 2, 4, 6, 8]
+    assert pulled == [0, 1, 2, 3, 4]
+
+
+def test_xiter_cache_interleaved_copies() -> None:
+    source, pulled = counted_source(4)
+    cached = source.cache()
+    copy = cached.copy()
+    assert next(copy) == 0
+    assert next(copy) == 1
+    assert next(cached) == 0
+    assert list(copy) == [2, 3]
+    assert list(cached) == [1, 2, 3]
+    assert pulled == [0, 1, 2, 3]
+
+
+def test_xiter_cache_max_items() -> None:
+    assert Xiter(range(3)).cache(max_items=3).to_Xlist() == Xlist(range(3))
+    with pytest.raises(BufferError):
+        Xiter(range(4)).cache(max_items=3).to_Xlist()
+    with pytest.raises(ValueError):
+        Xiter(range(4)).cache(max_items=-1)
+
+
+def test_xiter_cache_max_items_should_keep_raising() -> None:
+    source, pulled = counted_source(5)
+    cached = source.cache(max_items=3)
+    for _ in range(3):
+        copy, out = cached.copy(), []
+        with pytest.raises(BufferError):
+            for el in copy:
+                out.append(el)
+        assert out == [0, 1, 2]
+    with pytest.raises(BufferError):
+        list(cached)
+    assert pulled == [0, 1, 2, 3]  # the source is not pulled further after the overflow
+    assert Xiter(x for x in range(3)).cache(max_items=3).to_Xlist() == Xlist(range(3))
+
+
+def test_xiter_cache_infinite() -> None:
+    cached = Xiter(itertools.count()).cache()
+    assert cached.take(3).to_Xlist() == Xlist([0, 1, 2])
+    assert cached.take(5).to_Xlist() == Xlist([0, 1, 2, 3, 4])
+
+
+def test_xiter_persist(tmp_path: Path) -> None:
+    path = tmp_path / "persisted.pickle"
+    source, pulled = counted_source(1000)
+    persisted = source.map(lambda x: (x, str(x))).persist(path)
+    assert not path.exists()
+    expected = Xlist([(i, str(i)) for i in range(1000)])
+    assert persisted.take(10).to_Xlist() == Xlist([(i, str(i)) for i in range(10)])
+    assert persisted.to_Xlist() == expected
+    assert persisted.to_Xlist() == expected
+    assert pulled == list(range(1000))
+    assert path.stat().st_size > 0
+
+
+def test_xiter_persist_interleaved_copies(tmp_path: Path) -> None:
+    persisted = Xiter(range(5)).persist(tmp_path / "persisted.pickle")
+    copy = persisted.copy()
+    assert next(persisted) == 0
+    assert next(persisted) == 1
+    assert next(copy) == 0
+    assert next(persisted) == 2
+    assert list(copy) == [1, 2, 3, 4]
+    assert list(persisted) == [3, 4]
+
+
+def test_xiter_known_length() -> None:
+    assert Xiter([1, 2, 3]).known_length() == Xopt.Some(3)
+    assert Xiter(range(10)).map(str).known_length() == Xopt.Some(10)
+    assert Xiter("abc").zip(range(10)).known_length() == Xopt.Some(3)
+    assert Xiter({"a": 1}).known_length() == Xopt.Some(1)
+    assert Xiter((1,)).take(5).known_length() == Xopt.Some(1)
+    assert Xiter(range(10)).filter(lambda x: x > 5).known_length() == Xopt.Empty
+    assert Xiter(x for x in range(3)).known_length() == Xopt.Empty
+    assert Xiter(range(3)).zip(x for x in range(3)).known_length() == Xopt.Empty
+
+
+def test_xiter_known_length_follows_consumption() -> None:
+    input = Xiter(range(5))
+    mapped = input.map(lambda x: x * 2)
+    next(input)
+    assert input.known_length() == Xopt.Some(4)
+    assert mapped.known_length() == Xopt.Some(5)
+    next(mapped)
+    next(mapped)
+    assert mapped.known_length() == Xopt.Some(3)
+    assert operator.length_hint(mapped) == 3
+    assert mapped.to_Xlist() == Xlist([4, 6, 8])
+
+
+def test_xiter_known_length_through_chains() -> None:
+    assert Xiter(range(10)).map(str).take(3).known_length() == Xopt.Some(3)
+    assert Xiter(range(10)).map(str).map(len).known_length() == Xopt.Some(10)
+    assert Xiter(range(10)).take(3).take(2).known_length() == Xopt.Some(2)
+    assert Xiter(range(10)).map(str).zip("abc").known_length() == Xopt.Some(3)
+    assert Xiter("abcd").zip(Xiter(range(10)).map(str)).known_length() == Xopt.Some(4)
+
+
+@given(
+    st.integers(0, 20),
+    st.lists(
+        st.tuples(st.sampled_from(["map", "take", "slice", "zip"]), st.integers(0, 3)),
+        max_size=6,
+    ),
+)
+def test_xiter_known_length_follows_consumption_of_chains(
+    size: int, operations: list[tuple[str, int]]
+) -> None:
+    chain: list[Xiter[Any]] = [Xiter(range(size))]
+    for operation, n in operations:
+        last = chain[-1]
+        match operation:
+            case "map":
+                chain.append(last.map(lambda x: x))
+            case "take":
+                chain.append(last.take(n + 5))
+            case "slice":
+                chain.append(last.slice(n, None, 2))
+            case _:
+                chain.append(last.zip(range(n + 10)))
+        for _ in range(n):  # advance the receiver and its copy differently
+            next(last, None)
+    for xi in reversed(chain):
+        expected = xi.known_length()
+        assert expected == Xopt.Some(len(list(xi)))
+
+
+@given(
+    st.integers(0, 30),
+    st.one_of(st.none(), st.integers(0, 40)),
+    st.one_of(st.none(), st.integers(0, 40)),
+    st.one_of(st.none(), st.integers(1, 5)),
+)
+def test_xiter_slice_known_length(
+    size: int, start: int | None, stop: int | None, step: int | None
+) -> None:
+    sliced = Xiter(range(size)).slice(start, stop, step)
+    expected = list(range(size))[start:stop:step]
+    for i in range(len(expected) + 1):
+        assert sliced.known_length() == Xopt.Some(len(expected) - i)
+        next(sliced, None)
+
+
+def test_xiter_copy_of_sized_source_does_not_tee() -> None:
+    input = Xiter([1, 2, 3])
+    copied = input.copy()
+    assert not isinstance(iter(copied), type(itertools.tee([])[0]))
+    assert copied.to_Xlist() == Xlist([1, 2, 3])
+    assert input.known_length() == Xopt.Some(3)
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Never
 from xfp import XRBranch, Xlist, Xeither
 import pytest
@@ -242,3 +243,50 @@ def test_xlist_zip() -> None:
     in2 = Xlist([4, 5])
     assert in1.zip(in2) == Xlist([(1, 4), (2, 5)])
     assert in2.zip(in1) == in1.zip(in2).map(tupled2(lambda x, y: (y, x)))
+
+
+def test_xlist_scan_left() -> None:
+    input = Xlist(["b", "c"])
+    assert input.scan_left("a", lambda acc, el: acc + el) == Xlist(["a", "ab", "abc"])
+    assert Xlist[str]([]).scan_left("a", lambda acc, el: acc + el) == Xlist(["a"])
+
+
+def test_xlist_accumulate() -> None:
+    input = Xlist([4, 3, -1, 2])
+    assert input.accumulate(lambda x, y: x + y) == Xlist([4, 7, 6, 8])
+    assert Xlist[int]([]).accumulate(lambda x, y: x + y) == Xlist([])
+
+
+def test_xlist_builder() -> None:
+    with Xlist.builder() as builder:
+        builder.append(1)
+        builder.extend([2, 3])
+        builder[0] = 0
+    assert builder.freeze() == Xlist([0, 2, 3])
+    assert builder.freeze() is builder.freeze()
+
+
+def test_xlist_transient_should_not_alter_the_original() -> None:
+    input = Xlist([1, 2])
+    transient = input.transient()
+    transient[0] = 10
+    transient.append(3)
+    assert len(transient) == 3 and transient[0] == 10
+    assert transient.freeze() == Xlist([10, 2, 3])
+    assert input == Xlist([1, 2])
+
+
+def test_xlist_transient_should_not_be_mutated_once_frozen() -> None:
+    with Xlist([1]).transient() as transient:
+        transient.append(2)
+    with pytest.raises(RuntimeError):
+        transient.append(3)
+    assert transient.freeze() == Xlist([1, 2])
+
+
+def test_xlist_transient_should_not_be_mutated_by_another_thread() -> None:
+    transient = Xlist([1]).transient()
+    with ThreadPoolExecutor(1) as executor:
+        error = executor.submit(transient.append, 2).exception()
+    assert isinstance(error, RuntimeError)
+    assert transient.freeze() == Xlist([1])